@@ -6,16 +6,19 @@ import os
 import site
 import sys
 import typing
+from pathlib import Path
+
+import mobase
 
 from .basic_game import BasicGame
-from .basic_game_ini import BasicIniGame
+from .basic_game_ini import ini_game_class, read_ini_game
+from .basic_game_lazy import lazy_game_class
+from .file_cache import FileCache
+from .plugin_index import INDEX_VERSION, build_index
 
 site.addsitedir(os.path.join(os.path.dirname(__file__), "lib"))
 
 
-BasicGame.setup()
-
-
 def createPlugins():
     # List of game class from python:
     game_plugins: typing.List[BasicGame] = []
@@ -24,9 +27,23 @@ def createPlugins():
     curpath = os.path.abspath(os.path.dirname(__file__))
     escaped_games_path = glob.escape(os.path.join(curpath, "games"))
 
+    # The ini files and the index of the python plugins are cached between runs:
+    cache = FileCache(
+        Path(mobase.IOrganizer.getPluginDataPath(), "basic_games", "plugins.json"),
+        INDEX_VERSION,
+    )
+
     # List all the .ini files:
+    ini_cache = cache.section("ini")
     for file in glob.glob(os.path.join(escaped_games_path, "*.ini")):
-        game_plugins.append(BasicIniGame(file))
+        game_plugins.append(
+            ini_game_class(file, ini_cache.lookup(Path(file), read_ini_game))()
+        )
+    ini_cache.commit()
+
+    # Index the python plugins, so that their modules are only imported when needed:
+    index = build_index(Path(curpath, "games"), cache.section("games"))
+    cache.flush()
 
     # List all the python plugins:
     for file in glob.glob(os.path.join(escaped_games_path, "*.py")):
@@ -34,6 +51,21 @@ def createPlugins():
         if module_p == "__init__.py":
             continue
 
+        # Create proxies for the indexed plugins:
+        entries = index.get(module_p)
+        if entries is not None:
+            for entry in entries:
+                try:
+                    game_plugins.append(
+                        lazy_game_class(".games." + module_p[:-3], __package__, entry)()
+                    )
+                except Exception as e:
+                    print(
+                        "Failed to instantiate {}: {}".format(entry["class"], e),
+                        file=sys.stderr,
+                    )
+            continue
+
         # Import the module:
         try:
             module = importlib.import_module(".games." + module_p[:-3], __package__)
@@ -59,4 +91,8 @@ def createPlugins():
                             file=sys.stderr,
                         )
 
+    # Start the discovery of installed games, only looking for the Steam games
+    # handled by the plugins, which are then detected together:
+    BasicGame.setup(game_plugins)
+
     return game_plugins
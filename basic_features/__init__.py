@@ -1,10 +1,25 @@
 from .basic_local_savegames import BasicLocalSavegames
 from .basic_mod_data_checker import BasicModDataChecker, GlobPatterns
 from .basic_save_game_info import BasicGameSaveGameInfo
+from .check_cache import cached_check
+from .fix_plan import FixPlan
+from .path_tree import PathTree
+from .save_metadata_cache import cached_save_metadata
+from .save_scan import iter_save_pages, iter_saves, newest_saves, scan_saves
+from .tree_summary import ModTreeSummary
 
 __all__ = [
     "BasicModDataChecker",
     "BasicGameSaveGameInfo",
+    "FixPlan",
+    "ModTreeSummary",
+    "PathTree",
     "GlobPatterns",
     "BasicLocalSavegames",
+    "cached_check",
+    "cached_save_metadata",
+    "iter_save_pages",
+    "iter_saves",
+    "newest_saves",
+    "scan_saves",
 ]
@@ -1,127 +1,43 @@
 from __future__ import annotations
 
-import fnmatch
-import re
-from dataclasses import dataclass, field
-from typing import Iterable, Literal
-
 import mobase
 
+from .check_cache import cached_check
+from .fix_plan import FixPlan
+from .glob_patterns import (
+    GlobPatterns,
+    OptionalRegexPattern,
+    PathState,
+    PatternMatch,
+    RegexPatterns,
+    compile_patterns,
+)
 from .utils import is_directory
 
-
-class OptionalRegexPattern:
-    _pattern: re.Pattern[str] | None
-
-    def __init__(self, globs: Iterable[str] | None) -> None:
-        if globs is None:
-            self._pattern = None
-        else:
-            self._pattern = OptionalRegexPattern.regex_from_glob_list(globs)
-
-    @staticmethod
-    def regex_from_glob_list(glob_list: Iterable[str]) -> re.Pattern[str]:
-        """
-        Returns a regex pattern form a list of glob patterns.
-
-        Every pattern has a capturing group, so that `match.lastindex - 1` will
-        give the `glob_list` index.
-        """
-        return re.compile(
-            "|".join(f"({fnmatch.translate(f)})" for f in glob_list), re.I
-        )
-
-    def match(self, value: str) -> bool:
-        if self._pattern is None:
-            return False
-        return bool(self._pattern.match(value))
-
-
-class RegexPatterns:
-    """
-    Regex patterns for validation in `BasicModDataChecker`.
-    """
-
-    def __init__(self, globs: GlobPatterns) -> None:
-        self.unfold = OptionalRegexPattern(globs.unfold)
-        self.delete = OptionalRegexPattern(globs.delete)
-        self.valid = OptionalRegexPattern(globs.valid)
-
-        self.move = {
-            key: re.compile(fnmatch.translate(key), re.I) for key in globs.move
-        }
-
-    def move_match(self, value: str) -> str | None:
-        """
-        Retrieve the first move patterns that matches the given value, or None if no
-        move matches.
-        """
-        for key, pattern in self.move.items():
-            if pattern.match(value):
-                return key
-        return None
-
-
-def _merge_list(l1: list[str] | None, l2: list[str] | None) -> list[str] | None:
-    if l1 is None and l2 is None:
-        return None
-
-    return (l1 or []) + (l2 or [])
-
-
-@dataclass(frozen=True, unsafe_hash=True)
-class GlobPatterns:
-    """
-    See: `BasicModDataChecker`
-    """
-
-    unfold: list[str] | None = None
-    valid: list[str] | None = None
-    delete: list[str] | None = None
-    move: dict[str, str] = field(default_factory=dict)
-
-    def merge(
-        self, other: GlobPatterns, mode: Literal["merge", "replace"] = "replace"
-    ) -> GlobPatterns:
-        """
-        Construct a new GlobPatterns by merging the current one with the given one.
-
-        There are two different modes:
-          - 'merge': In this mode, unfold/valid/delete are concatenated and move
-            will contain the union of key from self and other, with values from other
-            overriding common keys.
-          - 'replace': The merged object will contains attributes from other, except
-            for None attributes taken from self.
-
-        Args:
-            other: Other patterns to "merge" with this one.
-            mode: Merge mode.
-
-        Returns:
-            A new glob pattern representing the merge of this one with other.
-        """
-        if mode == "merge":
-            return GlobPatterns(
-                unfold=_merge_list(self.unfold, other.unfold),
-                valid=_merge_list(self.valid, other.valid),
-                delete=_merge_list(self.delete, other.delete),
-                move=self.move | other.move,
-            )
-        else:
-            return GlobPatterns(
-                unfold=other.unfold or self.unfold,
-                valid=other.valid or self.valid,
-                delete=other.delete or self.delete,
-                move=other.move or self.move,
-            )
+__all__ = [
+    "BasicModDataChecker",
+    "FixPlan",
+    "GlobPatterns",
+    "OptionalRegexPattern",
+    "RegexPatterns",
+]
 
 
 class BasicModDataChecker(mobase.ModDataChecker):
     """Game feature that is used to check and fix the content of a data tree
     via simple file definitions.
 
-    The file definitions support glob pattern (without subfolders) and are
-    checked and fixed in definition order of the `file_patterns` dict.
+    The file definitions support glob patterns and are checked and fixed in
+    definition order of the `file_patterns` dict.
+
+    Patterns with subfolders (e.g., `"data/maps/*.map"` or `"data/textures/**"`,
+    where `**` matches any number of folders) apply to nested entries: folders that
+    no pattern matches are only explored while a path pattern can still match their
+    content. Patterns without subfolders take precedence for top-level entries, and
+    `unfold` patterns cannot have subfolders.
+
+    Entries that match no pattern are checked by `check_unmatched()`, which rejects
+    them, and are left as they are by the fix.
 
     Args:
         file_patterns (optional): A GlobPatterns object, with the following attributes:
@@ -138,14 +54,16 @@ class BasicModDataChecker(mobase.ModDataChecker):
 
             move: {"Files/folders to move": "target path"}
                 # If the path ends with `/` or `\\`, the entry will be inserted
-                # in the corresponding directory instead of replacing it.
+                # in the corresponding directory instead of replacing it. The
+                # target path is relative to the root of the mod, also for
+                # entries matched by a pattern with subfolders.
                 # Check result: `mobase.ModDataChecker.FIXABLE`.
 
     Example:
 
         BasicModDataChecker(
             GlobPatterns(
-                valid=["valid_folder", "*.ext1"]
+                valid=["valid_folder", "*.ext1", "other_folder/**/*.ext3"]
                 move={"*.ext2": "path/to/target_folder/"}
             )
         )
@@ -164,53 +82,166 @@ class BasicModDataChecker(mobase.ModDataChecker):
         super().__init__()
 
         self._file_patterns = file_patterns or GlobPatterns()
-        self._regex_patterns = RegexPatterns(self._file_patterns)
+        self._regex_patterns = compile_patterns(self._file_patterns)
 
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
+        # folders to unfold and folders matched by path patterns are checked
+        # recursively, so only the other checks depend on the top-level entries
+        # alone:
+        if self._file_patterns.unfold or self._regex_patterns.paths:
+            return self._check(filetree)
+        return self._check_top_level(filetree)
+
+    @cached_check()
+    def _check_top_level(
+        self, filetree: mobase.IFileTree
+    ) -> mobase.ModDataChecker.CheckReturn:
+        return self._check(filetree)
+
+    def _check(self, filetree: mobase.IFileTree) -> mobase.ModDataChecker.CheckReturn:
         status = mobase.ModDataChecker.INVALID
 
         rp = self._regex_patterns
         for entry in filetree:
-            name = entry.name().casefold()
-
-            if rp.unfold.match(name):
+            match = rp.match(entry.name())
+
+            if match is None and rp.paths:
+                state, match = rp.paths.step(rp.paths.root, entry.name())
+                if match is None and state and is_directory(entry):
+                    child_status = self._check_paths(entry, state)
+                    if child_status is mobase.ModDataChecker.INVALID:
+                        status = child_status
+                        break
+                    elif child_status is mobase.ModDataChecker.FIXABLE:
+                        status = child_status
+                    elif status is mobase.ModDataChecker.INVALID:
+                        status = mobase.ModDataChecker.VALID
+                    continue
+
+            category = None if match is None else match[0]
+
+            if category == "unfold":
                 if is_directory(entry):
                     status = self.dataLooksValid(entry)
                 else:
                     status = mobase.ModDataChecker.INVALID
                     break
-            elif rp.valid.match(name):
+            elif category == "valid":
                 if status is mobase.ModDataChecker.INVALID:
                     status = mobase.ModDataChecker.VALID
-            elif rp.delete.match(name) or rp.move_match(name) is not None:
+            elif category is not None:
                 status = mobase.ModDataChecker.FIXABLE
             else:
-                status = mobase.ModDataChecker.INVALID
-                break
+                unmatched_status = self.check_unmatched(entry)
+                if unmatched_status is mobase.ModDataChecker.INVALID:
+                    status = unmatched_status
+                    break
+                elif unmatched_status is mobase.ModDataChecker.FIXABLE:
+                    status = unmatched_status
+                elif status is mobase.ModDataChecker.INVALID:
+                    status = mobase.ModDataChecker.VALID
         return status
 
+    def _check_paths(
+        self, filetree: mobase.IFileTree, state: PathState
+    ) -> mobase.ModDataChecker.CheckReturn:
+        # check the content of a folder against the path patterns, only recursing
+        # into subfolders that a pattern can still match
+        paths = self._regex_patterns.paths
+
+        status = mobase.ModDataChecker.VALID
+        for entry in filetree:
+            next_state, match = paths.step(state, entry.name())
+            if match is not None:
+                if match[0] != "valid":
+                    status = mobase.ModDataChecker.FIXABLE
+            elif next_state and is_directory(entry):
+                child_status = self._check_paths(entry, next_state)
+                if child_status is mobase.ModDataChecker.INVALID:
+                    return child_status
+                elif child_status is mobase.ModDataChecker.FIXABLE:
+                    status = child_status
+            else:
+                unmatched_status = self.check_unmatched(entry)
+                if unmatched_status is mobase.ModDataChecker.INVALID:
+                    return unmatched_status
+                elif unmatched_status is mobase.ModDataChecker.FIXABLE:
+                    status = unmatched_status
+        return status
+
+    def check_unmatched(
+        self, entry: mobase.FileTreeEntry
+    ) -> mobase.ModDataChecker.CheckReturn:
+        """
+        Check an entry that matches no pattern, a top-level entry or an entry
+        explored through the path patterns.
+
+        Args:
+            entry: Entry to check.
+
+        Returns:
+            The status of the entry, `INVALID` by default. Entries that are not
+            `INVALID` are left as they are by the fix.
+        """
+        return mobase.ModDataChecker.INVALID
+
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
+        return self.plan_fix(filetree).apply(filetree)
+
+    def plan_fix(self, filetree: mobase.IFileTree) -> FixPlan:
+        """
+        Plan the fix of the given tree, without modifying it.
+
+        Args:
+            filetree: Tree to fix.
+
+        Returns:
+            The operations fixing the tree, see `FixPlan.describe()` for a dry run.
+        """
+        plan = FixPlan()
+
         rp = self._regex_patterns
-        for entry in list(filetree):
-            name = entry.name()
+        for entry in filetree:
+            match = rp.match(entry.name())
 
-            # unfold first - if this match, entry is a directory (checked in
-            # dataLooksValid)
-            if rp.unfold.match(name):
-                assert is_directory(entry)
-                filetree.merge(entry)
-                entry.detach()
+            if match is None and rp.paths:
+                state, match = rp.paths.step(rp.paths.root, entry.name())
+                if match is None and state and is_directory(entry):
+                    self._plan_paths(plan, entry, state)
+                    continue
 
-            elif rp.valid.match(name):
+            if match is None:
                 continue
 
-            elif rp.delete.match(name):
-                entry.detach()
+            # unfold first - if this match, entry is a directory (checked in
+            # dataLooksValid)
+            if match[0] == "unfold":
+                assert is_directory(entry)
+                plan.unfold(entry)
+            else:
+                self._plan_entry(plan, entry, match)
 
-            elif (move_key := rp.move_match(name)) is not None:
-                target = self._file_patterns.move[move_key]
-                filetree.move(entry, target)
+        return plan
 
-        return filetree
+    def _plan_paths(
+        self, plan: FixPlan, filetree: mobase.IFileTree, state: PathState
+    ) -> None:
+        paths = self._regex_patterns.paths
+        for entry in filetree:
+            next_state, match = paths.step(state, entry.name())
+            if match is not None:
+                self._plan_entry(plan, entry, match)
+            elif next_state and is_directory(entry):
+                self._plan_paths(plan, entry, next_state)
+
+    def _plan_entry(
+        self, plan: FixPlan, entry: mobase.FileTreeEntry, match: PatternMatch
+    ) -> None:
+        # move targets are relative to the root of the mod, wherever the entry is
+        category, move_key = match
+        if category == "delete":
+            plan.delete(entry)
+        elif category == "move" and move_key is not None:
+            plan.move(entry, self._file_patterns.move[move_key])
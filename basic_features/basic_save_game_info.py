@@ -1,7 +1,10 @@
 # -*- encoding: utf-8 -*-
 
+import os
 import sys
+from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Self, Sequence
@@ -29,9 +32,16 @@ def format_date(date_time: QDateTime | datetime | str, format_str: str | None =
 
 
 class BasicGameSaveGame(mobase.ISaveGame):
-    def __init__(self, filepath: Path):
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        """
+        Args:
+            filepath: Path to the save.
+            stat (optional): `stat()` result of the save, e.g., from `scan_saves`,
+                to avoid querying it again.
+        """
         super().__init__()
         self._filepath = filepath
+        self._stat = stat
 
     def getFilepath(self) -> str:
         return self._filepath.as_posix()
@@ -40,7 +50,8 @@ class BasicGameSaveGame(mobase.ISaveGame):
         return self._filepath.name
 
     def getCreationTime(self):
-        return QDateTime.fromSecsSinceEpoch(int(self._filepath.stat().st_mtime))
+        stat = self._stat or self._filepath.stat()
+        return QDateTime.fromSecsSinceEpoch(int(stat.st_mtime))
 
     def getSaveGroupIdentifier(self) -> str:
         return ""
@@ -49,6 +60,88 @@ class BasicGameSaveGame(mobase.ISaveGame):
         return [self.getFilepath()]
 
 
+class _LazySaveGameMeta(ABCMeta, type(mobase.ISaveGame)):
+    """Metaclass of `LazyBasicGameSaveGame`, an `ABCMeta` for the mobase classes."""
+
+
+class LazyBasicGameSaveGame(BasicGameSaveGame, ABC, metaclass=_LazySaveGameMeta):
+    """
+    Save game whose content is only parsed when it is first needed (to display its
+    name, metadata, ...), so that listing the saves only lists and `stat()` the
+    files.
+
+    Subclasses implement `parse()` and read the parsed fields from `metadata`.
+    """
+
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        super().__init__(filepath, stat)
+        self._metadata: dict[str, Any] | None = None
+
+    @abstractmethod
+    def parse(self) -> dict[str, Any]:
+        """
+        Parse the save, called on the first access to `metadata`.
+
+        Returns:
+            The fields of the save.
+        """
+        ...
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """
+        The fields of the save, parsed on first access, or an empty dict if the
+        save could not be parsed.
+        """
+        if self._metadata is None:
+            try:
+                self._metadata = self.parse()
+            except Exception as e:
+                print(f"Failed to parse save {self._filepath}: {e}", file=sys.stderr)
+                self._metadata = {}
+        return self._metadata
+
+    @property
+    def is_parsed(self) -> bool:
+        """Whether the save was already parsed, see `metadata`."""
+        return self._metadata is not None
+
+
+def _parse_lazy_save(save: LazyBasicGameSaveGame) -> dict[str, Any]:
+    return save.metadata
+
+
+def parse_lazy_saves(saves: Sequence[mobase.ISaveGame], max_workers: int) -> None:
+    """
+    Parse the lazy saves (see `LazyBasicGameSaveGame`) of a listing ahead of time,
+    with a pool of threads, since reading, decompressing and hashing the saves
+    mostly release the GIL.
+
+    The saves are parsed in place, so the order of the listing is kept.
+
+    Args:
+        saves: Saves to parse, saves that are not lazy or already parsed are
+            skipped.
+        max_workers: Maximum number of threads, the saves are not parsed (until
+            they are displayed) if 0.
+    """
+    lazy_saves = [
+        save
+        for save in saves
+        if isinstance(save, LazyBasicGameSaveGame) and not save.is_parsed
+    ]
+    if max_workers <= 0 or not lazy_saves:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(lazy_saves)),
+        thread_name_prefix="parse_lazy_saves",
+    ) as executor:
+        # the metadata are kept by the saves:
+        for _ in executor.map(_parse_lazy_save, lazy_saves):
+            pass
+
+
 def get_filedate_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     """Returns saves file date as the metadata for `BasicGameSaveGameInfoWidget`."""
     return {"File Date:": format_date(save.getCreationTime())}
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Concatenate, ParamSpec, TypeVar, cast
+
+import mobase
+
+from .utils import is_directory
+
+__all__ = ["CHECK_CACHE_SIZE", "cached_check", "tree_fingerprint"]
+
+# Number of results kept by each cached check of each checker:
+CHECK_CACHE_SIZE = 64
+
+_Checker = TypeVar("_Checker", bound=mobase.ModDataChecker)
+_P = ParamSpec("_P")
+_Check = Callable[Concatenate[_Checker, _P], mobase.ModDataChecker.CheckReturn]
+
+
+def tree_fingerprint(tree: mobase.IFileTree, depth: int | None = None) -> bytes:
+    """
+    Compute a fingerprint of the structure of a file tree, from the names, types
+    (file or directory) and number of children of its entries.
+
+    Args:
+        tree: Tree to fingerprint.
+        depth: Number of levels of the tree to include, the whole tree if None. The
+            number of children of the directories of the last level is included.
+
+    Returns:
+        The fingerprint of the tree.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    stack: list[tuple[mobase.IFileTree, int]] = [(tree, 1)]
+    while stack:
+        current, level = stack.pop()
+        digest.update(b"%d\0" % len(current))
+        for entry in current:
+            digest.update(entry.name().encode("utf-8", "surrogatepass"))
+            if not is_directory(entry):
+                digest.update(b"\0f\0")
+            elif depth is None or level < depth:
+                digest.update(b"\0d\0")
+                stack.append((entry, level + 1))
+            else:
+                digest.update(b"\0d%d\0" % len(entry))
+    return digest.digest()
+
+
+def cached_check(
+    depth: int | None = 1, size: int = CHECK_CACHE_SIZE
+) -> Callable[[_Check[_Checker, _P]], _Check[_Checker, _P]]:
+    """
+    Cache the results of the `dataLooksValid()` method of a mod data checker.
+
+    MO2 checks the same tree many times (when installing a mod, after each change in
+    the installation dialog, ...). The results are cached for each checker instance
+    in a bounded LRU cache, keyed by the fingerprint of the tree (see
+    `tree_fingerprint`), so the decorated method must only depend on the structure
+    of the given tree down to `depth`, and on the state of the checker at
+    construction. Checks that look at the parents of the tree, or deeper than
+    `depth`, must not be cached.
+
+    Args:
+        depth: Number of levels of the tree the check looks at, 1 for checks that
+            only look at the top-level entries, or None if the check can look at the
+            whole tree.
+        size: Maximum number of results cached for each checker.
+
+    Example:
+
+        class MyModDataChecker(mobase.ModDataChecker):
+            @cached_check()
+            def dataLooksValid(self, filetree: mobase.IFileTree):
+                ...
+    """
+
+    def decorator(check: _Check[_Checker, _P]) -> _Check[_Checker, _P]:
+        @functools.wraps(check)
+        def wrapper(
+            self: _Checker, /, *args: _P.args, **kwargs: _P.kwargs
+        ) -> mobase.ModDataChecker.CheckReturn:
+            # the checked tree, given by position or by name:
+            filetree = cast(
+                mobase.IFileTree, args[0] if args else next(iter(kwargs.values()))
+            )
+            key = tree_fingerprint(filetree, depth)
+
+            # one cache per checker and decorated method, since an overridden check
+            # may be cached as well as the check of the parent class:
+            caches: dict[Any, OrderedDict[Any, Any]] = vars(self).setdefault(
+                "_check_caches", {}
+            )
+            cache = caches.setdefault(wrapper, OrderedDict())
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            result = check(self, *args, **kwargs)
+            cache[key] = result
+            if len(cache) > size:
+                cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import mobase
+
+__all__ = ["FixPlan"]
+
+
+def _directory_key(path: str) -> str:
+    return "/".join(
+        part.casefold() for part in path.replace("\\", "/").split("/") if part
+    )
+
+
+class FixPlan:
+    """Operations fixing a mod data tree, planned without modifying the tree.
+
+    A plan is built by the `fix()` of a mod data checker, by recording the entries to
+    unfold, delete and move, and then applied at once with `apply()`, or only
+    described with `describe()` (dry run).
+
+    Entries moved into a directory (target path ending with `/` or `\\`) are grouped
+    by target directory, so that each directory is created or looked up once, and
+    the entries are then inserted directly in it.
+
+    Example:
+
+        plan = FixPlan()
+        for entry in filetree:
+            if entry.suffix() == "dll":
+                plan.move(entry, "BepInEx/plugins/")
+        plan.apply(filetree)
+    """
+
+    def __init__(
+        self,
+        policy: mobase.IFileTree.InsertPolicy = mobase.IFileTree.FAIL_IF_EXISTS,
+    ):
+        """
+        Args:
+            policy: Policy for the moved entries conflicting with existing entries.
+        """
+        self._policy = policy
+        self._unfold: list[mobase.IFileTree] = []
+        self._delete: list[mobase.FileTreeEntry] = []
+
+        # Moves into a directory, by case-folded directory -> (target, entries):
+        self._move_into: dict[str, tuple[str, list[mobase.FileTreeEntry]]] = {}
+
+        # Moves to an exact path (renames):
+        self._move_to: list[tuple[mobase.FileTreeEntry, str]] = []
+
+    def __len__(self) -> int:
+        return (
+            len(self._unfold)
+            + len(self._delete)
+            + sum(len(entries) for _, entries in self._move_into.values())
+            + len(self._move_to)
+        )
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def unfold(self, entry: mobase.IFileTree) -> None:
+        """Plan to replace a directory by its content, in the root of the tree."""
+        self._unfold.append(entry)
+
+    def delete(self, entry: mobase.FileTreeEntry) -> None:
+        """Plan to remove an entry from the tree."""
+        self._delete.append(entry)
+
+    def move(self, entry: mobase.FileTreeEntry, target: str) -> None:
+        """
+        Plan to move an entry, see `mobase.IFileTree.move` for the target specs.
+
+        Args:
+            entry: Entry to move.
+            target: Target path, relative to the root of the tree. If it ends with
+                `/` or `\\`, the entry is moved into this directory.
+        """
+        if target.endswith(("/", "\\")):
+            key = _directory_key(target)
+            self._move_into.setdefault(key, (target, []))[1].append(entry)
+        else:
+            self._move_to.append((entry, target))
+
+    def describe(self) -> list[str]:
+        """
+        Returns:
+            A description of each planned operation, in the order they are applied.
+        """
+        lines: list[str] = []
+        lines.extend(f"unfold {entry.path('/')}" for entry in self._unfold)
+        lines.extend(f"delete {entry.path('/')}" for entry in self._delete)
+        for target, entries in self._move_into.values():
+            lines.extend(f"move {entry.path('/')} -> {target}" for entry in entries)
+        lines.extend(
+            f"move {entry.path('/')} -> {target}" for entry, target in self._move_to
+        )
+        return lines
+
+    def apply(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
+        """
+        Apply the planned operations: unfold, then delete, then move.
+
+        Args:
+            filetree: Root of the tree the plan was built for.
+
+        Returns:
+            The fixed tree.
+        """
+        for entry in self._unfold:
+            filetree.merge(entry)
+            entry.detach()
+
+        for entry in self._delete:
+            entry.detach()
+
+        for key, (target, entries) in self._move_into.items():
+            directory = filetree.addDirectory(target.strip("/\\")) if key else filetree
+            for entry in entries:
+                directory.insert(entry, self._policy)
+
+        for entry, target in self._move_to:
+            filetree.move(entry, target, self._policy)
+
+        return filetree
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import fnmatch
+import functools
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Literal
+
+
+class OptionalRegexPattern:
+    _pattern: re.Pattern[str] | None
+
+    def __init__(self, globs: Iterable[str] | None) -> None:
+        if globs is None:
+            self._pattern = None
+        else:
+            self._pattern = OptionalRegexPattern.regex_from_glob_list(globs)
+
+    @staticmethod
+    def regex_from_glob_list(glob_list: Iterable[str]) -> re.Pattern[str]:
+        """
+        Returns a regex pattern form a list of glob patterns.
+
+        Every pattern has a capturing group, so that `match.lastindex - 1` will
+        give the `glob_list` index.
+        """
+        return re.compile(
+            "|".join(f"({fnmatch.translate(f)})" for f in glob_list), re.I
+        )
+
+    def match(self, value: str) -> bool:
+        if self._pattern is None:
+            return False
+        return bool(self._pattern.match(value))
+
+
+# Categories of the patterns, in matching order:
+PatternCategory = Literal["unfold", "valid", "delete", "move"]
+
+# Result of a match, the category of the pattern and the key for move patterns:
+PatternMatch = tuple[PatternCategory, str | None]
+
+_WILDCARDS = frozenset("*?[")
+
+
+def _is_path(glob: str) -> bool:
+    return "/" in glob or "\\" in glob
+
+
+class _PathNode:
+    """Node of the segment trie of `PathPatterns`."""
+
+    __slots__ = ("literals", "wildcards", "recursive", "loop", "match")
+
+    def __init__(self, loop: bool = False):
+        # Children for literal segments (case-folded) and segments with wildcards:
+        self.literals: dict[str, _PathNode] = {}
+        self.wildcards: list[tuple[re.Pattern[str], _PathNode]] = []
+
+        # Child for a "**" segment, which is a loop node, i.e., a node that can
+        # consume any number of segments:
+        self.recursive: _PathNode | None = None
+        self.loop = loop
+
+        # Index and result of the first pattern ending at this node:
+        self.match: tuple[int, PatternMatch] | None = None
+
+    def has_children(self) -> bool:
+        return bool(self.loop or self.literals or self.wildcards or self.recursive)
+
+    def child(self, segment: str) -> _PathNode:
+        if segment == "**":
+            if self.recursive is None:
+                self.recursive = _PathNode(loop=True)
+            return self.recursive
+
+        if _WILDCARDS.isdisjoint(segment):
+            return self.literals.setdefault(segment.casefold(), _PathNode())
+
+        regex = fnmatch.translate(segment)
+        for pattern, node in self.wildcards:
+            if pattern.pattern == regex:
+                return node
+        node = _PathNode()
+        self.wildcards.append((re.compile(regex, re.I), node))
+        return node
+
+
+# State of a match in PathPatterns, the trie nodes reached so far:
+PathState = tuple[_PathNode, ...]
+
+
+def _closure(nodes: Iterable[_PathNode]) -> PathState:
+    # add the nodes reachable through "**" segments matching no segment:
+    state: dict[int, _PathNode] = {}
+    for node in nodes:
+        while node is not None and id(node) not in state:
+            state[id(node)] = node
+            node = node.recursive
+    return tuple(state.values())
+
+
+class PathPatterns:
+    """
+    Multi-segment glob patterns (e.g., `WillowGame/CookedPC/Maps/*.umap` or
+    `data/landscape/**`), compiled into a trie of path segments, where `**`
+    matches any number of segments.
+
+    A file tree is matched one level at a time with `step()`, starting from `root`,
+    so that subtrees that no pattern can match are never visited.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, PatternMatch]]):
+        """
+        Args:
+            patterns: Pairs of glob pattern and result, in priority order.
+        """
+        root = _PathNode()
+        for index, (glob, result) in enumerate(patterns):
+            node = root
+            for segment in re.split(r"[/\\]+", glob.strip("/\\")):
+                node = node.child(segment)
+            if node.match is None:
+                node.match = (index, result)
+
+        self.root: PathState = _closure([root])
+
+    def __bool__(self) -> bool:
+        return self.root[0].has_children()
+
+    def step(
+        self, state: PathState, name: str
+    ) -> tuple[PathState, PatternMatch | None]:
+        """
+        Match an entry against the patterns.
+
+        Args:
+            state: State of the parent of the entry, `root` for a top-level entry.
+            name: Name of the entry.
+
+        Returns:
+            The state for the children of the entry, empty if no pattern can match
+            them, and the result of the first pattern matching the entry, or None if
+            no pattern matches the entry.
+        """
+        key = name.casefold()
+        nodes: list[_PathNode] = []
+        for node in state:
+            if node.loop:
+                nodes.append(node)
+            if (child := node.literals.get(key)) is not None:
+                nodes.append(child)
+            for pattern, child in node.wildcards:
+                if pattern.match(name):
+                    nodes.append(child)
+
+        reached = _closure(nodes)
+        matches = [node.match for node in reached if node.match is not None]
+        return (
+            tuple(node for node in reached if node.has_children()),
+            min(matches, key=lambda m: m[0])[1] if matches else None,
+        )
+
+
+class RegexPatterns:
+    """
+    Regex patterns for validation in `BasicModDataChecker`.
+
+    The patterns with wildcards are compiled into a single regex, with a named group
+    per pattern, so that a single match gives both the category of the first
+    matching pattern (in `unfold`, `valid`, `delete`, `move` order) and the move
+    key. The result for literal patterns is resolved at construction, and looked up
+    in a case-folded dict before the regex.
+
+    Multi-segment patterns are compiled separately (see `paths`), and only apply to
+    entries that no single-name pattern matches.
+
+    The per-category patterns (`unfold`, `valid`, `delete` and `move`) are only
+    compiled on first access.
+    """
+
+    def __init__(self, globs: GlobPatterns) -> None:
+        self._globs = globs
+
+        if any(_is_path(glob) for glob in globs.unfold or []):
+            raise ValueError("Unfold patterns cannot contain subfolders.")
+
+        patterns: list[tuple[str, PatternMatch]] = [
+            *((glob, ("unfold", None)) for glob in globs.unfold or []),
+            *((glob, ("valid", None)) for glob in globs.valid or []),
+            *((glob, ("delete", None)) for glob in globs.delete or []),
+            *((glob, ("move", glob)) for glob in globs.move),
+        ]
+
+        # Multi-segment patterns, matched after the names:
+        self.paths = PathPatterns(
+            (glob, result) for glob, result in patterns if _is_path(glob)
+        )
+        patterns = [(glob, result) for glob, result in patterns if not _is_path(glob)]
+
+        # Combined regex of the patterns with wildcards, and result for each group:
+        self._groups: dict[str, PatternMatch] = {}
+        alternatives: list[str] = []
+        for glob, result in patterns:
+            if not _WILDCARDS.isdisjoint(glob):
+                group = f"p{len(alternatives)}"
+                alternatives.append(f"(?P<{group}>{fnmatch.translate(glob)})")
+                self._groups[group] = result
+        self._pattern = (
+            re.compile("|".join(alternatives), re.I) if alternatives else None
+        )
+
+        # Result for each literal pattern, a wildcard pattern preceding the literal one
+        # may take precedence:
+        self._literals: dict[str, PatternMatch] = {}
+        for glob, _ in patterns:
+            if _WILDCARDS.isdisjoint(glob):
+                self._literals.setdefault(
+                    glob.casefold(),
+                    next(
+                        result
+                        for other, result in patterns
+                        if re.match(fnmatch.translate(other), glob, re.I)
+                    ),
+                )
+
+    @functools.cached_property
+    def unfold(self) -> OptionalRegexPattern:
+        return OptionalRegexPattern(self._globs.unfold)
+
+    @functools.cached_property
+    def valid(self) -> OptionalRegexPattern:
+        return OptionalRegexPattern(self._globs.valid)
+
+    @functools.cached_property
+    def delete(self) -> OptionalRegexPattern:
+        return OptionalRegexPattern(self._globs.delete)
+
+    @functools.cached_property
+    def move(self) -> dict[str, re.Pattern[str]]:
+        return {
+            key: re.compile(fnmatch.translate(key), re.I) for key in self._globs.move
+        }
+
+    def match(self, value: str) -> PatternMatch | None:
+        """
+        Find the first pattern matching the given value.
+
+        Args:
+            value: Value to match, e.g., the name of a file tree entry.
+
+        Returns:
+            The category of the first matching pattern, with the key of the pattern
+            for `move` patterns (None otherwise), or None if no pattern matches.
+        """
+        if (result := self._literals.get(value.casefold())) is not None:
+            return result
+
+        if self._pattern is None or (m := self._pattern.match(value)) is None:
+            return None
+        return self._groups[m.lastgroup]  # type: ignore
+
+    def move_match(self, value: str) -> str | None:
+        """
+        Retrieve the first move patterns that matches the given value, or None if no
+        move matches.
+        """
+        for key, pattern in self.move.items():
+            if pattern.match(value):
+                return key
+        return None
+
+
+def _merge_list(l1: list[str] | None, l2: list[str] | None) -> list[str] | None:
+    if l1 is None and l2 is None:
+        return None
+
+    return (l1 or []) + (l2 or [])
+
+
+# Canonical (hashable) form of GlobPatterns, see GlobPatterns.key():
+GlobPatternsKey = tuple[
+    tuple[str, ...] | None,
+    tuple[str, ...] | None,
+    tuple[str, ...] | None,
+    tuple[tuple[str, str], ...],
+]
+
+
+def _key_list(values: list[str] | None) -> tuple[str, ...] | None:
+    return None if values is None else tuple(values)
+
+
+@dataclass(frozen=True, eq=False)
+class GlobPatterns:
+    """
+    See: `BasicModDataChecker`
+
+    Patterns are compared and hashed through their canonical form (see `key()`),
+    where the order of the move patterns matters.
+    """
+
+    unfold: list[str] | None = None
+    valid: list[str] | None = None
+    delete: list[str] | None = None
+    move: dict[str, str] = field(default_factory=dict)
+
+    def key(self) -> GlobPatternsKey:
+        """
+        Returns:
+            The canonical form of these patterns, as nested tuples.
+        """
+        return (
+            _key_list(self.unfold),
+            _key_list(self.valid),
+            _key_list(self.delete),
+            tuple(self.move.items()),
+        )
+
+    @staticmethod
+    def from_key(key: GlobPatternsKey) -> GlobPatterns:
+        """
+        Args:
+            key: Canonical form of patterns, as returned by `key()`.
+
+        Returns:
+            New patterns equal to the ones the key was created from.
+        """
+        unfold, valid, delete, move = key
+        return GlobPatterns(
+            unfold=None if unfold is None else list(unfold),
+            valid=None if valid is None else list(valid),
+            delete=None if delete is None else list(delete),
+            move=dict(move),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GlobPatterns):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def merge(
+        self, other: GlobPatterns, mode: Literal["merge", "replace"] = "replace"
+    ) -> GlobPatterns:
+        """
+        Construct a new GlobPatterns by merging the current one with the given one.
+
+        There are two different modes:
+          - 'merge': In this mode, unfold/valid/delete are concatenated and move
+            will contain the union of key from self and other, with values from other
+            overriding common keys.
+          - 'replace': The merged object will contains attributes from other, except
+            for None attributes taken from self.
+
+        Args:
+            other: Other patterns to "merge" with this one.
+            mode: Merge mode.
+
+        Returns:
+            A new glob pattern representing the merge of this one with other.
+        """
+        if mode == "merge":
+            return GlobPatterns(
+                unfold=_merge_list(self.unfold, other.unfold),
+                valid=_merge_list(self.valid, other.valid),
+                delete=_merge_list(self.delete, other.delete),
+                move=self.move | other.move,
+            )
+        else:
+            return GlobPatterns(
+                unfold=other.unfold or self.unfold,
+                valid=other.valid or self.valid,
+                delete=other.delete or self.delete,
+                move=other.move or self.move,
+            )
+
+
+# Maximum number of compiled patterns kept by compile_patterns():
+COMPILED_PATTERNS_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=COMPILED_PATTERNS_CACHE_SIZE)
+def _compile_patterns(key: GlobPatternsKey) -> RegexPatterns:
+    return RegexPatterns(GlobPatterns.from_key(key))
+
+
+def compile_patterns(globs: GlobPatterns) -> RegexPatterns:
+    """
+    Retrieve the regex patterns for the given glob patterns. Compiled patterns are
+    shared by all the identical glob patterns of the process (within a bounded
+    cache), and must not be modified.
+
+    Args:
+        globs: Glob patterns to compile.
+
+    Returns:
+        The regex patterns derived from the glob patterns.
+    """
+    return _compile_patterns(globs.key())
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import enum
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+__all__ = ["PathTree", "PathTreeEntry"]
+
+
+def _enum_name(value: Any) -> str:
+    # mobase enumerations are matched by name, so that they can be given to a
+    # PathTree without being imported here
+    return str(getattr(value, "name", value)).upper()
+
+
+def _split(path: str) -> list[str]:
+    return [part for part in path.replace("\\", "/").split("/") if part]
+
+
+class PathTreeEntry:
+    """
+    File of a `PathTree`, with the part of the `mobase.FileTreeEntry` interface used
+    by the mod data checkers.
+    """
+
+    class FileTypes(enum.IntFlag):
+        FILE = 1
+        DIRECTORY = 2
+        FILE_OR_DIRECTORY = FILE | DIRECTORY
+
+    FILE = FileTypes.FILE
+    DIRECTORY = FileTypes.DIRECTORY
+    FILE_OR_DIRECTORY = FileTypes.FILE_OR_DIRECTORY
+
+    def __init__(self, name: str, parent: PathTree | None = None):
+        self._name = name
+        self._parent = parent
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path('/')!r})"
+
+    def name(self) -> str:
+        return self._name
+
+    def suffix(self) -> str:
+        _, dot, suffix = self._name.rpartition(".")
+        return suffix if dot and not self.isDir() else ""
+
+    def isFile(self) -> bool:
+        return not self.isDir()
+
+    def isDir(self) -> bool:
+        return False
+
+    def fileType(self) -> PathTreeEntry.FileTypes:
+        return PathTreeEntry.DIRECTORY if self.isDir() else PathTreeEntry.FILE
+
+    def parent(self) -> PathTree | None:
+        return self._parent
+
+    def path(self, sep: str = "\\") -> str:
+        parts: list[str] = []
+        entry: PathTreeEntry = self
+        while (parent := entry._parent) is not None:
+            parts.append(entry._name)
+            entry = parent
+        return sep.join(reversed(parts))
+
+    def pathFrom(self, tree: PathTree, sep: str = "\\") -> str:
+        parts: list[str] = []
+        entry: PathTreeEntry | None = self
+        while entry is not None and entry is not tree:
+            parts.append(entry._name)
+            entry = entry._parent
+        return sep.join(reversed(parts)) if entry is tree else ""
+
+    def detach(self) -> bool:
+        return self._parent is not None and self._parent.remove(self)
+
+    def moveTo(self, tree: PathTree) -> bool:
+        return tree.insert(self)
+
+
+class PathTree(PathTreeEntry):
+    """
+    Lightweight in-memory file tree, built from a flat listing of paths (e.g., the
+    names of the members of an archive), that can stand in for a `mobase.IFileTree`
+    when running mod data checkers outside of MO2.
+
+    Only the subset of the `mobase.IFileTree` interface used by the checkers is
+    implemented (iteration, `find`, `exists`, `walk`, `move`, `insert`, `merge`,
+    `addDirectory`, ...). As in MO2, lookups are case-insensitive and directories
+    are listed before files.
+    """
+
+    class WalkReturn(enum.Enum):
+        CONTINUE = enum.auto()
+        STOP = enum.auto()
+        SKIP = enum.auto()
+
+    class InsertPolicy(enum.Enum):
+        FAIL_IF_EXISTS = enum.auto()
+        REPLACE = enum.auto()
+        MERGE = enum.auto()
+
+    CONTINUE = WalkReturn.CONTINUE
+    STOP = WalkReturn.STOP
+    SKIP = WalkReturn.SKIP
+
+    FAIL_IF_EXISTS = InsertPolicy.FAIL_IF_EXISTS
+    REPLACE = InsertPolicy.REPLACE
+    MERGE = InsertPolicy.MERGE
+
+    def __init__(self, name: str = "", parent: PathTree | None = None):
+        super().__init__(name, parent)
+        self._children: dict[str, PathTreeEntry] = {}
+        self._sorted: list[PathTreeEntry] | None = None
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> PathTree:
+        """
+        Build a tree from a listing of paths.
+
+        Args:
+            paths: Relative paths of the files and directories, with `/` or `\\`
+                separators. Paths ending with a separator are directories, and the
+                parent directories of every path are created as needed.
+
+        Returns:
+            The root of the tree.
+        """
+        root = cls()
+        for path in paths:
+            parts = _split(path)
+            if not parts:
+                continue
+            if path.endswith(("/", "\\")):
+                root.addDirectory("/".join(parts))
+                continue
+
+            parent = root.addDirectory("/".join(parts[:-1])) if len(parts) > 1 else root
+            if parent is not None and parts[-1].casefold() not in parent._children:
+                parent._add_child(PathTreeEntry(parts[-1], parent))
+        return root
+
+    def isDir(self) -> bool:
+        return True
+
+    def _entries(self) -> list[PathTreeEntry]:
+        if self._sorted is None:
+            self._sorted = sorted(
+                self._children.values(),
+                key=lambda entry: (not entry.isDir(), entry._name.casefold()),
+            )
+        return self._sorted
+
+    def _add_child(self, entry: PathTreeEntry) -> None:
+        entry._parent = self
+        self._children[entry._name.casefold()] = entry
+        self._sorted = None
+
+    def __iter__(self) -> Iterator[PathTreeEntry]:
+        # iterate over a snapshot, so that entries can be moved while iterating:
+        return iter(self._entries())
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __getitem__(self, index: int) -> PathTreeEntry:
+        return self._entries()[index]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def find(
+        self, path: str, type: Any = PathTreeEntry.FILE_OR_DIRECTORY
+    ) -> PathTreeEntry | None:
+        entry: PathTreeEntry = self
+        for part in _split(path):
+            if not isinstance(entry, PathTree):
+                return None
+            child = entry._children.get(part.casefold())
+            if child is None:
+                return None
+            entry = child
+        if entry is self or not int(type) & entry.fileType():
+            return None
+        return entry
+
+    def exists(self, path: str, type: Any = PathTreeEntry.FILE_OR_DIRECTORY) -> bool:
+        return self.find(path, type) is not None
+
+    def walk(
+        self, callback: Callable[[str, PathTreeEntry], Any], sep: str = "\\"
+    ) -> None:
+        self._walk(callback, sep, "")
+
+    def _walk(
+        self, callback: Callable[[str, PathTreeEntry], Any], sep: str, path: str
+    ) -> bool:
+        # the callback gets the path of the parent of each entry (with a trailing
+        # separator), the walk stops when it returns STOP, and does not visit the
+        # content of a directory when it returns SKIP
+        for entry in self._entries():
+            action = _enum_name(callback(path, entry))
+            if action == "STOP":
+                return False
+            if action != "SKIP" and isinstance(entry, PathTree):
+                if not entry._walk(callback, sep, path + entry._name + sep):
+                    return False
+        return True
+
+    def addDirectory(self, path: str) -> PathTree | None:
+        tree = self
+        for part in _split(path):
+            child = tree._children.get(part.casefold())
+            if child is None:
+                child = PathTree(part)
+                tree._add_child(child)
+            elif not isinstance(child, PathTree):
+                return None
+            tree = child
+        return tree
+
+    def insert(self, entry: PathTreeEntry, policy: Any = "FAIL_IF_EXISTS") -> bool:
+        existing = self._children.get(entry._name.casefold())
+        if existing is entry:
+            return True
+
+        if existing is not None:
+            policy = _enum_name(policy)
+            if (
+                policy == "MERGE"
+                and isinstance(existing, PathTree)
+                and isinstance(entry, PathTree)
+            ):
+                existing.merge(entry)
+                entry.detach()
+                return True
+            if policy == "FAIL_IF_EXISTS":
+                return False
+            existing.detach()
+
+        entry.detach()
+        self._add_child(entry)
+        return True
+
+    def merge(self, other: PathTree, overwrites: bool = False) -> int:
+        # move the content of other into this tree, replacing existing entries
+        count = 0
+        for entry in list(other._entries()):
+            if self._children.get(entry._name.casefold()) is not None:
+                count += 1
+            self.insert(entry, "MERGE" if entry.isDir() else "REPLACE")
+        return count
+
+    def move(
+        self, entry: PathTreeEntry, path: str, policy: Any = "FAIL_IF_EXISTS"
+    ) -> bool:
+        # a path ending with a separator is the directory to move the entry into,
+        # otherwise it is the new path of the entry
+        parts = _split(path)
+        if path.endswith(("/", "\\")) or not parts:
+            target = self.addDirectory("/".join(parts))
+            return target is not None and target.insert(entry, policy)
+
+        target = self.addDirectory("/".join(parts[:-1]))
+        if target is None:
+            return False
+
+        parent = entry._parent
+        name = entry._name
+        entry.detach()
+        entry._name = parts[-1]
+        if not target.insert(entry, policy):
+            entry._name = name
+            if parent is not None:
+                parent._add_child(entry)
+            return False
+        return True
+
+    def remove(self, entry: str | PathTreeEntry) -> bool:
+        if isinstance(entry, str):
+            found = self.find(entry)
+            if found is None:
+                return False
+            entry = found
+
+        parent = entry._parent
+        if parent is None:
+            return False
+        del parent._children[entry._name.casefold()]
+        parent._sorted = None
+        entry._parent = None
+        return True
+
+    def clear(self) -> None:
+        for entry in list(self._children.values()):
+            entry.detach()
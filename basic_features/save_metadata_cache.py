@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import mobase
+
+__all__ = ["SaveMetadataCache", "cached_save_metadata", "default_save_metadata_cache"]
+
+# Version of the database schema, bump to discard all existing caches:
+_SCHEMA_VERSION = 1
+
+_Parser = Callable[[Path], dict[str, Any]]
+
+
+class SaveMetadataCache:
+    """
+    Persistent cache of the metadata parsed from save files, stored in a SQLite
+    database.
+
+    Each entry is stored with the size and modification time of the file it was
+    parsed from, and is only reused if both are unchanged, and if the version of
+    the parser is unchanged. Entries are written as soon as they are parsed, and
+    can be looked up from multiple threads. The entries of the saves that no longer
+    exist are pruned on the first lookup of each parser.
+    """
+
+    def __init__(self, path: Path | None):
+        """
+        Args:
+            path: Path to the database, or None for an in-memory cache.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._db = self._open()
+
+        # Parsers whose entries were pruned:
+        self._pruned: set[str] = set()
+
+    def _open(self) -> sqlite3.Connection | None:
+        try:
+            if self._path is not None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                ":memory:" if self._path is None else self._path,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            if db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                db.execute("DROP TABLE IF EXISTS metadata")
+                db.execute(
+                    "CREATE TABLE metadata (parser TEXT, path TEXT, version INTEGER,"
+                    " size INTEGER, mtime INTEGER, value TEXT,"
+                    " PRIMARY KEY (parser, path))"
+                )
+                db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            return db
+        except (OSError, sqlite3.Error) as e:
+            print(
+                f'Unable to open save metadata cache "{self._path}": {e}',
+                file=sys.stderr,
+            )
+            return None
+
+    def lookup(
+        self, parser: str, version: int, path: Path, compute: _Parser
+    ) -> dict[str, Any]:
+        """
+        Retrieve the metadata of the given save from the cache, or parse them if the
+        save is not in the cache or changed since its metadata were cached.
+
+        Args:
+            parser: Name of the parser.
+            version: Version of the parser, cached metadata from other versions are
+                discarded.
+            path: Path to the save file.
+            compute: Parser of the save. The metadata must be JSON serializable.
+
+        Returns:
+            The (cached or parsed) metadata of the save.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute(path)
+
+        with self._lock:
+            pruned = parser in self._pruned
+            self._pruned.add(parser)
+        if not pruned:
+            try:
+                self.prune(parser)
+            except sqlite3.Error as e:
+                print(
+                    f"Unable to prune the cached metadata of {parser}: {e}",
+                    file=sys.stderr,
+                )
+
+        key = str(path)
+        if self._db is not None:
+            try:
+                with self._lock:
+                    row = self._db.execute(
+                        "SELECT version, size, mtime, value FROM metadata"
+                        " WHERE parser = ? AND path = ?",
+                        (parser, key),
+                    ).fetchone()
+                if row is not None and tuple(row[:3]) == (
+                    version,
+                    st.st_size,
+                    st.st_mtime_ns,
+                ):
+                    return json.loads(row[3])
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Unable to read cached metadata of {path}: {e}", file=sys.stderr)
+
+        value = compute(path)
+
+        if self._db is not None:
+            try:
+                with self._lock:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            parser,
+                            key,
+                            version,
+                            st.st_size,
+                            st.st_mtime_ns,
+                            json.dumps(value),
+                        ),
+                    )
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Unable to cache metadata of {path}: {e}", file=sys.stderr)
+
+        return value
+
+    def prune(self, parser: str | None = None) -> int:
+        """
+        Remove the entries of saves that no longer exist.
+
+        Args:
+            parser: Only prune the entries of this parser.
+
+        Returns:
+            The number of removed entries.
+        """
+        if self._db is None:
+            return 0
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT parser, path FROM metadata"
+                + ("" if parser is None else " WHERE parser = ?"),
+                () if parser is None else (parser,),
+            ).fetchall()
+            missing = [row for row in rows if not os.path.exists(row[1])]
+            self._db.executemany(
+                "DELETE FROM metadata WHERE parser = ? AND path = ?", missing
+            )
+        return len(missing)
+
+
+@functools.cache
+def default_save_metadata_cache() -> SaveMetadataCache:
+    """
+    Returns:
+        The cache shared by the game plugins, in the plugin data folder of MO2.
+    """
+    return SaveMetadataCache(
+        Path(mobase.IOrganizer.getPluginDataPath(), "basic_games", "saves.sqlite")
+    )
+
+
+def cached_save_metadata(
+    name: str, version: int = 1, cache: SaveMetadataCache | None = None
+) -> Callable[[_Parser], _Parser]:
+    """
+    Cache the results of a save parser, see `SaveMetadataCache`.
+
+    Args:
+        name: Name of the parser, unique among the parsers using the same cache.
+        version: Version of the parser, to bump when its results change.
+        cache: Cache to use, the shared cache (`default_save_metadata_cache()`) by
+            default.
+
+    Example:
+
+        @cached_save_metadata("mygame")
+        def read_save_metadata(path: Path) -> dict[str, Any]:
+            with open(path, "rb") as fp:
+                ...
+            return {"name": name, "level": level}
+    """
+
+    def decorator(parser: _Parser) -> _Parser:
+        @functools.wraps(parser)
+        def wrapper(path: Path) -> dict[str, Any]:
+            return (cache or default_save_metadata_cache()).lookup(
+                name, version, path, parser
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import fnmatch
+import heapq
+import os
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+__all__ = ["SaveEntry", "iter_save_pages", "iter_saves", "newest_saves", "scan_saves"]
+
+
+class SaveEntry(NamedTuple):
+    """File or directory found by `scan_saves`."""
+
+    path: Path
+    stat: os.stat_result
+
+
+def iter_saves(
+    folder: str | os.PathLike[str],
+    pattern: str = "*",
+    *,
+    min_depth: int = 0,
+    max_depth: int | None = 0,
+    prune: Callable[[str], bool] | None = None,
+    files: bool = True,
+    dirs: bool = False,
+) -> Iterator[SaveEntry]:
+    """
+    Find the saves in a folder with `os.scandir`, keeping the `stat()` result of
+    each save, so that it does not have to be queried again (on Windows, it comes
+    with the directory listing).
+
+    The saves are yielded as the folders are listed, so they do not have to be kept
+    in memory, see `scan_saves` to retrieve them as a list.
+
+    Args:
+        folder: Folder to search.
+        pattern: `fnmatch` pattern for the names of the saves, case-insensitive on
+            Windows (as `glob`).
+        min_depth: Minimum depth of the saves, 0 for the entries of `folder`, 1 for
+            the entries of its subfolders, and so on.
+        max_depth: Maximum depth of the saves, no subfolder is listed below this
+            depth. None to search all subfolders (without following symbolic links).
+        prune: Called with the name of each subfolder before listing it, the
+            subfolder (and its content) is skipped if it returns True.
+        files: Include the files matching `pattern`.
+        dirs: Include the directories matching `pattern`.
+
+    Returns:
+        The matching entries, in directory listing order (depth first), nothing if
+        `folder` does not exist.
+
+    Example:
+
+        # same as Path(folder).glob("*/*.sfs"), without the "Backup" folders:
+        iter_saves(folder, "*.sfs", min_depth=1, max_depth=1, prune=lambda name: name == "Backup")
+    """
+    match = re.compile(
+        fnmatch.translate(pattern), re.IGNORECASE if sys.platform == "win32" else 0
+    ).match
+
+    stack: list[tuple[str, int]] = [(os.fspath(folder), 0)]
+    while stack:
+        current, depth = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subfolders: list[tuple[str, int]] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+                if is_dir and (max_depth is None or depth < max_depth):
+                    if (max_depth is not None or not entry.is_symlink()) and (
+                        prune is None or not prune(entry.name)
+                    ):
+                        subfolders.append((entry.path, depth + 1))
+
+                if not (
+                    depth >= min_depth
+                    and (dirs if is_dir else files)
+                    and match(entry.name)
+                ):
+                    continue
+                save = SaveEntry(Path(entry.path), entry.stat())
+            except OSError:
+                continue
+            yield save
+
+        # depth first, in listing order:
+        stack.extend(reversed(subfolders))
+
+
+def scan_saves(
+    folder: str | os.PathLike[str],
+    pattern: str = "*",
+    *,
+    min_depth: int = 0,
+    max_depth: int | None = 0,
+    prune: Callable[[str], bool] | None = None,
+    files: bool = True,
+    dirs: bool = False,
+) -> list[SaveEntry]:
+    """
+    Find the saves in a folder, see `iter_saves` for the arguments.
+
+    Returns:
+        The matching entries, in directory listing order (depth first), or an empty
+        list if `folder` does not exist.
+    """
+    return list(
+        iter_saves(
+            folder,
+            pattern,
+            min_depth=min_depth,
+            max_depth=max_depth,
+            prune=prune,
+            files=files,
+            dirs=dirs,
+        )
+    )
+
+
+def _age_key(save: SaveEntry) -> tuple[int, str]:
+    # newest first, then by path for saves with the same modification time:
+    return (save.stat.st_mtime_ns, str(save.path))
+
+
+def newest_saves(saves: Iterable[SaveEntry], count: int) -> list[SaveEntry]:
+    """
+    Select the most recently modified saves, keeping at most `count` saves in
+    memory (with a heap), so the saves can be selected while they are listed (see
+    `iter_saves`).
+
+    Args:
+        saves: Saves to select from.
+        count: Number of saves to select.
+
+    Returns:
+        The `count` newest saves, newest first (saves with the same modification
+        time are sorted by path).
+    """
+    return heapq.nlargest(count, saves, key=_age_key)
+
+
+def iter_save_pages(
+    list_saves: Callable[[], Iterable[SaveEntry]], page_size: int
+) -> Iterator[list[SaveEntry]]:
+    """
+    Page through saves from the newest to the oldest, without keeping more than one
+    page of saves in memory.
+
+    The saves are listed again for each page, so pages are consistent as long as the
+    saves do not change while paging.
+
+    Args:
+        list_saves: Called to list the saves for each page, e.g.,
+            `lambda: iter_saves(folder, "*.sav")`.
+        page_size: Number of saves by page.
+
+    Returns:
+        The pages of saves, newest first, the first page being `newest_saves()`.
+
+    Example:
+
+        # skip the 100 newest saves:
+        pages = iter_save_pages(lambda: iter_saves(folder, "*.sav"), 100)
+        next(pages)
+        for page in pages:
+            ...
+    """
+    if page_size <= 0:
+        raise ValueError(f"invalid page size: {page_size}")
+
+    last: tuple[int, str] | None = None
+    while True:
+        saves = list_saves()
+        if last is not None:
+            bound = last
+            saves = (save for save in saves if _age_key(save) < bound)
+        page = newest_saves(saves, page_size)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        last = _age_key(page[-1])
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter, OrderedDict
+
+import mobase
+
+from .check_cache import tree_fingerprint
+from .utils import is_directory
+
+__all__ = ["ModTreeSummary"]
+
+
+def _extension(name: str) -> str:
+    _, dot, suffix = name.rpartition(".")
+    return suffix.casefold() if dot else ""
+
+
+class ModTreeSummary:
+    """
+    Summary of the content of a mod file tree, computed in a single traversal, so
+    that the features of a game (mod data checker, mod data content, ...) can
+    inspect the same tree without walking it again.
+
+    Paths, names and extensions are case-folded, and paths use `/` separators.
+    """
+
+    # Number of summaries kept by of():
+    CACHE_SIZE = 16
+
+    _cache: OrderedDict[
+        int, tuple[mobase.IFileTree, bytes, ModTreeSummary]
+    ] = OrderedDict()
+    _lock = threading.Lock()
+
+    top_level: tuple[tuple[str, bool], ...]
+    """Names of the top-level entries, with True for directories."""
+
+    depth: int
+    """Number of levels of the tree, 0 for an empty tree."""
+
+    file_count: int
+    """Number of files in the tree."""
+
+    names: Counter[str]
+    """Number of files by name."""
+
+    def __init__(self, tree: mobase.IFileTree):
+        """
+        Args:
+            tree: Tree to summarize.
+        """
+        self.top_level = tuple((entry.name(), entry.isDir()) for entry in tree)
+        self.depth = 0
+        self.file_count = 0
+        self.names = Counter()
+
+        # Number of files by (directory, extension), for the directory of each file
+        # and all its parents, the root being "":
+        self._counts: Counter[tuple[str, str]] = Counter()
+
+        # (tree, paths of the tree and its parents, level of the entries of the tree)
+        stack: list[tuple[mobase.IFileTree, list[str], int]] = [(tree, [""], 1)]
+        while stack:
+            current, prefixes, level = stack.pop()
+            path = prefixes[-1]
+            for entry in current:
+                self.depth = max(self.depth, level)
+                name = entry.name().casefold()
+                if is_directory(entry):
+                    child = f"{path}/{name}" if path else name
+                    stack.append((entry, [*prefixes, child], level + 1))
+                    continue
+
+                self.file_count += 1
+                self.names[name] += 1
+                extension = _extension(name)
+                for prefix in prefixes:
+                    self._counts[prefix, extension] += 1
+
+    @classmethod
+    def of(cls, tree: mobase.IFileTree) -> ModTreeSummary:
+        """
+        Retrieve the summary of a tree, computing it unless it was computed recently
+        for the same tree.
+
+        Summaries are cached by tree, and a cached summary is only reused if the
+        top-level entries of the tree, and the number of entries of its top-level
+        folders, did not change (see `tree_fingerprint`). Trees must not be modified
+        otherwise while summaries are in use.
+
+        Args:
+            tree: Tree to summarize.
+
+        Returns:
+            The summary of the tree.
+        """
+        fingerprint = tree_fingerprint(tree, depth=1)
+        with cls._lock:
+            cached = cls._cache.get(id(tree))
+            if cached is not None and cached[1] == fingerprint:
+                cls._cache.move_to_end(id(tree))
+                return cached[2]
+
+        summary = cls(tree)
+        with cls._lock:
+            # keep a reference to the tree, so that its id is not reused:
+            cls._cache[id(tree)] = (tree, fingerprint, summary)
+            cls._cache.move_to_end(id(tree))
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return summary
+
+    @property
+    def extensions(self) -> Counter[str]:
+        """Number of files by extension (without the leading dot)."""
+        return Counter(
+            {
+                extension: n
+                for (prefix, extension), n in self._counts.items()
+                if not prefix
+            }
+        )
+
+    def top_level_dirs(self) -> set[str]:
+        """Case-folded names of the top-level directories."""
+        return {name.casefold() for name, is_dir in self.top_level if is_dir}
+
+    def top_level_files(self) -> list[str]:
+        """Case-folded names of the top-level files."""
+        return [name.casefold() for name, is_dir in self.top_level if not is_dir]
+
+    def count(self, extension: str | None = None, prefix: str = "") -> int:
+        """
+        Count the files of the tree.
+
+        Args:
+            extension: Extension of the files to count (without the leading dot), or
+                None to count all files.
+            prefix: Path of the directory to count the files in (recursively), the
+                whole tree by default.
+
+        Returns:
+            The number of matching files.
+        """
+        prefix = "/".join(part for part in prefix.casefold().split("/") if part)
+        if extension is not None:
+            return self._counts[prefix, extension.casefold()]
+        return sum(n for (p, _), n in self._counts.items() if p == prefix)
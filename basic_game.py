@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import functools
+import re
 import shutil
 import sys
 from pathlib import Path
-from typing import Callable, Generic, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Self,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
@@ -12,101 +24,138 @@ from PyQt6.QtGui import QIcon
 from .basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    parse_lazy_saves,
 )
+from .basic_features.save_scan import SaveEntry, iter_saves, newest_saves
+from .file_cache import FileCache
+from .game_detection import GameDetection
+from .store_discovery import StoreDiscovery, normalize_path
 
 
-def replace_variables(value: str, game: BasicGame) -> str:
-    """Replace special paths in the given value."""
+@functools.cache
+def _writable_location(location: QStandardPaths.StandardLocation) -> str:
+    return QStandardPaths.writableLocation(location)
 
-    if value.find("%DOCUMENTS%") != -1:
-        value = value.replace(
-            "%DOCUMENTS%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.DocumentsLocation
-            ),
-        )
-    if value.find("%USERPROFILE%") != -1:
-        value = value.replace(
-            "%USERPROFILE%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.HomeLocation
-            ),
-        )
-    if value.find("%GAME_DOCUMENTS%") != -1:
-        value = value.replace(
-            "%GAME_DOCUMENTS%", game.documentsDirectory().absolutePath()
+
+# Special paths that can be used in the values of the mappings:
+_VARIABLES: dict[str, Callable[[BasicGame], str]] = {
+    "DOCUMENTS": lambda game: _writable_location(
+        QStandardPaths.StandardLocation.DocumentsLocation
+    ),
+    "USERPROFILE": lambda game: _writable_location(
+        QStandardPaths.StandardLocation.HomeLocation
+    ),
+    "GAME_DOCUMENTS": lambda game: game.documentsDirectory().absolutePath(),
+    "GAME_PATH": lambda game: game.gameDirectory().absolutePath(),
+}
+
+_VARIABLES_RE = re.compile("%({})%".format("|".join(_VARIABLES)))
+
+
+class _Template:
+    """Value containing special paths, split once into literals and variables."""
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, parts: list[str]):
+        """
+        Args:
+            parts: Parts of the value, alternating literals (even indices) and names
+                of variables (odd indices).
+        """
+        self._parts = parts
+
+    def expand(self, game: BasicGame) -> str:
+        return "".join(
+            _VARIABLES[part](game) if i % 2 else part
+            for i, part in enumerate(self._parts)
         )
-    if value.find("%GAME_PATH%") != -1:
-        value = value.replace("%GAME_PATH%", game.gameDirectory().absolutePath())
 
-    return value
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(value: str) -> _Template | None:
+    parts = _VARIABLES_RE.split(value)
+    return _Template(parts) if len(parts) > 1 else None
+
+
+def replace_variables(value: str, game: BasicGame) -> str:
+    """Replace special paths in the given value."""
+    template = _compile_template(value)
+    return value if template is None else template.expand(game)
 
 
 _T = TypeVar("_T")
+_S = TypeVar("_S", bound=mobase.ISaveGame)
+
+
+class _Constant(Generic[_T]):
+    """Compiled value of a mapping set by a class attribute."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: _T):
+        self._value = value
+
+        # compile the template of the value once:
+        if isinstance(value, str):
+            _compile_template(value)
+        elif isinstance(value, QDir):
+            _compile_template(value.path())
+
+    def __call__(self, game: BasicGame) -> _T:
+        return self._value
 
 
 class BasicGameMapping(Generic[_T]):
-    # The game:
-    _game: "BasicGame"
+    """
+    Value of a game mapping, bound to a game. The value itself is compiled once per
+    game class (see `BasicGameMappings.compile`).
+    """
 
-    # Name of the attribute for exposure:
-    _exposed_name: str
+    __slots__ = ("_game", "_value", "_name", "_resolved")
 
-    # Name of the internal method:
-    _internal_method_name: str
+    # The game:
+    _game: BasicGame
 
-    # Required:
-    _required: bool
+    # Callable returning the value, before variables replacement:
+    _value: Callable[[BasicGame], _T]
 
-    # Callable returning a default value (if not required):
-    _default: Callable[["BasicGame"], _T]
+    # Name of the mapping:
+    _name: str
 
-    # Function to apply to the value:
-    _apply_fn: Callable[[_T | str], _T] | None
+    # Resolved values of the constant mappings of the game, by name (the value of a
+    # mapping has the type of this mapping):
+    _resolved: dict[str, object]
 
     def __init__(
         self,
         game: BasicGame,
-        exposed_name: str,
-        internal_method: str,
-        default: Callable[[BasicGame], _T] | None = None,
-        apply_fn: Callable[[_T | str], _T] | None = None,
+        value: Callable[[BasicGame], _T],
+        name: str,
+        resolved: dict[str, object],
     ):
         self._game = game
-        self._exposed_name = exposed_name
-        self._internal_method_name = internal_method
-        self._apply_fn = apply_fn
-
-        if hasattr(game, self._exposed_name):
-            value = getattr(game, self._exposed_name)
-
-            if self._apply_fn is not None:
-                try:
-                    value = self._apply_fn(value)
-                except Exception as err:
-                    raise ValueError(
-                        "Basic game plugin from {} has an invalid {} property.".format(
-                            game._fromName,  # pyright: ignore[reportPrivateUsage]
-                            self._exposed_name,
-                        )
-                    ) from err
-            self._default = lambda game: value  # type: ignore
-        elif default is not None:
-            self._default = default  # type: ignore
-        elif getattr(game.__class__, self._internal_method_name) is getattr(
-            BasicGame, self._internal_method_name
-        ):
-            raise ValueError(
-                "Basic game plugin from {} is missing {} property.".format(
-                    game._fromName,  # pyright: ignore[reportPrivateUsage]
-                    self._exposed_name,
-                )
-            )
+        self._value = value
+        self._name = name
+        self._resolved = resolved
 
     def get(self) -> _T:
         """Return the value of this mapping."""
-        value = self._default(self._game)  # type: ignore
+        value: _T
+        if self._name in self._resolved:
+            value = cast(_T, self._resolved[self._name])
+        else:
+            value = self._replace_variables(self._value(self._game))
+            if isinstance(self._value, _Constant):
+                self._resolved[self._name] = value
+
+        # do not share QDir objects, which are mutable:
+        if isinstance(value, QDir):
+            return QDir(value)  # type: ignore
+
+        return value
 
+    def _replace_variables(self, value: _T) -> _T:
         if isinstance(value, str):
             return replace_variables(value, self._game)  # type: ignore
         elif isinstance(value, QDir):
@@ -125,19 +174,26 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
     plugin is responsible to choose the right option depending on the context.
     """
 
-    _index: int
+    __slots__ = ("_current_default", "_indices")
+
+    # Callable returning the current value when there is no option:
+    _current_default: Callable[[BasicGame], _T]
+
+    # Index of the option to use for each options mapping of the game, by name:
+    _indices: dict[str, int]
 
     def __init__(
         self,
         game: BasicGame,
-        exposed_name: str,
-        internal_method: str,
-        default: Callable[[BasicGame], _T] | None = None,
-        apply_fn: Callable[[list[_T] | str], list[_T]] | None = None,
+        value: Callable[[BasicGame], list[_T]],
+        name: str,
+        resolved: dict[str, object],
+        current_default: Callable[[BasicGame], _T],
+        indices: dict[str, int],
     ):
-        super().__init__(game, exposed_name, internal_method, lambda g: [], apply_fn)
-        self._index = -1
-        self._current_default = default
+        super().__init__(game, value, name, resolved)
+        self._current_default = current_default
+        self._indices = indices
 
     def set_index(self, index: int):
         """
@@ -146,7 +202,7 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Args:
             index: Index of the option to use.
         """
-        self._index = index
+        self._indices[self._name] = index
 
     def set_value(self, value: _T):
         """
@@ -157,9 +213,9 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
             value: The value to set the index to.
         """
         try:
-            self._index = self.get().index(value)
+            self._indices[self._name] = self.get().index(value)
         except ValueError:
-            self._index = -1
+            self._indices[self._name] = -1
 
     def has_value(self) -> bool:
         """
@@ -168,18 +224,19 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Returns:
             True if a value was set, False otherwise.
         """
-        return self._index != -1
+        return self._indices.get(self._name, -1) != -1
 
     def current(self) -> _T:
-        values = self._default(self._game)  # type: ignore
+        values = self._value(self._game)
 
         if not values:
-            return self._current_default(self._game)  # type: ignore
+            return self._current_default(self._game)
 
-        if self._index == -1:
+        index = self._indices.get(self._name, -1)
+        if index == -1:
             value = values[0]
         else:
-            value = values[self._index]
+            value = values[index]
 
         if isinstance(value, str):
             return replace_variables(value, self._game)  # type: ignore
@@ -189,175 +246,380 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         return value
 
 
+class _MappingSpec(Generic[_T]):
+    """
+    Mapping between a class attribute of a game (e.g., `GameName`) and the
+    corresponding method (e.g., `gameName()`), as a descriptor of
+    `BasicGameMappings`.
+    """
+
+    # Name of the attribute in BasicGameMappings:
+    _name: str
+
+    def __init__(
+        self,
+        exposed_name: str,
+        internal_method: str,
+        default: Callable[[BasicGame], _T] | None = None,
+        apply_fn: Callable[[_T | str], _T] | None = None,
+    ):
+        """
+        Args:
+            exposed_name: Name of the class attribute.
+            internal_method: Name of the method of BasicGame.
+            default: Callable returning a default value, if the attribute is not
+                required.
+            apply_fn: Function to apply to the value of the attribute.
+        """
+        self._exposed_name = exposed_name
+        self._internal_method_name = internal_method
+        self._default = default
+        self._apply_fn = apply_fn
+
+    def __set_name__(self, owner: type[BasicGameMappings], name: str):
+        self._name = name
+
+    @property
+    def exposed_name(self) -> str:
+        return self._exposed_name
+
+    def compile(
+        self, source: object, game_type: type[BasicGame]
+    ) -> Callable[[BasicGame], _T]:
+        """
+        Compile this mapping for a game.
+
+        Args:
+            source: Object holding the attributes of the game, its class or an
+                instance.
+            game_type: Class of the game.
+
+        Returns:
+            A callable returning the value of the mapping for a game, before variables
+            replacement.
+
+        Raises:
+            ValueError: If the attribute is invalid or missing.
+        """
+        from_name = getattr(source, "_fromName", game_type.__name__)
+
+        if hasattr(source, self._exposed_name):
+            value = getattr(source, self._exposed_name)
+
+            if self._apply_fn is not None:
+                try:
+                    value = self._apply_fn(value)
+                except Exception as err:
+                    raise ValueError(
+                        "Basic game plugin from {} has an invalid {} property.".format(
+                            from_name, self._exposed_name
+                        )
+                    ) from err
+            return _Constant(value)
+        elif self._default is not None:
+            return self._default
+        elif getattr(game_type, self._internal_method_name) is getattr(
+            BasicGame, self._internal_method_name
+        ):
+            raise ValueError(
+                "Basic game plugin from {} is missing {} property.".format(
+                    from_name, self._exposed_name
+                )
+            )
+
+        def missing(game: BasicGame) -> _T:
+            raise ValueError(
+                "Basic game plugin from {} is missing {} property.".format(
+                    from_name, self._exposed_name
+                )
+            )
+
+        return missing
+
+    @overload
+    def __get__(self, instance: None, owner: type[BasicGameMappings]) -> Self:
+        ...
+
+    @overload
+    def __get__(
+        self, instance: BasicGameMappings, owner: type[BasicGameMappings]
+    ) -> BasicGameMapping[_T]:
+        ...
+
+    def __get__(
+        self, instance: BasicGameMappings | None, owner: type[BasicGameMappings]
+    ) -> Self | BasicGameMapping[_T]:
+        if instance is None:
+            return self
+        return BasicGameMapping(
+            instance._game,  # pyright: ignore[reportPrivateUsage]
+            instance._values[self._name],  # pyright: ignore[reportPrivateUsage]
+            self._name,
+            instance._resolved,  # pyright: ignore[reportPrivateUsage]
+        )
+
+
+class _OptionsMappingSpec(_MappingSpec[list[_T]]):
+    """Specification of a `BasicGameOptionsMapping`."""
+
+    def __init__(
+        self,
+        exposed_name: str,
+        internal_method: str,
+        default: Callable[[BasicGame], _T],
+        apply_fn: Callable[[list[_T] | str], list[_T]] | None = None,
+    ):
+        super().__init__(exposed_name, internal_method, lambda g: [], apply_fn)
+        self._current_default = default
+
+    @overload
+    def __get__(self, instance: None, owner: type[BasicGameMappings]) -> Self:
+        ...
+
+    @overload
+    def __get__(
+        self, instance: BasicGameMappings, owner: type[BasicGameMappings]
+    ) -> BasicGameOptionsMapping[_T]:
+        ...
+
+    def __get__(
+        self, instance: BasicGameMappings | None, owner: type[BasicGameMappings]
+    ) -> Self | BasicGameOptionsMapping[_T]:
+        if instance is None:
+            return self
+        return BasicGameOptionsMapping(
+            instance._game,  # pyright: ignore[reportPrivateUsage]
+            instance._values[self._name],  # pyright: ignore[reportPrivateUsage]
+            self._name,
+            instance._resolved,  # pyright: ignore[reportPrivateUsage]
+            self._current_default,
+            instance._indices,  # pyright: ignore[reportPrivateUsage]
+        )
+
+
+# Documents folders found by _find_documents_directory(), by game name. Only found
+# folders are kept, so that a folder created later on (e.g., when the game is first
+# launched) is found:
+_documents_directories: dict[str, str] = {}
+
+
+def _find_documents_directory(game_name: str) -> str | None:
+    if (found := _documents_directories.get(game_name)) is not None:
+        return found
+
+    documents = _writable_location(QStandardPaths.StandardLocation.DocumentsLocation)
+    folders = [
+        "{}/My Games/{}".format(documents, game_name),
+        "{}/{}".format(documents, game_name),
+    ]
+    for folder in folders:
+        if QDir(folder).exists():
+            _documents_directories[game_name] = folder
+            return folder
+
+    return None
+
+
+def _default_documents_directory(game: mobase.IPluginGame):
+    folder = _find_documents_directory(game.gameName())
+    return QDir() if folder is None else QDir(folder)
+
+
+def _ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
+    """
+    Convert various types to a list of string. If the given value is already a
+    list, returns a new list with all values converted to string, otherwise
+    returns a list with the value convert to a string as its only element.
+    """
+    if isinstance(v, (int, str)):
+        v = [str(v)]
+    return [str(x) for x in v]
+
+
 class BasicGameMappings:
-    name: BasicGameMapping[str]
-    author: BasicGameMapping[str]
-    version: BasicGameMapping[mobase.VersionInfo]
-    description: BasicGameMapping[str]
-    gameName: BasicGameMapping[str]
-    gameShortName: BasicGameMapping[str]
-    gameNexusName: BasicGameMapping[str]
-    validShortNames: BasicGameMapping[list[str]]
-    nexusGameId: BasicGameMapping[int]
-    binaryName: BasicGameMapping[str]
-    launcherName: BasicGameMapping[str]
-    dataDirectory: BasicGameMapping[str]
-    documentsDirectory: BasicGameMapping[QDir]
-    iniFiles: BasicGameMapping[list[str]]
-    savesDirectory: BasicGameMapping[QDir]
-    savegameExtension: BasicGameMapping[str]
-    steamAPPId: BasicGameOptionsMapping[str]
-    gogAPPId: BasicGameOptionsMapping[str]
-    originManifestIds: BasicGameOptionsMapping[str]
-    originWatcherExecutables: BasicGameMapping[list[str]]
-    epicAPPId: BasicGameOptionsMapping[str]
-    eaDesktopContentId: BasicGameOptionsMapping[str]
-    supportURL: BasicGameMapping[str]
+    """
+    Mappings of a game. The mappings are compiled once per game class (see
+    `compile`), the only state of an instance being the option indices.
+    """
+
+    # Game mappings:
+    name = _MappingSpec[str]("Name", "name")
+    author = _MappingSpec[str]("Author", "author")
+    version = _MappingSpec[mobase.VersionInfo](
+        "Version",
+        "version",
+        apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
+    )
+    description = _MappingSpec[str](
+        "Description",
+        "description",
+        lambda g: "Adds basic support for game {}.".format(g.gameName()),
+    )
+    gameName = _MappingSpec[str]("GameName", "gameName")
+    gameShortName = _MappingSpec[str]("GameShortName", "gameShortName")
+    gameNexusName = _MappingSpec[str](
+        "GameNexusName",
+        "gameNexusName",
+        default=lambda g: g.gameShortName(),
+    )
+    validShortNames = _MappingSpec[list[str]](
+        "GameValidShortNames",
+        "validShortNames",
+        default=lambda g: [],
+        apply_fn=lambda value: (
+            [c.strip() for c in value.split(",")] if isinstance(value, str) else value
+        ),
+    )
+    nexusGameId = _MappingSpec[int](
+        "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
+    )
+    binaryName = _MappingSpec[str]("GameBinary", "binaryName")
+    launcherName = _MappingSpec[str](
+        "GameLauncher",
+        "getLauncherName",
+        default=lambda g: "",
+    )
+    dataDirectory = _MappingSpec[str]("GameDataPath", "dataDirectory")
+    documentsDirectory = _MappingSpec[QDir](
+        "GameDocumentsDirectory",
+        "documentsDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=_default_documents_directory,
+    )
+    iniFiles = _MappingSpec[list[str]](
+        "GameIniFiles",
+        "iniFiles",
+        lambda g: [],
+        apply_fn=lambda value: (
+            [c.strip() for c in value.split(",")] if isinstance(value, str) else value
+        ),
+    )
+    savesDirectory = _MappingSpec[QDir](
+        "GameSavesDirectory",
+        "savesDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=lambda g: g.documentsDirectory(),
+    )
+    savegameExtension = _MappingSpec[str](
+        "GameSaveExtension", "savegameExtension", default=lambda g: "save"
+    )
+    steamAPPId = _OptionsMappingSpec[str](
+        "GameSteamId", "steamAPPId", default=lambda g: "", apply_fn=_ids_apply
+    )
+    gogAPPId = _OptionsMappingSpec[str](
+        "GameGogId", "gogAPPId", default=lambda g: "", apply_fn=_ids_apply
+    )
+    originManifestIds = _OptionsMappingSpec[str](
+        "GameOriginManifestIds",
+        "originManifestIds",
+        default=lambda g: "",
+        apply_fn=_ids_apply,
+    )
+    originWatcherExecutables = _MappingSpec[list[str]](
+        "GameOriginWatcherExecutables",
+        "originWatcherExecutables",
+        apply_fn=lambda s: [s] if isinstance(s, str) else s,
+        default=lambda g: [],
+    )
+    epicAPPId = _OptionsMappingSpec[str](
+        "GameEpicId", "epicAPPId", default=lambda g: "", apply_fn=_ids_apply
+    )
+    eaDesktopContentId = _OptionsMappingSpec[str](
+        "GameEaDesktopId",
+        "eaDesktopContentId",
+        default=lambda g: "",
+        apply_fn=_ids_apply,
+    )
+    supportURL = _MappingSpec[str]("GameSupportURL", "supportURL", default=lambda g: "")
 
     @staticmethod
-    def _default_documents_directory(game: mobase.IPluginGame):
-        folders = [
-            "{}/My Games/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-            "{}/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-        ]
-        for folder in folders:
-            qdir = QDir(folder)
-            if qdir.exists():
-                return qdir
+    @functools.cache
+    def _specs() -> dict[str, _MappingSpec[Any]]:
+        return {
+            name: spec
+            for name, spec in vars(BasicGameMappings).items()
+            if isinstance(spec, _MappingSpec)
+        }
 
-        return QDir()
+    @staticmethod
+    @functools.cache
+    def _exposed_names() -> frozenset[str]:
+        return frozenset(
+            spec.exposed_name for spec in BasicGameMappings._specs().values()
+        )
+
+    @staticmethod
+    def compile(
+        source: object, game_type: type[BasicGame]
+    ) -> dict[str, Callable[[BasicGame], Any]]:
+        """
+        Compile the mappings of a game: validate the attributes of the game and apply
+        the conversions.
+
+        Args:
+            source: Object holding the attributes of the game, its class or an
+                instance.
+            game_type: Class of the game.
+
+        Returns:
+            A callable returning the (non-replaced) value of each mapping, by name.
+
+        Raises:
+            ValueError: If an attribute of the game is invalid or missing.
+        """
+        return {
+            name: spec.compile(source, game_type)
+            for name, spec in BasicGameMappings._specs().items()
+        }
 
-    # Game mappings:
     def __init__(self, game: BasicGame):
         self._game = game
+        self._indices: dict[str, int] = {}
+        self._resolved: dict[str, object] = {}
 
-        self.name = BasicGameMapping(game, "Name", "name")
-        self.author = BasicGameMapping(game, "Author", "author")
-        self.version = BasicGameMapping(
-            game,
-            "Version",
-            "version",
-            apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
-        )
-        self.description = BasicGameMapping(
-            game,
-            "Description",
-            "description",
-            lambda g: "Adds basic support for game {}.".format(g.gameName()),
-        )
-        self.gameName = BasicGameMapping(game, "GameName", "gameName")
-        self.gameShortName = BasicGameMapping(game, "GameShortName", "gameShortName")
-        self.gameNexusName = BasicGameMapping(
-            game,
-            "GameNexusName",
-            "gameNexusName",
-            default=lambda g: g.gameShortName(),
-        )
-        self.validShortNames = BasicGameMapping(
-            game,
-            "GameValidShortNames",
-            "validShortNames",
-            default=lambda g: [],
-            apply_fn=lambda value: (
-                [c.strip() for c in value.split(",")]  # type: ignore
-                if isinstance(value, str)
-                else value
-            ),
-        )
-        self.nexusGameId = BasicGameMapping(
-            game, "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
-        )
-        self.binaryName = BasicGameMapping(game, "GameBinary", "binaryName")
-        self.launcherName = BasicGameMapping(
-            game,
-            "GameLauncher",
-            "getLauncherName",
-            default=lambda g: "",
-        )
-        self.dataDirectory = BasicGameMapping(game, "GameDataPath", "dataDirectory")
-        self.documentsDirectory = BasicGameMapping(
-            game,
-            "GameDocumentsDirectory",
-            "documentsDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=BasicGameMappings._default_documents_directory,
-        )
-        self.iniFiles = BasicGameMapping(
-            game,
-            "GameIniFiles",
-            "iniFiles",
-            lambda g: [],
-            apply_fn=lambda value: (
-                [c.strip() for c in value.split(",")]
-                if isinstance(value, str)
-                else value
-            ),
-        )
-        self.savesDirectory = BasicGameMapping(
-            game,
-            "GameSavesDirectory",
-            "savesDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=lambda g: g.documentsDirectory(),
-        )
-        self.savegameExtension = BasicGameMapping(
-            game, "GameSaveExtension", "savegameExtension", default=lambda g: "save"
-        )
+        game_type = type(game)
+        values = game_type.__dict__.get("_mapping_values")
 
-        # Convert Union[int, str, List[Union[int, str]]] to List[str].
-        def ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
-            """
-            Convert various types to a list of string. If the given value is already a
-            list, returns a new list with all values converted to string, otherwise
-            returns a list with the value convert to a string as its only element.
-            """
-            if isinstance(v, (int, str)):
-                v = [str(v)]
-            return [str(x) for x in v]
-
-        self.steamAPPId = BasicGameOptionsMapping(
-            game, "GameSteamId", "steamAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.gogAPPId = BasicGameOptionsMapping(
-            game, "GameGogId", "gogAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.originManifestIds = BasicGameOptionsMapping(
-            game,
-            "GameOriginManifestIds",
-            "originManifestIds",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.originWatcherExecutables = BasicGameMapping(
-            game,
-            "GameOriginWatcherExecutables",
-            "originWatcherExecutables",
-            apply_fn=lambda s: [s] if isinstance(s, str) else s,
-            default=lambda g: [],
-        )
-        self.epicAPPId = BasicGameOptionsMapping(
-            game, "GameEpicId", "epicAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.eaDesktopContentId = BasicGameOptionsMapping(
-            game,
-            "GameEaDesktopId",
-            "eaDesktopContentId",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.supportURL = BasicGameMapping(
-            game, "GameSupportURL", "supportURL", default=lambda g: ""
-        )
+        # games with attributes set on the instance (e.g., ini games) or whose
+        # compilation failed are compiled here, raising the appropriate error:
+        if values is None or not BasicGameMappings._exposed_names().isdisjoint(
+            vars(game)
+        ):
+            values = BasicGameMappings.compile(game, game_type)
+
+        self._values: dict[str, Callable[[BasicGame], Any]] = values
+
+    def invalidate(self):
+        """
+        Clear the resolved values of the mappings, which are resolved again (e.g.,
+        with the new game path) when next accessed.
+        """
+        self._resolved.clear()
+
+
+# Name of the options mapping (in BasicGameMappings) holding the IDs of each store:
+_STORE_MAPPINGS = {
+    "steam": "steamAPPId",
+    "gog": "gogAPPId",
+    "origin": "originManifestIds",
+    "epic": "epicAPPId",
+    "eadesktop": "eaDesktopContentId",
+}
+
+
+class _StoreGames:
+    """
+    Class attribute giving access to the games of a store, waiting for the
+    background discovery of this store (and only this one) if needed.
+    """
+
+    def __init__(self, store: str):
+        self._store = store
+
+    def __get__(
+        self, instance: BasicGame | None, owner: type[BasicGame]
+    ) -> dict[str, Path]:
+        return owner.store_games(self._store)
 
 
 class BasicGame(mobase.IPluginGame):
@@ -365,26 +627,123 @@ class BasicGame(mobase.IPluginGame):
     to make it easier to create game plugins without having to implement
     all the methods of mobase.IPluginGame."""
 
-    # List of steam, GOG, origin and Epic games:
-    steam_games: dict[str, Path]
-    gog_games: dict[str, Path]
-    origin_games: dict[str, Path]
-    epic_games: dict[str, Path]
-    eadesktop_games: dict[str, Path]
+    # List of steam, GOG, origin and Epic games, discovered in the background:
+    steam_games = _StoreGames("steam")
+    gog_games = _StoreGames("gog")
+    origin_games = _StoreGames("origin")
+    epic_games = _StoreGames("epic")
+    eadesktop_games = _StoreGames("eadesktop")
+
+    # Background discovery of the stores, started by setup():
+    _store_discovery: StoreDiscovery | None = None
+
+    # Batch detection of the plugins given to setup():
+    _detection: GameDetection | None = None
+
+    # Default number of threads parsing the saves in parse_saves() (0 to parse each
+    # save on first use), None for games whose saves are not parsed (no
+    # "save_parse_workers" setting):
+    GameSaveParseWorkers: int | None = None
+
+    # Default number of saves listed by listSaves() (the newest ones, 0 for all), None
+    # for games that always list all their saves (no "max_listed_saves" setting):
+    GameMaxListedSaves: int | None = None
 
     @staticmethod
-    def setup():
+    def setup(games: Sequence[BasicGame] | None = None):
+        """
+        Start the discovery of installed games in the background.
+
+        Args:
+            games: The loaded game plugins, or None to look for every installed game.
+                Only the Steam application manifests of these games are read, and
+                these games are then detected together (see `GameDetection`).
+        """
         from .eadesktop_utils import find_games as find_eadesktop_games
         from .epic_utils import find_games as find_epic_games
         from .gog_utils import find_games as find_gog_games
         from .origin_utils import find_games as find_origin_games
         from .steam_utils import find_games as find_steam_games
 
-        BasicGame.steam_games = find_steam_games()
-        BasicGame.gog_games = find_gog_games()
-        BasicGame.origin_games = find_origin_games()
-        BasicGame.epic_games = find_epic_games()
-        BasicGame.eadesktop_games = find_eadesktop_games()
+        steam_ids: set[str] | None = None
+        if games is not None:
+            steam_ids = {
+                steam_id for game in games for steam_id in game.store_ids("steam")
+            }
+
+        # Manifests parsed by the scanners are cached between runs:
+        cache = FileCache(
+            Path(mobase.IOrganizer.getPluginDataPath(), "basic_games", "stores.json")
+        )
+
+        BasicGame._store_discovery = StoreDiscovery(
+            {
+                "steam": functools.partial(
+                    find_steam_games, cache.section("steam"), steam_ids
+                ),
+                "gog": find_gog_games,
+                "origin": functools.partial(find_origin_games, cache.section("origin")),
+                "epic": functools.partial(find_epic_games, cache.section("epic")),
+                "eadesktop": functools.partial(
+                    find_eadesktop_games, cache.section("eadesktop")
+                ),
+            },
+            # save the manifests parsed by all the scanners at once:
+            on_done=cache.flush,
+        )
+
+        BasicGame._detection = (
+            None
+            if games is None
+            else GameDetection(
+                games, BasicGame.store_games, BasicGame._store_discovery.done
+            )
+        )
+
+    @staticmethod
+    def store_games(store: str) -> dict[str, Path]:
+        """
+        Retrieve the games installed from the given store, waiting (with a timeout)
+        for the discovery of this store to finish if needed.
+
+        Args:
+            store: Name of the store ("steam", "gog", "origin", "epic" or
+                "eadesktop").
+
+        Returns:
+            A mapping from store ID to install location.
+        """
+        if BasicGame._store_discovery is None:
+            return {}
+        return BasicGame._store_discovery.games(store)
+
+    @staticmethod
+    def store_path_index(store: str) -> dict[str, list[str]]:
+        """
+        Retrieve the reverse index of the games installed from the given store,
+        waiting (with a timeout) for the discovery of this store to finish if needed.
+
+        Args:
+            store: Name of the store ("steam", "gog", "origin", "epic" or
+                "eadesktop").
+
+        Returns:
+            A mapping from normalized install location to store IDs.
+        """
+        if BasicGame._store_discovery is None:
+            return {}
+        return BasicGame._store_discovery.path_index(store)
+
+    # Mappings compiled from the class attributes, or None if the class attributes are
+    # invalid (see BasicGameMappings):
+    _mapping_values: dict[str, Callable[[BasicGame], Any]] | None
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        try:
+            cls._mapping_values = BasicGameMappings.compile(cls, cls)
+        except ValueError:
+            cls._mapping_values = None
 
     # File containing the plugin:
     _fromName: str
@@ -409,6 +768,22 @@ class BasicGame(mobase.IPluginGame):
         return self._organizer.gameFeatures().registerFeature(self, feature, 0, True)
 
     # Specific to BasicGame:
+    def _store_mapping(self, store: str) -> BasicGameOptionsMapping[str]:
+        return getattr(self._mappings, _STORE_MAPPINGS[store])
+
+    def store_ids(self, store: str) -> list[str]:
+        """
+        Retrieve the IDs of this game for the given store.
+
+        Args:
+            store: Name of the store ("steam", "gog", "origin", "epic" or
+                "eadesktop").
+
+        Returns:
+            The IDs of this game for the given store, possibly empty.
+        """
+        return self._store_mapping(store).get()
+
     def is_steam(self) -> bool:
         return self._mappings.steamAPPId.has_value()
 
@@ -469,11 +844,38 @@ class BasicGame(mobase.IPluginGame):
         return self.name() == self._organizer.managedGame().name()
 
     def settings(self) -> list[mobase.PluginSetting]:
-        return []
+        settings: list[mobase.PluginSetting] = []
+        if self.GameSaveParseWorkers is not None:
+            settings.append(
+                mobase.PluginSetting(
+                    "save_parse_workers",
+                    (
+                        "Number of threads parsing the saves when listing them"
+                        " (0 to parse each save when it is displayed)"
+                    ),
+                    self.GameSaveParseWorkers,
+                )
+            )
+        if self.GameMaxListedSaves is not None:
+            settings.append(
+                mobase.PluginSetting(
+                    "max_listed_saves",
+                    "Only list the most recent saves (0 to list all saves)",
+                    self.GameMaxListedSaves,
+                )
+            )
+        return settings
 
     # IPluginGame interface:
 
     def detectGame(self):
+        detection = BasicGame._detection
+        if detection is not None and detection.handles(self):
+            path = detection.install_path(self)
+            if path is not None:
+                self.setGamePath(path)
+            return
+
         for steam_id in self._mappings.steamAPPId.get():
             if steam_id in BasicGame.steam_games:
                 self.setGamePath(BasicGame.steam_games[steam_id])
@@ -571,10 +973,48 @@ class BasicGame(mobase.IPluginGame):
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
         return [
-            BasicGameSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
+            BasicGameSaveGame(path, stat)
+            for path, stat in self.limit_saves(
+                iter_saves(folder.absolutePath(), f"*.{ext}", max_depth=None, dirs=True)
+            )
         ]
 
+    def limit_saves(self, saves: Iterable[SaveEntry]) -> list[SaveEntry]:
+        """
+        Keep the newest saves of a listing, with the number of saves of the
+        "max_listed_saves" setting, see `newest_saves`. The older saves are never
+        kept in memory.
+
+        Args:
+            saves: Saves found by `listSaves()`, e.g., with `iter_saves`.
+
+        Returns:
+            The newest saves, newest first, or all the saves (in the given order) if
+            the saves are not limited.
+        """
+        limit = 0
+        if self.GameMaxListedSaves is not None:
+            limit = self._organizer.pluginSetting(self.name(), "max_listed_saves")
+        if isinstance(limit, int) and limit > 0:
+            return newest_saves(saves, limit)
+        return list(saves)
+
+    def parse_saves(self, saves: list[_S]) -> list[_S]:
+        """
+        Parse the lazy saves of a listing with the number of threads of the
+        "save_parse_workers" setting, see `parse_lazy_saves`.
+
+        Args:
+            saves: Saves listed by `listSaves()`.
+
+        Returns:
+            The given saves, in the same order.
+        """
+        if self.GameSaveParseWorkers is not None:
+            workers = self._organizer.pluginSetting(self.name(), "save_parse_workers")
+            parse_lazy_saves(saves, workers if isinstance(workers, int) else 0)
+        return saves
+
     def initializeProfile(
         self, directory: QDir, settings: mobase.ProfileSetting
     ) -> None:
@@ -615,28 +1055,28 @@ class BasicGame(mobase.IPluginGame):
             self.gameDirectory().absoluteFilePath(self._mappings.dataDirectory.get())
         )
 
+    def invalidate_paths(self):
+        """
+        Invalidate the cached paths of this game. This is called when the path of the
+        game changes, and must be called when the documents or saves directory of the
+        game change otherwise, e.g., when they depend on a plugin setting.
+        """
+        _documents_directories.pop(self.gameName(), None)
+        self._mappings.invalidate()
+
     def setGamePath(self, path: Path | str) -> None:
         self._gamePath = str(path)
-
-        path = Path(path)
-
-        # Check if we have a matching steam, GOG, Origin or EA Desktop id and set the
-        # index accordingly:
-        for steamid, steampath in BasicGame.steam_games.items():
-            if steampath == path:
-                self._mappings.steamAPPId.set_value(steamid)
-        for gogid, gogpath in BasicGame.gog_games.items():
-            if gogpath == path:
-                self._mappings.steamAPPId.set_value(gogid)
-        for originid, originpath in BasicGame.origin_games.items():
-            if originpath == path:
-                self._mappings.originManifestIds.set_value(originid)
-        for epicid, epicpath in BasicGame.epic_games.items():
-            if epicpath == path:
-                self._mappings.epicAPPId.set_value(epicid)
-        for eadesktopid, eadesktoppath in BasicGame.eadesktop_games.items():
-            if eadesktoppath == path:
-                self._mappings.eaDesktopContentId.set_value(eadesktopid)
+        self.invalidate_paths()
+
+        # Check if we have a matching steam, GOG, Origin, Epic or EA Desktop id and
+        # set the index accordingly (only looking at the stores this game can come
+        # from):
+        path_key = normalize_path(path)
+        for store in ("steam", "gog", "origin", "epic", "eadesktop"):
+            mapping = self._store_mapping(store)
+            if mapping.get():
+                for store_id in BasicGame.store_path_index(store).get(path_key, []):
+                    mapping.set_value(store_id)
 
     def documentsDirectory(self) -> QDir:
         return self._mappings.documentsDirectory.get()
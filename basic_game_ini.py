@@ -2,22 +2,72 @@
 
 import configparser
 import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
 
 from .basic_game import BasicGame
 
 
+def read_ini_game(path: Path | str) -> dict[str, str]:
+    """
+    Read the values of an ini-defined game.
+
+    Args:
+        path: Path to the ini file.
+
+    Returns:
+        The values of the DEFAULT section of the file, by key.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str  # type: ignore
+    config.read(path)
+    return dict(config["DEFAULT"])
+
+
 class BasicIniGame(BasicGame):
-    def __init__(self, path: str):
-        # Set the _fromName to get more "correct" errors:
-        self._fromName = os.path.basename(path)
+    def __init__(
+        self, path: str | None = None, values: Mapping[str, str] | None = None
+    ):
+        """
+        Args:
+            path: Path to the ini file, or None for a class created by
+                `ini_game_class`, which already holds the values of the file.
+            values: Values of the ini file (see `read_ini_game`), or None to read the
+                file.
+        """
+        if path is not None:
+            # Set the _fromName to get more "correct" errors:
+            self._fromName = os.path.basename(path)
 
-        # Read the file:
-        config = configparser.ConfigParser()
-        config.optionxform = str  # type: ignore
-        config.read(path)
+            # Read the file:
+            if values is None:
+                values = read_ini_game(path)
 
-        # Just fill the class with values:
-        for k, v in config["DEFAULT"].items():
-            setattr(self, k, v)
+            # Just fill the class with values:
+            for k, v in values.items():
+                setattr(self, k, v)
 
         super().__init__()
+
+
+def ini_game_class(
+    path: str, values: Mapping[str, str] | None = None
+) -> type[BasicIniGame]:
+    """
+    Create the class of an ini-defined game, with the values of the ini file as class
+    attributes, so that its mappings are compiled once, as for the python plugins.
+
+    Args:
+        path: Path to the ini file.
+        values: Values of the ini file (see `read_ini_game`), or None to read the file.
+
+    Returns:
+        A `BasicIniGame` subclass for the game.
+    """
+    if values is None:
+        values = read_ini_game(path)
+
+    # Set the _fromName to get more "correct" errors:
+    namespace: dict[str, Any] = {"_fromName": os.path.basename(path), **values}
+    return type(Path(path).stem, (BasicIniGame,), namespace)
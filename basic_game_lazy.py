@@ -0,0 +1,132 @@
+# -*- encoding: utf-8 -*-
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import mobase
+from PyQt6.QtWidgets import QMainWindow
+
+from .basic_game import BasicGame
+
+
+def _delegate(method: str) -> Callable[..., Any]:
+    def delegate(self: "BasicLazyGame", *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.load(), method)(*args, **kwargs)
+
+    delegate.__name__ = method
+    return delegate
+
+
+class BasicLazyGame(BasicGame):
+    """
+    Proxy for a game plugin whose module is only imported when needed.
+
+    The proxy is built from the index entry of the plugin (see `plugin_index`): the
+    metadata of the plugin are class attributes of the proxy, so everything
+    implemented by `BasicGame` from these attributes (names, store IDs, detection,
+    ...) is answered without importing the module. The methods defined by the plugin
+    class are delegated to an instance of this class, created on first use, and
+    initialized with the organizer given to the proxy.
+    """
+
+    # Module and name of the actual plugin class:
+    _module: str
+    _package: str | None
+    _class: str
+
+    def __init__(self):
+        super().__init__()
+        self._plugin: BasicGame | None = None
+
+    def load(self) -> BasicGame:
+        """
+        Import the module of the plugin and create the plugin, if not done yet.
+
+        Returns:
+            The actual plugin.
+        """
+        if self._plugin is not None:
+            return self._plugin
+
+        try:
+            module = importlib.import_module(self._module, self._package)
+            plugin: BasicGame = getattr(module, self._class)()
+        except Exception as e:
+            print(
+                "Failed to load {} from {}: {}".format(self._class, self._module, e),
+                file=sys.stderr,
+            )
+            raise
+
+        # features must be registered for the plugin known by MO2, i.e., the proxy:
+        plugin._register_feature = self._register_feature  # type: ignore
+        if self._gamePath:
+            plugin.setGamePath(self._gamePath)
+
+        self._plugin = plugin
+
+        # init() is only called on the actual plugin, once it is loaded:
+        if hasattr(self, "_organizer"):
+            if not plugin.init(self._organizer):
+                print(f"Failed to initialize {self._class}.", file=sys.stderr)
+
+        return plugin
+
+    def init(self, organizer: mobase.IOrganizer) -> bool:
+        self._organizer = organizer
+
+        # the features of the managed game must be registered once MO2 is up, even if
+        # none of the methods of the plugin was called:
+        def on_user_interface_initialized(window: QMainWindow) -> None:
+            if self.isActive():
+                self.load()
+
+        if not organizer.onUserInterfaceInitialized(on_user_interface_initialized):
+            print(
+                "Failed to register onUserInterfaceInitialized callback!",
+                file=sys.stderr,
+            )
+            return False
+        return True
+
+    def isActive(self) -> bool:
+        active = super().isActive()
+        if active:
+            self.load()
+        return active
+
+    def setGamePath(self, path: Path | str) -> None:
+        super().setGamePath(path)
+        if self._plugin is not None:
+            self._plugin.setGamePath(path)
+
+
+def lazy_game_class(
+    module: str, package: str | None, entry: dict[str, Any]
+) -> type[BasicLazyGame]:
+    """
+    Create the proxy class of a game plugin.
+
+    Args:
+        module: Name of the module containing the plugin, as given to
+            `importlib.import_module`.
+        package: Package used to resolve a relative module name.
+        entry: Index entry of the plugin (see `plugin_index.read_module_index`).
+
+    Returns:
+        A `BasicLazyGame` subclass for the plugin.
+    """
+    namespace: dict[str, Any] = {
+        "_fromName": entry["class"],
+        **entry["attributes"],
+        "_module": module,
+        "_package": package,
+        "_class": entry["class"],
+    }
+    for method in entry["methods"]:
+        if method != "init":
+            namespace[method] = _delegate(method)
+
+    return type(entry["class"], (BasicLazyGame,), namespace)
@@ -0,0 +1,127 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Benchmark the classification of mod file tree entries by `RegexPatterns`, with the
+single combined regex versus the previous category-by-category matching.
+
+Usage: python benchmarks/bench_glob_patterns.py [number of entries]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parent.parent.joinpath("basic_features"))
+)
+
+from glob_patterns import GlobPatterns, PatternMatch, RegexPatterns  # noqa: E402
+
+# Patterns of the Valheim mod data checker:
+PATTERNS = GlobPatterns(
+    unfold=["BepInExPack_Valheim"],
+    valid=[
+        "meta.ini",
+        "BepInEx",
+        "doorstop_libs",
+        "unstripped_corlib",
+        "doorstop_config.ini",
+        "start_game_bepinex.sh",
+        "start_server_bepinex.sh",
+        "winhttp.dll",
+        "changelog.txt",
+        "InSlimVML",
+        "valheim_Data",
+        "inslimvml.ini",
+        "unstripped_managed",
+        "AdvancedBuilder",
+    ],
+    delete=[
+        "*.txt",
+        "*.md",
+        "README",
+        "icon.png",
+        "license",
+        "manifest.json",
+        "*.dll.mdb",
+        "*.pdb",
+    ],
+    move={
+        "*_VML.dll": "InSlimVML/Mods/",
+        "plugins": "BepInEx/",
+        "Jotunn": "BepInEx/plugins/",
+        "*.dll": "BepInEx/plugins/",
+        "*.xml": "BepInEx/plugins/",
+        "Translations": "BepInEx/plugins/",
+        "config": "BepInEx/",
+        "*.cfg": "BepInEx/config/",
+        "CustomTextures": "BepInEx/plugins/",
+        "*.png": "BepInEx/plugins/CustomTextures/",
+        "Builds": "AdvancedBuilder/",
+        "*.vbuild": "AdvancedBuilder/Builds/",
+        "*.assets": "valheim_Data/",
+    },
+)
+
+_EXTENSIONS = [".dll", ".txt", ".md", ".png", ".cfg", ".xml", ".pdb", ".json", ".bin"]
+
+
+def generate_names(count: int) -> list[str]:
+    rng = random.Random(42)
+    literals = [
+        *(PATTERNS.valid or []),
+        *(PATTERNS.delete or []),
+        *(glob for glob in PATTERNS.move if "*" not in glob),
+    ]
+    names: list[str] = []
+    for i in range(count):
+        if rng.random() < 0.3:
+            name = rng.choice(literals)
+            names.append(name.upper() if rng.random() < 0.5 else name)
+        else:
+            names.append(f"Mod_File{i}{rng.choice(_EXTENSIONS)}")
+    return names
+
+
+def match_sequential(patterns: RegexPatterns, name: str) -> PatternMatch | None:
+    # previous implementation of BasicModDataChecker.dataLooksValid:
+    name = name.casefold()
+    if patterns.unfold.match(name):
+        return ("unfold", None)
+    if patterns.valid.match(name):
+        return ("valid", None)
+    if patterns.delete.match(name):
+        return ("delete", None)
+    if (key := patterns.move_match(name)) is not None:
+        return ("move", key)
+    return None
+
+
+def bench(
+    name: str,
+    names: list[str],
+    fn: Callable[[str], PatternMatch | None],
+) -> list[PatternMatch | None]:
+    start = time.perf_counter()
+    results = [fn(entry) for entry in names]
+    elapsed = time.perf_counter() - start
+    print(
+        "{:>10}: {:.3f}s ({:.2f}us / entry)".format(
+            name, elapsed, elapsed / len(names) * 1e6
+        )
+    )
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    patterns = RegexPatterns(PATTERNS)
+    names = generate_names(count)
+    print(f"{count} entries")
+
+    expected = bench("sequential", names, lambda n: match_sequential(patterns, n))
+    actual = bench("combined", names, patterns.match)
+    assert actual == expected, "combined and sequential results differ"
@@ -0,0 +1,86 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Benchmark the listing of saves (with their modification time) in a synthetic saves
+folder, with `scan_saves` versus the previous recursive glob and `stat()` calls, and
+the listing of the newest saves only (`newest_saves`).
+
+Usage: python benchmarks/bench_list_saves.py [number of saves]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(
+    0, str(Path(__file__).resolve().parent.parent.joinpath("basic_features"))
+)
+
+from save_scan import iter_saves, newest_saves, scan_saves  # noqa: E402
+
+
+def generate_saves(folder: Path, count: int) -> None:
+    rng = random.Random(42)
+    for i in range(count):
+        profile = folder.joinpath(f"profile{i % 4}")
+        profile.mkdir(exist_ok=True)
+        name = f"autosave{i}" if rng.random() < 0.8 else f"quicksave{i}"
+        profile.joinpath(f"{name}.sav").touch()
+        os.utime(profile.joinpath(f"{name}.sav"), ns=(0, rng.randrange(10**18)))
+        profile.joinpath(f"{name}.png").touch()
+
+
+def list_with_glob(folder: Path) -> dict[str, int]:
+    # previous implementation of BasicGame.listSaves (+ getCreationTime):
+    return {str(path): int(path.stat().st_mtime) for path in folder.glob("**/*.sav")}
+
+
+def list_with_scandir(folder: Path) -> dict[str, int]:
+    return {
+        str(path): int(stat.st_mtime)
+        for path, stat in scan_saves(folder, "*.sav", max_depth=None, dirs=True)
+    }
+
+
+def list_newest(folder: Path) -> dict[str, int]:
+    return {
+        str(path): int(stat.st_mtime)
+        for path, stat in newest_saves(
+            iter_saves(folder, "*.sav", max_depth=None, dirs=True), NEWEST
+        )
+    }
+
+
+def bench(name: str, folder: Path, fn: Callable[[Path], dict[str, int]]):
+    start = time.perf_counter()
+    saves = fn(folder)
+    elapsed = time.perf_counter() - start
+    print("{:>8}: {:.3f}s ({} saves)".format(name, elapsed, len(saves)))
+    return saves
+
+
+if __name__ == "__main__":
+    NEWEST = 100
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        generate_saves(folder, count)
+        print(f"{count} saves ({os.name})")
+
+        # Warm the OS file cache:
+        bench("warm-up", folder, list_with_scandir)
+
+        expected = bench("glob", folder, list_with_glob)
+        actual = bench("scandir", folder, list_with_scandir)
+        assert actual == expected, "scandir and glob results differ"
+
+        newest = bench(f"newest {NEWEST}", folder, list_newest)
+        assert (
+            list(newest)
+            == sorted(expected, key=lambda p: -os.stat(p).st_mtime_ns)[:NEWEST]
+        ), "newest saves differ"
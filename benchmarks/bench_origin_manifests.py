@@ -0,0 +1,101 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Benchmark the discovery of Origin manifests in a synthetic LocalContent folder, with
+the bounded-depth walker of `origin_utils` versus the previous recursive glob.
+
+Usage: python benchmarks/bench_origin_manifests.py [number of games]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+from urllib import parse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import origin_utils  # noqa: E402
+
+_MANIFEST = (
+    "?currentstate=kReadyToStart&downloading=false&id={id}"
+    "&dipinstallpath={path}&previousstate=kInstalling&totalbytes={size}"
+)
+
+
+def generate_local_content(folder: Path, count: int) -> None:
+    rng = random.Random(42)
+    for i in range(count):
+        game = folder.joinpath(f"Game {i}")
+        game.mkdir()
+        game.joinpath(f"OFB-EAST{i}.mfst").write_text(
+            _MANIFEST.format(
+                id=parse.quote(f"OFB-EAST:{100000 + i}"),
+                path=parse.quote(f"C:\\Games\\Game {i}\\"),
+                size=rng.getrandbits(36),
+            )
+        )
+        if i % 5 == 0:
+            game.joinpath(f"OFB-EAST{i}@steam.mfst").write_text(
+                _MANIFEST.format(id=i, path="steam", size=0)
+            )
+
+        # stale folders left over by old installations and updates:
+        for j in range(rng.randint(0, 4)):
+            stale = game.joinpath("staging", f"update {j}", "cache", "data")
+            stale.mkdir(parents=True)
+            for k in range(rng.randint(0, 10)):
+                stale.joinpath(f"chunk{k}.bin").touch()
+
+
+def find_with_glob(folder: Path) -> dict[str, Path]:
+    # previous implementation of origin_utils.find_games:
+    games: dict[str, Path] = {}
+    for manifest in folder.glob("**/*.mfst"):
+        if "@steam" in manifest.name.lower():
+            continue
+
+        with open(manifest, "r") as f:
+            manifest_query = f.read()
+        url = parse.urlparse(manifest_query)
+        query = parse.parse_qs(url.query)
+        if "id" not in query or "dipinstallpath" not in query:
+            continue
+        for id_ in query["id"]:
+            for path_ in query["dipinstallpath"]:
+                games[id_] = Path(path_)
+    return games
+
+
+def find_with_walker(folder: Path) -> dict[str, Path]:
+    games: dict[str, Path] = {}
+    for manifest in origin_utils.find_manifests(str(folder)):
+        for id_, path_ in origin_utils.read_manifest(manifest):
+            games[id_] = Path(path_)
+    return games
+
+
+def bench(name: str, folder: Path, fn: Callable[[Path], dict[str, Path]]):
+    start = time.perf_counter()
+    games = fn(folder)
+    elapsed = time.perf_counter() - start
+    print("{:>8}: {:.3f}s ({} games)".format(name, elapsed, len(games)))
+    return games
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        generate_local_content(folder, count)
+        print(f"{count} games")
+
+        # Warm the OS file cache:
+        bench("warm-up", folder, find_with_walker)
+
+        expected = bench("glob", folder, find_with_glob)
+        actual = bench("walker", folder, find_with_walker)
+        assert actual == expected, "walker and glob results differ"
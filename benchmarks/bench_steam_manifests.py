@@ -0,0 +1,135 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Benchmark reading the application ID and installation folder from Steam application
+manifests, with the fast path of `steam_utils` versus a full `vdf.load`.
+
+Usage: python benchmarks/bench_steam_manifests.py [number of manifests]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import vdf  # noqa: E402  # pyright: ignore[reportMissingTypeStubs]
+
+import steam_utils  # noqa: E402
+
+_MANIFEST = """"AppState"
+{{
+\t"appid"\t\t"{appid}"
+\t"universe"\t\t"1"
+\t"LauncherPath"\t\t"C:\\\\Program Files (x86)\\\\Steam\\\\steam.exe"
+\t"name"\t\t"{name}"
+\t"StateFlags"\t\t"4"
+\t"installdir"\t\t"{name}"
+\t"LastUpdated"\t\t"1700000000"
+\t"SizeOnDisk"\t\t"{size}"
+\t"StagingSize"\t\t"0"
+\t"buildid"\t\t"{buildid}"
+\t"LastOwner"\t\t"76561198000000000"
+\t"UpdateResult"\t\t"0"
+\t"BytesToDownload"\t\t"0"
+\t"BytesDownloaded"\t\t"0"
+\t"BytesToStage"\t\t"0"
+\t"BytesStaged"\t\t"0"
+\t"TargetBuildID"\t\t"0"
+\t"AutoUpdateBehavior"\t\t"0"
+\t"AllowOtherDownloadsWhileRunning"\t\t"0"
+\t"ScheduledAutoUpdate"\t\t"0"
+\t"InstalledDepots"
+\t{{
+{depots}
+\t}}
+\t"SharedDepots"
+\t{{
+\t\t"228988"\t\t"228980"
+\t}}
+\t"UserConfig"
+\t{{
+\t\t"language"\t\t"english"
+\t}}
+\t"MountedConfig"
+\t{{
+\t\t"language"\t\t"english"
+\t}}
+}}
+"""
+
+_DEPOT = """\t\t"{depot}"
+\t\t{{
+\t\t\t"manifest"\t\t"{manifest}"
+\t\t\t"size"\t\t"{size}"
+\t\t}}"""
+
+
+def generate_manifests(folder: Path, count: int) -> list[Path]:
+    rng = random.Random(42)
+    paths: list[Path] = []
+    for appid in range(10000, 10000 + count):
+        depots = "\n".join(
+            _DEPOT.format(
+                depot=appid + i + 1,
+                manifest=rng.getrandbits(63),
+                size=rng.getrandbits(32),
+            )
+            for i in range(rng.randint(1, 8))
+        )
+        path = folder.joinpath(f"appmanifest_{appid}.acf")
+        path.write_text(
+            _MANIFEST.format(
+                appid=appid,
+                name=f"Game {appid}",
+                size=rng.getrandbits(36),
+                buildid=rng.getrandbits(24),
+                depots=depots,
+            ),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def read_with_vdf(path: Path) -> list[str]:
+    with open(path, "r", encoding="utf-8") as fp:
+        app_state: dict[str, Any] = vdf.load(fp)["AppState"]  # type: ignore
+    return [app_state["appid"], app_state["installdir"]]
+
+
+def read_fast(path: Path) -> list[str]:
+    with open(path, "r", encoding="utf-8") as fp:
+        app_state = steam_utils.read_app_state(fp)
+    assert app_state is not None
+    return [app_state["appid"], app_state["installdir"]]
+
+
+def bench(name: str, paths: list[Path], fn: Callable[[Path], list[str]]):
+    start = time.perf_counter()
+    results = [fn(path) for path in paths]
+    elapsed = time.perf_counter() - start
+    print(
+        "{:>8}: {:.3f}s ({:.1f}us / manifest)".format(
+            name, elapsed, elapsed / len(paths) * 1e6
+        )
+    )
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = generate_manifests(Path(tmp_dir), count)
+        print(f"{count} manifests")
+
+        # Warm the OS file cache:
+        bench("warm-up", paths, read_fast)
+
+        expected = bench("vdf", paths, read_with_vdf)
+        actual = bench("fast", paths, read_fast)
+        assert actual == expected, "fast path and vdf results differ"
@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Report the time spent by each store scanner of `StoreDiscovery` on this machine, with
+a cold (empty) and a warm manifest cache.
+
+Usage: python benchmarks/bench_store_discovery.py
+"""
+
+import functools
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eadesktop_utils import find_games as find_eadesktop_games  # noqa: E402
+from epic_utils import find_games as find_epic_games  # noqa: E402
+from file_cache import FileCache  # noqa: E402
+from gog_utils import find_games as find_gog_games  # noqa: E402
+from origin_utils import find_games as find_origin_games  # noqa: E402
+from steam_utils import find_games as find_steam_games  # noqa: E402
+from store_discovery import StoreDiscovery  # noqa: E402
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = Path(tmp_dir, "stores.json")
+        for run in ("cold", "warm"):
+            cache = FileCache(cache_path)
+            sections = {
+                store: cache.section(store)
+                for store in ("steam", "origin", "epic", "eadesktop")
+            }
+            discovery = StoreDiscovery(
+                {
+                    "steam": functools.partial(find_steam_games, sections["steam"]),
+                    "gog": find_gog_games,
+                    "origin": functools.partial(find_origin_games, sections["origin"]),
+                    "epic": functools.partial(find_epic_games, sections["epic"]),
+                    "eadesktop": functools.partial(
+                        find_eadesktop_games, sections["eadesktop"]
+                    ),
+                },
+                timeout=None,
+            )
+            for store in discovery.stores():
+                games = discovery.games(store)
+                section = sections.get(store)
+                print(
+                    "[{}] {}: {} games in {:.3f}s{}".format(
+                        run,
+                        store,
+                        len(games),
+                        discovery.timings().get(store, 0.0),
+                        (
+                            f" ({section.hits} cached, {section.misses} parsed)"
+                            if section
+                            else ""
+                        ),
+                    )
+                )
+            cache.flush()
@@ -0,0 +1,273 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Check mod archives with the mod data checker of a game plugin, outside of MO2.
+
+Each archive is read from a listing of its content, turned into a `PathTree` and
+given to the `dataLooksValid()` of the checker. The result is printed for each
+archive, as `VALID`, `FIXABLE` or `INVALID` followed by the path of the listing.
+
+Usage:
+    python check_mod_data.py [-j JOBS] CHECKER LISTING [LISTING ...]
+
+    CHECKER is the name of a game module, e.g. `game_valheim`, optionally followed by
+    the name of the checker class in this module, e.g.
+    `game_valheim:ValheimModDataChecker`, which is required if the module defines
+    several checkers.
+
+    LISTING is either a zip archive, or a text file listing the content of an
+    archive, with one path per line (directories ending with `/`), or in the
+    technical format of `7z l -slt`.
+
+The game modules are loaded without the `__init__` of the plugin package and with
+a shim of `mobase`, where `mobase.IFileTree` and `mobase.FileTreeEntry` are
+`PathTree` and `PathTreeEntry`, and other classes are empty placeholders, so MO2 is
+not needed, but `PyQt6` and the requirements of the plugins must be installed.
+Checkers that need a running MO2 (e.g., the organizer) fail with `ERROR`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import enum
+import functools
+import importlib
+import importlib.util
+import sys
+import types
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    import mobase
+
+    from .basic_features.path_tree import PathTree
+
+# Name of the plugin package, loaded without its __init__, see _setup():
+_PACKAGE = "basic_games"
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+# Checker of the current (worker) process, see _init_worker():
+_checker: mobase.ModDataChecker | None = None
+
+
+class _Stub:
+    """Base of the placeholder classes of the mobase shim."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def _stub_attribute(owner: Any, name: str) -> type:
+    # placeholder class for a missing attribute of the mobase shim or of one of its
+    # placeholders, so that the game modules can be imported
+    if name.startswith("__"):
+        raise AttributeError(name)
+    stub = _StubType(name, (_Stub,), {})
+    setattr(owner, name, stub)
+    return stub
+
+
+class _StubType(type):
+    def __getattr__(cls, name: str) -> type:
+        return _stub_attribute(cls, name)
+
+
+class _ModDataChecker(_Stub):
+    class CheckReturn(enum.Enum):
+        INVALID = 0
+        FIXABLE = 1
+        VALID = 2
+
+    INVALID = CheckReturn.INVALID
+    FIXABLE = CheckReturn.FIXABLE
+    VALID = CheckReturn.VALID
+
+
+def _load_module(name: str, path: Path) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _setup() -> None:
+    """
+    Register the plugin package, without running its `__init__` (which needs MO2),
+    and the `mobase` shim, in the current process.
+    """
+    if _PACKAGE in sys.modules:
+        return
+
+    package = types.ModuleType(_PACKAGE)
+    package.__path__ = [str(_PACKAGE_DIR)]
+    sys.modules[_PACKAGE] = package
+
+    # path_tree does not import mobase, and is loaded before the basic_features
+    # package, which does:
+    path_tree = _load_module(
+        f"{_PACKAGE}.basic_features.path_tree",
+        _PACKAGE_DIR.joinpath("basic_features", "path_tree.py"),
+    )
+
+    shim = types.ModuleType("mobase", "Shim of mobase for check_mod_data.")
+    _ModDataChecker.__name__ = _ModDataChecker.__qualname__ = "ModDataChecker"
+    vars(shim).update(
+        IFileTree=path_tree.PathTree,
+        FileTreeEntry=path_tree.PathTreeEntry,
+        ModDataChecker=_ModDataChecker,
+        __getattr__=functools.partial(_stub_attribute, shim),
+    )
+    sys.modules["mobase"] = shim
+
+
+def read_listing(path: Path) -> list[str]:
+    """
+    Read the listing of an archive.
+
+    Args:
+        path: Path to a zip archive or to a text listing.
+
+    Returns:
+        The paths of the entries of the archive, directories ending with `/`.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return archive.namelist()
+
+    with open(path, "r", encoding="utf-8", errors="replace") as fp:
+        lines = [line.rstrip("\r\n") for line in fp]
+
+    if not any(line.startswith("Path = ") for line in lines):
+        return [line for line in lines if line.strip()]
+
+    # 7z l -slt: blocks of "Key = Value" lines, the first block describing the
+    # archive itself, then one block per entry starting with its path
+    paths: list[str] = []
+    entry: str | None = None
+    start = lines.index("----------") + 1 if "----------" in lines else 0
+    for line in lines[start:]:
+        key, _, value = line.partition(" = ")
+        if key == "Path":
+            if entry is not None:
+                paths.append(entry)
+            entry = value
+        elif entry is not None and (
+            (key == "Folder" and value == "+")
+            or (key == "Attributes" and value.startswith("D"))
+        ):
+            entry = entry.rstrip("/\\") + "/"
+    if entry is not None:
+        paths.append(entry)
+    return paths
+
+
+def load_checker(spec: str) -> mobase.ModDataChecker:
+    """
+    Create the mod data checker of a game plugin.
+
+    Args:
+        spec: Name of the game module, optionally followed by `:` and the name of
+            the checker class.
+
+    Returns:
+        An instance of the checker.
+
+    Raises:
+        ValueError: If the module does not define a single checker and no class was
+            given.
+    """
+    _setup()
+    import mobase
+
+    module_name, _, class_name = spec.partition(":")
+    module = importlib.import_module(f"{_PACKAGE}.games.{module_name}")
+
+    if class_name:
+        return getattr(module, class_name)()
+
+    checkers = [
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, mobase.ModDataChecker)
+        and obj.__module__ == module.__name__
+    ]
+    if len(checkers) != 1:
+        raise ValueError(
+            "{} defines {} mod data checkers, use {}:<class>.".format(
+                module_name, len(checkers), module_name
+            )
+        )
+    return checkers[0]()
+
+
+def _init_worker(spec: str) -> None:
+    global _checker
+    _checker = load_checker(spec)
+
+
+def _check(path: str) -> tuple[str, str]:
+    assert _checker is not None
+    tree_type: type[PathTree] = sys.modules["mobase"].IFileTree
+    try:
+        tree = tree_type.from_paths(read_listing(Path(path)))
+        status = _checker.dataLooksValid(cast("mobase.IFileTree", tree))
+    except Exception as e:
+        print(f"Failed to check {path}: {e}", file=sys.stderr)
+        return path, "ERROR"
+    return path, str(getattr(status, "name", status))
+
+
+def check_archives(
+    spec: str, paths: Iterable[str], jobs: int | None = None
+) -> Iterable[tuple[str, str]]:
+    """
+    Check archives with a process pool.
+
+    Args:
+        spec: Checker, see `load_checker()`.
+        paths: Paths to the listings of the archives.
+        jobs: Number of worker processes, the number of CPUs by default.
+
+    Returns:
+        The path and result of each archive, in the order of `paths`. The result is
+        the name of the check status, or `ERROR` if the archive could not be checked.
+    """
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(spec,)
+    ) as executor:
+        yield from executor.map(_check, paths, chunksize=16)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="check_mod_data.py",
+        description="Check mod archives with the mod data checker of a game.",
+    )
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes")
+    parser.add_argument("checker", help="game module[:checker class]")
+    parser.add_argument("listings", nargs="+", help="zip archives or text listings")
+    args = parser.parse_args(argv)
+
+    # fail early on an invalid checker, rather than in every worker:
+    try:
+        load_checker(args.checker)
+    except (ImportError, AttributeError, ValueError) as e:
+        print(f"Invalid checker {args.checker}: {e}", file=sys.stderr)
+        return 2
+
+    failed = False
+    for path, status in check_archives(args.checker, args.listings, args.jobs):
+        failed = failed or status == "ERROR"
+        print(f"{status}\t{path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
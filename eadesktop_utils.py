@@ -1,17 +1,56 @@
 # -*- encoding: utf-8 -*-
+from __future__ import annotations
 
 import configparser
 import os
 import xml.etree.ElementTree as et
+from concurrent.futures import ThreadPoolExecutor
 from configparser import NoOptionError
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
+if TYPE_CHECKING:
+    from .file_cache import FileCacheSection
 
-def find_games() -> Dict[str, Path]:
+
+# Number of installation folders read concurrently, since these are often on slow
+# drives:
+_MAX_WORKERS = 4
+
+
+def _read_content_id(installer_file: Path) -> str | None:
+    """
+    Read the content ID of a game from its `installerdata.xml` file. The file is
+    parsed incrementally, up to the first content ID.
+
+    Returns:
+        The numeric content ID of the game, or None if there is none.
+    """
+    # For all manifest files the first contentID of the contentIDs element is the
+    # numeric ID, i.e., the ".//contentIDs/contentID[1]" XPath expression. There
+    # are, in some cases, also name IDs but we do not consider these.
+    tags: list[str] = []
+    for event, element in et.iterparse(installer_file, events=("start", "end")):
+        if event == "start":
+            tags.append(element.tag)
+            continue
+
+        tags.pop()
+        if element.tag == "contentID" and len(tags) > 1 and tags[-1] == "contentIDs":
+            return element.text or None
+
+    return None
+
+
+def find_games(cache: FileCacheSection | None = None) -> Dict[str, Path]:
     """
     Find the list of EA Desktop games installed.
 
+    Args:
+        cache: Cache for the installer data files. Only files that changed since
+            they were cached are parsed. The cache is committed once all files have
+            been read.
+
     Returns:
         A mapping from EA Desktop content IDs to install locations for available
         EA Desktop games.
@@ -48,22 +87,28 @@ def find_games() -> Dict[str, Path]:
     if not install_path.exists():
         return games
 
-    for game_dir in install_path.iterdir():
+    def read_game_id(game_dir: Path) -> str | None:
         try:
             installer_file = game_dir.joinpath("__Installer", "installerdata.xml")
-            xml_tree = et.parse(installer_file)
-            root = xml_tree.getroot()
-
-            # For all manifest files the following XPath expression returns the
-            # numeric ID. There are, in some cases, also name IDs but we do not
-            # consider these.
-            content_id = root.find(".//contentIDs/contentID[1]")
-
-            if content_id is not None and content_id.text:
-                game_id = content_id.text
-                games[game_id] = game_dir
+            if cache is None:
+                return _read_content_id(installer_file)
+            else:
+                return cache.lookup(installer_file, _read_content_id)
         except FileNotFoundError:
-            pass
+            return None
+
+    game_dirs = list(install_path.iterdir())
+    with ThreadPoolExecutor(
+        max_workers=_MAX_WORKERS, thread_name_prefix="basic_games_eadesktop"
+    ) as executor:
+        for game_dir, game_id in zip(
+            game_dirs, executor.map(read_game_id, game_dirs), strict=True
+        ):
+            if game_id is not None:
+                games[game_id] = game_dir
+
+    if cache is not None:
+        cache.commit()
 
     return games
 
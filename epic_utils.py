@@ -8,9 +8,39 @@ import sys
 import winreg
 from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .file_cache import FileCacheSection
 
-def find_epic_games() -> Iterable[tuple[str, Path]]:
+
+def _read_epic_manifest(manifest_file_path: Path) -> list[str] | None:
+    """
+    Read the application name and install location from an Epic Games manifest.
+
+    Returns:
+        A `[app_name, install_location]` list, or None if the manifest could not be
+        read.
+    """
+    try:
+        with open(manifest_file_path, encoding="utf-8") as manifest_file:
+            manifest_file_data = json.load(manifest_file)
+        return [
+            manifest_file_data["AppName"],
+            manifest_file_data["InstallLocation"],
+        ]
+    except (json.JSONDecodeError, KeyError):
+        print(
+            "Unable to parse Epic Games manifest file",
+            manifest_file_path,
+            file=sys.stderr,
+        )
+        return None
+
+
+def find_epic_games(
+    cache: FileCacheSection | None = None,
+) -> Iterable[tuple[str, Path]]:
     try:
         with winreg.OpenKey(
             winreg.HKEY_LOCAL_MACHINE,
@@ -23,19 +53,13 @@ def find_epic_games() -> Iterable[tuple[str, Path]]:
     manifests_path = Path(os.path.expandvars(epic_app_data_path)).joinpath("Manifests")
     if manifests_path.exists():
         for manifest_file_path in manifests_path.glob("*.item"):
-            try:
-                with open(manifest_file_path, encoding="utf-8") as manifest_file:
-                    manifest_file_data = json.load(manifest_file)
-                yield (
-                    manifest_file_data["AppName"],
-                    Path(manifest_file_data["InstallLocation"]),
-                )
-            except (json.JSONDecodeError, KeyError):
-                print(
-                    "Unable to parse Epic Games manifest file",
-                    manifest_file_path,
-                    file=sys.stderr,
-                )
+            if cache is None:
+                game = _read_epic_manifest(manifest_file_path)
+            else:
+                game = cache.lookup(manifest_file_path, _read_epic_manifest)
+
+            if game is not None:
+                yield game[0], Path(game[1])
 
 
 def find_legendary_games() -> Iterable[tuple[str, Path]]:
@@ -61,8 +85,24 @@ def find_legendary_games() -> Iterable[tuple[str, Path]]:
             )
 
 
-def find_games() -> dict[str, Path]:
-    return dict(itertools.chain(find_epic_games(), find_legendary_games()))
+def find_games(cache: FileCacheSection | None = None) -> dict[str, Path]:
+    """
+    Find the list of Epic Games (and Legendary) games installed.
+
+    Args:
+        cache: Cache for the Epic Games manifests. Only manifests that changed since
+            they were cached are parsed. The cache is committed once all manifests
+            have been read.
+
+    Returns:
+        A mapping from Epic Games application name to install locations.
+    """
+    games = dict(itertools.chain(find_epic_games(cache), find_legendary_games()))
+
+    if cache is not None:
+        cache.commit()
+
+    return games
 
 
 if __name__ == "__main__":
@@ -0,0 +1,183 @@
+# -*- encoding: utf-8 -*-
+
+import json
+import os
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+# Version of the cache file format, bump to invalidate all existing caches:
+_FORMAT_VERSION = 1
+
+_T = TypeVar("_T")
+
+# Entries of a section, path -> [size, mtime (ns), value]:
+_Entries = dict[str, list[Any]]
+
+
+class FileCacheSection:
+    """
+    Section of a `FileCache`, mapping file paths to values computed from these files.
+
+    Each entry is stored with the size and modification time of the file it was
+    computed from, and is only reused if both are unchanged. Values can be looked up
+    from multiple threads.
+    """
+
+    # Number of values retrieved from the cache / recomputed:
+    hits: int
+    misses: int
+
+    def __init__(self, cache: "FileCache", name: str, entries: _Entries):
+        self._cache = cache
+        self._name = name
+        self._entries = entries
+        self._seen: _Entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: Path, compute: Callable[[Path], _T]) -> _T:
+        """
+        Retrieve the value for the given file from the cache, or compute it if the
+        file is not in the cache or changed since the value was cached.
+
+        Args:
+            path: Path to the file.
+            compute: Function computing the value from the file. The value must be
+                JSON serializable.
+
+        Returns:
+            The (cached or computed) value for the file.
+        """
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute(path)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            with self._lock:
+                self.hits += 1
+                self._seen[key] = entry
+            return entry[2]
+
+        value = compute(path)
+        with self._lock:
+            self.misses += 1
+            self._seen[key] = [st.st_size, st.st_mtime_ns, value]
+        return value
+
+    def commit(self):
+        """
+        Replace the content of this section by the entries looked up since its
+        creation, dropping entries for files that were not looked up. The cache is
+        only saved by `FileCache.flush()`.
+        """
+        self._entries = self._seen
+        self._seen = {}
+        self._cache.update(self._name, self._entries)
+
+
+class FileCache:
+    """
+    Persistent cache of values computed from files, stored as a single JSON file.
+
+    The cache is split into named sections (e.g., one per store) that can be updated
+    independently, from different threads. The file is only written by `flush()`,
+    once for all the sections committed since the last flush.
+    """
+
+    def __init__(self, path: Path | None, version: int = 1):
+        """
+        Args:
+            path: Path to the cache file, or None for an in-memory cache.
+            version: Version of the cached values, a cache file with a different
+                version is discarded.
+        """
+        self._path = path
+        self._version = version
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._sections = self._load()
+
+    def _load(self) -> dict[str, _Entries]:
+        if self._path is None:
+            return {}
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as fp:
+                content: object = json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f'Unable to read cache file "{self._path}": {e}', file=sys.stderr)
+            return {}
+
+        if not isinstance(content, dict):
+            return {}
+
+        content = cast(dict[str, object], content)
+        if (
+            content.get("format") != _FORMAT_VERSION
+            or content.get("version") != self._version
+        ):
+            return {}
+
+        sections = content.get("sections")
+        return cast(dict[str, _Entries], sections) if isinstance(sections, dict) else {}
+
+    def section(self, name: str) -> FileCacheSection:
+        """
+        Args:
+            name: Name of the section.
+
+        Returns:
+            A new view on the given section of the cache.
+        """
+        with self._lock:
+            return FileCacheSection(self, name, dict(self._sections.get(name, {})))
+
+    def update(self, name: str, entries: _Entries):
+        """
+        Replace the entries of a section, see `flush()` to save them.
+
+        Args:
+            name: Name of the section.
+            entries: New entries for the section.
+        """
+        with self._lock:
+            self._sections[name] = entries
+            self._dirty = True
+
+    def flush(self):
+        """
+        Save the cache, if any section was updated since it was last saved.
+        """
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def _save(self):
+        if self._path is None:
+            return
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(self._path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(
+                    {
+                        "format": _FORMAT_VERSION,
+                        "version": self._version,
+                        "sections": self._sections,
+                    },
+                    fp,
+                )
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            print(f'Unable to write cache file "{self._path}": {e}', file=sys.stderr)
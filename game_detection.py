@@ -0,0 +1,135 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .basic_game import BasicGame
+
+# Stores, in the order they are checked when detecting a game:
+STORES = ("steam", "gog", "origin", "epic", "eadesktop")
+
+
+class GameDetection:
+    """
+    Detect the installation of many game plugins at once.
+
+    An inverted index from store ID to the plugins (and option index) declaring
+    this ID is built once for all the plugins. The installations discovered for a
+    store are then resolved for every plugin in a single pass, the first time a
+    plugin needs this store (and again later if the discovery of the store was not
+    finished). The time spent detecting each plugin is recorded and available
+    through `timings()`.
+    """
+
+    # Inverted index, store -> store ID -> (game, option index):
+    _index: dict[str, dict[str, list[tuple[BasicGame, int]]]]
+
+    # Resolved installations, store -> id(game) -> (option index, path):
+    _resolved: dict[str, dict[int, tuple[int, Path]]]
+
+    # Time spent detecting each game, by plugin name:
+    _timings: dict[str, float]
+
+    def __init__(
+        self,
+        games: Iterable[BasicGame],
+        store_games: Callable[[str], Mapping[str, Path]],
+        store_done: Callable[[str], bool] = lambda store: True,
+    ):
+        """
+        Args:
+            games: Game plugins to detect.
+            store_games: Function returning the games installed from a given store,
+                as a mapping from store ID to install location.
+            store_done: Function checking if the discovery of a given store has
+                finished, the installations of a store are only kept once it has.
+        """
+        self._games = list(games)
+        self._store_games = store_games
+        self._store_done = store_done
+        self._lock = threading.Lock()
+        self._resolved = {}
+        self._timings = {}
+
+        self._index = {store: {} for store in STORES}
+        for game in self._games:
+            for store in STORES:
+                for option, store_id in enumerate(game.store_ids(store)):
+                    self._index[store].setdefault(store_id, []).append((game, option))
+
+        self._handled = {id(game) for game in self._games}
+
+    def handles(self, game: BasicGame) -> bool:
+        """
+        Args:
+            game: A game plugin.
+
+        Returns:
+            True if the given game is part of this detection, False otherwise.
+        """
+        return id(game) in self._handled
+
+    def _resolve(self, store: str) -> dict[int, tuple[int, Path]]:
+        with self._lock:
+            if store in self._resolved:
+                return self._resolved[store]
+
+        # checked before waiting, so that an empty result from a timeout is not kept
+        # if the discovery finishes in the meantime:
+        done = self._store_done(store)
+
+        # wait without the lock, so that other stores can be resolved meanwhile:
+        games = self._store_games(store)
+
+        resolved: dict[int, tuple[int, Path]] = {}
+        index = self._index[store]
+        for store_id, path in games.items():
+            for game, option in index.get(store_id, []):
+                current = resolved.get(id(game))
+                if current is None or option < current[0]:
+                    resolved[id(game)] = (option, path)
+
+        if done:
+            with self._lock:
+                resolved = self._resolved.setdefault(store, resolved)
+        return resolved
+
+    def install_path(self, game: BasicGame) -> Path | None:
+        """
+        Retrieve the install location of the given game, only waiting for the
+        discovery of the stores the game declares IDs for.
+
+        Args:
+            game: A game plugin handled by this detection.
+
+        Returns:
+            The install location of the game from the first store (in `STORES`
+            order) it is installed from, or None if the game is not installed.
+        """
+        start = time.perf_counter()
+        path: Path | None = None
+        for store in STORES:
+            if not game.store_ids(store):
+                continue
+            if (resolved := self._resolve(store).get(id(game))) is not None:
+                path = resolved[1]
+                break
+
+        with self._lock:
+            self._timings[game.name()] = time.perf_counter() - start
+        return path
+
+    def timings(self) -> dict[str, float]:
+        """
+        Returns:
+            The time (in seconds) spent by the last detection of each game, by plugin
+            name, including the wait for the discovery of its stores.
+        """
+        with self._lock:
+            return dict(self._timings)
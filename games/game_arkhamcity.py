@@ -1,7 +1,7 @@
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo
 
-from ..basic_features import BasicLocalSavegames
+from ..basic_features import BasicLocalSavegames, cached_check
 from ..basic_game import BasicGame
 from ..steam_utils import find_steam_path
 
@@ -19,6 +19,7 @@ class ArkhamCityModDataChecker(mobase.ModDataChecker):
             "splash",
         ]
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -4,15 +4,20 @@ import struct
 import time
 from collections.abc import Mapping
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir, QFile, QFileInfo
 
-from ..basic_features import BasicLocalSavegames
+from ..basic_features import (
+    BasicLocalSavegames,
+    FixPlan,
+    cached_check,
+    cached_save_metadata,
+)
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
     format_date,
 )
 from ..basic_game import BasicGame
@@ -98,24 +103,22 @@ class BlackAndWhite2ModDataChecker(mobase.ModDataChecker):
     _fileIgnore = ["readme", "read me", "meta.ini", "thumbs.db", "backup", ".png"]
 
     def fix(self, filetree: mobase.IFileTree):
-        toMove: list[tuple[mobase.FileTreeEntry, str]] = []
+        plan = FixPlan(mobase.IFileTree.MERGE)
         for entry in filetree:
             if any([sub in entry.name().casefold() for sub in self._fileIgnore]):
                 continue
             elif entry.suffix() == "chl":
-                toMove.append((entry, "/Scripts/BW2/"))
+                plan.move(entry, "/Scripts/BW2/")
             elif entry.suffix() == "bmp":
-                toMove.append((entry, "/Data/"))
+                plan.move(entry, "/Data/")
             elif entry.suffix() == "txt":
-                toMove.append((entry, "/Scripts/"))
+                plan.move(entry, "/Scripts/")
             else:
-                toMove.append((entry, "/Data/landscape/BW2/"))
-
-        for entry, path in toMove:
-            filetree.move(entry, path, policy=mobase.IFileTree.MERGE)
+                plan.move(entry, "/Data/landscape/BW2/")
 
-        return filetree
+        return plan.apply(filetree)
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -161,7 +164,7 @@ class BlackAndWhite2ModDataChecker(mobase.ModDataChecker):
             return mobase.ModDataChecker.VALID
 
 
-class BlackAndWhite2SaveGame(BasicGameSaveGame):
+class BlackAndWhite2SaveGame(LazyBasicGameSaveGame):
     _saveInfLayout = {
         "start": [0x00000000, 0x00000004],
         "name": [0x00000004, 0x0000002C],
@@ -174,33 +177,52 @@ class BlackAndWhite2SaveGame(BasicGameSaveGame):
     }
 
     def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self._filepath = Path(filepath)
-        self.name: str = ""
-        self.land: int = -1
-        self.elapsed: int = 0
-        self.lastsave: int = 0
-        with open(self._filepath.joinpath("SaveGame.inf"), "rb") as info:
-            # Name embedded in "SaveGame.inf" with UTF-16 encoding
-            self.name = self.readInf(info, "name").decode("utf-16")
-            # Land number embedded in "SaveGame.inf" as an int written in binary
-            self.land = int.from_bytes(self.readInf(info, "land"), "little")
-            # Getting elapsed time in second
-            self.elapsed = int.from_bytes(self.readInf(info, "elapsed"), "little")
-            # Getting date in 100th of nanosecond need to convert NT time
-            # to UNIX time and offset localtime
-            self.lastsave = int(
-                (
-                    struct.unpack("q", self.readInf(info, "date"))[0] / 10000
+        super().__init__(Path(filepath))
+
+    def parse(self) -> dict[str, Any]:
+        return self.readSaveMetadata(self._filepath.joinpath("SaveGame.inf"))
+
+    @property
+    def name(self) -> str:
+        return self.metadata.get("name", "")
+
+    @property
+    def land(self) -> int:
+        return self.metadata.get("land", -1)
+
+    @property
+    def elapsed(self) -> int:
+        return self.metadata.get("elapsed", 0)
+
+    @property
+    def lastsave(self) -> int:
+        # offset localtime (not cached, since it changes with DST)
+        return self.metadata.get("lastsave", 0) - (time.localtime().tm_gmtoff * 1000)
+
+    @staticmethod
+    @cached_save_metadata("blackandwhite2")
+    def readSaveMetadata(path: Path) -> dict[str, Any]:
+        readInf = BlackAndWhite2SaveGame.readInf
+        with open(path, "rb") as info:
+            return {
+                # Name embedded in "SaveGame.inf" with UTF-16 encoding
+                "name": readInf(info, "name").decode("utf-16"),
+                # Land number embedded in "SaveGame.inf" as an int written in binary
+                "land": int.from_bytes(readInf(info, "land"), "little"),
+                # Getting elapsed time in second
+                "elapsed": int.from_bytes(readInf(info, "elapsed"), "little"),
+                # Getting date in 100th of nanosecond need to convert NT time
+                # to UNIX time
+                "lastsave": int(
+                    struct.unpack("q", readInf(info, "date"))[0] / 10000
                     - 11644473600000
-                )
-                - (time.localtime().tm_gmtoff * 1000)
-            )
-            info.close()
+                ),
+            }
 
-    def readInf(self, inf: BinaryIO, key: str):
-        inf.seek(self._saveInfLayout[key][0])
-        return inf.read(self._saveInfLayout[key][1] - self._saveInfLayout[key][0])
+    @classmethod
+    def readInf(cls, inf: BinaryIO, key: str):
+        inf.seek(cls._saveInfLayout[key][0])
+        return inf.read(cls._saveInfLayout[key][1] - cls._saveInfLayout[key][0])
 
     def allFiles(self) -> list[str]:
         files = [str(file) for file in self._filepath.glob("./*")]
@@ -251,6 +273,7 @@ class BlackAndWhite2Game(BasicGame):
     GameBinary = "white.exe"
     GameDocumentsDirectory = "%DOCUMENTS%/Black & White 2"
     GameSavesDirectory = "%GAME_DOCUMENTS%/Profiles"
+    GameSaveParseWorkers = 0
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-Black-&-White-2"
@@ -322,7 +345,7 @@ class BlackAndWhite2Game(BasicGame):
 
             profiles.append(path)
 
-        return [BlackAndWhite2SaveGame(path) for path in profiles]
+        return self.parse_saves([BlackAndWhite2SaveGame(path) for path in profiles])
 
 
 class BOTGGame(BlackAndWhite2Game):
@@ -1,61 +1,68 @@
 import json
 from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir
 
+from ..basic_features import cached_save_metadata, scan_saves
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
     format_date,
 )
 from ..basic_game import BasicGame
 
 
-class BaSSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        with open(self._filepath, "rb") as save:
-            save_data = json.load(save)
-        self._gameMode = save_data["mode"]["saveData"]["gameModeId"]
-        self._gender = (
+@cached_save_metadata("bladeandsorcery")
+def bas_read_save(filepath: Path) -> dict[str, Any]:
+    with open(filepath, "rb") as save:
+        save_data = json.load(save)
+    return {
+        "gameMode": save_data["mode"]["saveData"]["gameModeId"],
+        "gender": (
             "Male"
             if save_data["customization"]["creatureId"] == "PlayerDefaultMale"
             else "Female"
-        )
-        self._ethnicity = save_data["customization"]["ethnicGroupId"]
-        h, m, s = save_data["playTime"].split(":")
-        self._elapsed = (float(h), int(m), float(s))
-        f_stat = self._filepath.stat()
-        self._created = f_stat.st_birthtime
-        self._modified = f_stat.st_mtime
+        ),
+        "ethnicity": save_data["customization"]["ethnicGroupId"],
+        "playTime": save_data["playTime"],
+    }
+
+
+class BaSSaveGame(LazyBasicGameSaveGame):
+    def parse(self) -> dict[str, Any]:
+        return bas_read_save(self._filepath)
 
     def getName(self) -> str:
-        return f"{self.getPlayerSlug()} - {self._gameMode}"
+        if not self.metadata:
+            return super().getName()
+        return f"{self.getPlayerSlug()} - {self.getGameMode()}"
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._created))
+        f_stat = self._stat or self._filepath.stat()
+        return QDateTime.fromSecsSinceEpoch(int(f_stat.st_birthtime))
 
     def getModifiedTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._modified))
+        f_stat = self._stat or self._filepath.stat()
+        return QDateTime.fromSecsSinceEpoch(int(f_stat.st_mtime))
 
     def getPlayerSlug(self) -> str:
-        return f"{self._gender} {self._ethnicity}"
+        return f"{self.metadata['gender']} {self.metadata['ethnicity']}"
 
     def getElapsed(self) -> str:
-        return (
-            f"{self._elapsed[0]} hours, "
-            f"{self._elapsed[1]} minutes, "
-            f"{int(self._elapsed[2])} seconds"
-        )
+        h, m, s = self.metadata["playTime"].split(":")
+        return f"{float(h)} hours, {int(m)} minutes, {int(float(s))} seconds"
 
     def getGameMode(self) -> str:
-        return self._gameMode
+        return self.metadata["gameMode"]
 
 
-def bas_parse_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
+def bas_parse_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str] | None:
     assert isinstance(save, BaSSaveGame)
+    if not save.metadata:
+        return None
     return {
         "Character": save.getPlayerSlug(),
         "Game Mode": save.getGameMode(),
@@ -77,6 +84,7 @@ class BaSGame(BasicGame):
     GameDocumentsDirectory = "%DOCUMENTS%/My Games/BladeAndSorcery"
     GameSavesDirectory = "%GAME_DOCUMENTS%/Saves/Default"
     GameSaveExtension = "chr"
+    GameSaveParseWorkers = 0
     GameSteamId = 629730
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
@@ -92,6 +100,9 @@ class BaSGame(BasicGame):
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
-        return [
-            BaSSaveGame(path) for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        return self.parse_saves(
+            [
+                BaSSaveGame(path, stat)
+                for path, stat in scan_saves(folder.absolutePath(), f"*.{ext}")
+            ]
+        )
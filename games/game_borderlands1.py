@@ -3,11 +3,10 @@ import re
 import mobase
 from mobase import FileTreeEntry, IFileTree, ModDataChecker
 
-from ..basic_features import BasicModDataChecker
+from ..basic_features import BasicModDataChecker, GlobPatterns, cached_check
 from ..basic_game import BasicGame
 
 _extention_pattern = re.compile("\\.(upk|umap|u|int|dll|exe)$", re.I)
-_mapslot_pattern = re.compile("^Mapslot\\d\\d?\\.umap$", re.I)
 
 _mod_dirs = {
     "Binaries".casefold(): "/",
@@ -20,28 +19,6 @@ _mod_dirs = {
 _slots_path = "WillowGame/CookedPC/Maps/MapSlots"
 
 
-def _check_filetree(
-    filetree: IFileTree | FileTreeEntry, recurse: bool
-) -> ModDataChecker.CheckReturn:
-    if filetree.isFile():
-        if _extention_pattern.search(filetree.name()):
-            if _mapslot_pattern.search(filetree.name()):
-                return ModDataChecker.FIXABLE
-            else:
-                return ModDataChecker.INVALID
-    elif recurse and isinstance(filetree, IFileTree):
-        status = ModDataChecker.VALID
-        for child in filetree:
-            child_status = _check_filetree(child, True)
-            if child_status is ModDataChecker.INVALID:
-                return ModDataChecker.INVALID
-            elif child_status is ModDataChecker.FIXABLE:
-                status = ModDataChecker.FIXABLE
-        return status
-
-    return ModDataChecker.VALID
-
-
 def _get_nest(filetree: IFileTree) -> IFileTree | None:
     children = tuple(filetree)
     if (
@@ -54,27 +31,30 @@ def _get_nest(filetree: IFileTree) -> IFileTree | None:
     return None
 
 
-def _get_slotstree(roottree: IFileTree) -> IFileTree:
-    slotstree: IFileTree | None = roottree.find(_slots_path)  # type: ignore
-    if slotstree is None:
-        slotstree = roottree.addDirectory(_slots_path)
-    return slotstree
-
-
-def _fix_mapslots(filetree: IFileTree, roottree: IFileTree) -> None:
-    for child in filetree:
-        if child.isDir() and isinstance(child, IFileTree):
-            _fix_mapslots(child, roottree)
-        elif _mapslot_pattern.search(child.name()):
-            child.moveTo(_get_slotstree(roottree))
-
-
 class Borderlands1ModDataChecker(BasicModDataChecker):
+    def __init__(self):
+        super().__init__(
+            GlobPatterns(
+                valid=["Binaries", "WillowGame"],
+                move={
+                    "CookedPC": "WillowGame/",
+                    "Localization": "WillowGame/",
+                    "Maps": "WillowGame/CookedPC/",
+                    # map slots, at any depth in the other folders:
+                    "**/Mapslot[0-9].umap": f"{_slots_path}/",
+                    "**/Mapslot[0-9][0-9].umap": f"{_slots_path}/",
+                },
+            )
+        )
+
     def dataLooksValid(self, filetree: IFileTree) -> ModDataChecker.CheckReturn:
         parent = filetree.parent()
         if parent is not None:
             return self.dataLooksValid(parent)
+        return self._check_root(filetree)
 
+    @cached_check(depth=None)
+    def _check_root(self, filetree: IFileTree) -> ModDataChecker.CheckReturn:
         status = ModDataChecker.VALID
 
         nest = _get_nest(filetree)
@@ -82,29 +62,24 @@ class Borderlands1ModDataChecker(BasicModDataChecker):
             status = ModDataChecker.FIXABLE
             filetree = nest
 
-        if _check_filetree(filetree, False) is ModDataChecker.INVALID:
-            return ModDataChecker.INVALID
-
         slotstree = filetree.find(_slots_path)
         if slotstree is not None and not slotstree.isDir():
             return ModDataChecker.INVALID
 
-        for child in filetree:
-            if child.isDir():
-                destination = _mod_dirs.get(child.name().casefold())
-                if destination is None:
-                    child_status = _check_filetree(child, True)
-                    if child_status is ModDataChecker.INVALID:
-                        return ModDataChecker.INVALID
-                    elif child_status is ModDataChecker.FIXABLE:
-                        status = ModDataChecker.FIXABLE
-                elif destination != "/":
-                    status = ModDataChecker.FIXABLE
-            elif _mapslot_pattern.search(child.name()):
-                status = ModDataChecker.FIXABLE
-            elif _extention_pattern.search(child.name()):
-                return ModDataChecker.INVALID
-        return status
+        if len(filetree) == 0:
+            return status
+
+        check_return = super().dataLooksValid(filetree)
+        if check_return is ModDataChecker.VALID:
+            return status
+        return check_return
+
+    def check_unmatched(self, entry: FileTreeEntry) -> ModDataChecker.CheckReturn:
+        # the other folders are explored through the map slot patterns, where only
+        # unreal packages and binaries are invalid
+        if entry.isFile() and _extention_pattern.search(entry.name()):
+            return ModDataChecker.INVALID
+        return ModDataChecker.VALID
 
     def fix(self, filetree: IFileTree) -> IFileTree:
         nest = _get_nest(filetree)
@@ -118,17 +93,7 @@ class Borderlands1ModDataChecker(BasicModDataChecker):
             if conflict is not None:
                 conflict.moveTo(filetree)
 
-        for child in tuple(filetree):
-            if child.isDir() and isinstance(child, IFileTree):
-                destination = _mod_dirs.get(child.name().casefold())
-                if destination is None:
-                    _fix_mapslots(child, filetree)
-                elif destination != "/":
-                    filetree.move(child, destination)
-            elif _mapslot_pattern.search(child.name()):
-                child.moveTo(_get_slotstree(filetree))
-
-        return filetree
+        return super().fix(filetree)
 
 
 class Borderlands1Game(BasicGame):
@@ -1,5 +1,6 @@
 import filecmp
 import json
+import os
 import re
 import shutil
 import tempfile
@@ -20,10 +21,16 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from ..basic_features import BasicLocalSavegames, BasicModDataChecker, GlobPatterns
+from ..basic_features import (
+    BasicLocalSavegames,
+    BasicModDataChecker,
+    GlobPatterns,
+    cached_save_metadata,
+    iter_saves,
+)
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
     format_date,
 )
 from ..basic_game import BasicGame
@@ -57,48 +64,76 @@ def time_from_seconds(s: int | float) -> str:
     return f"{h:02}:{m:02}:{s:02}"
 
 
+@cached_save_metadata("cyberpunk2077")
+def read_cyberpunk_save_metadata(metadata_file: Path) -> dict[str, Any]:
+    """Read the fields used by `parse_cyberpunk_save_metadata` (the file is large)."""
+    with open(metadata_file) as file:
+        meta_data = json.load(file)["Data"]["metadata"]
+    return {
+        key: meta_data[key]
+        for key in (
+            "name",
+            "timestampString",
+            "playthroughTime",
+            "trackedQuestEntry",
+            "level",
+            "streetCred",
+            "lifePath",
+            "difficulty",
+            "bodyGender",
+            "brainGender",
+            "buildPatch",
+        )
+    }
+
+
 def parse_cyberpunk_save_metadata(save_path: Path, save: mobase.ISaveGame):
     metadata_file = save_path / "metadata.9.json"
     try:
-        with open(metadata_file) as file:
-            meta_data = json.load(file)["Data"]["metadata"]
-            name = meta_data["name"]
-            if name != (save_name := save.getName()):
-                name = f"{save_name}  ({name})"
-            return {
-                "Name": name,
-                "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
-                "Play Time": time_from_seconds(meta_data["playthroughTime"]),
-                "Quest": meta_data["trackedQuestEntry"],
-                "Level": int(meta_data["level"]),
-                "Street Cred": int(meta_data["streetCred"]),
-                "Life Path": meta_data["lifePath"],
-                "Difficulty": meta_data["difficulty"],
-                "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
-                "Game version": meta_data["buildPatch"],
-            }
+        meta_data = read_cyberpunk_save_metadata(metadata_file)
+        name = meta_data["name"]
+        if name != (save_name := save.getName()):
+            name = f"{save_name}  ({name})"
+        return {
+            "Name": name,
+            "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
+            "Play Time": time_from_seconds(meta_data["playthroughTime"]),
+            "Quest": meta_data["trackedQuestEntry"],
+            "Level": int(meta_data["level"]),
+            "Street Cred": int(meta_data["streetCred"]),
+            "Life Path": meta_data["lifePath"],
+            "Difficulty": meta_data["difficulty"],
+            "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
+            "Game version": meta_data["buildPatch"],
+        }
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
 
-class CyberpunkSaveGame(BasicGameSaveGame):
+class CyberpunkSaveGame(LazyBasicGameSaveGame):
     _name_file = "NamedSave.txt"  # from mod: Named Saves
 
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        """
+        Args:
+            filepath: Path to the save folder.
+            stat (optional): `stat()` result of the `sav.dat` file of the save.
+        """
+        super().__init__(filepath, stat)
+
+    def parse(self) -> dict[str, Any]:
         try:  # Custom name from Named Saves
-            with open(filepath / self._name_file) as file:
-                self._name = file.readline()
+            with open(self._filepath / self._name_file) as file:
+                return {"name": file.readline()}
         except FileNotFoundError:
-            self._name = ""
+            return {"name": ""}
 
     def getName(self) -> str:
-        return self._name or super().getName()
+        return self.metadata.get("name") or super().getName()
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(
-            int((self._filepath / "sav.dat").stat().st_mtime)
-        )
+        stat = self._stat or (self._filepath / "sav.dat").stat()
+        return QDateTime.fromSecsSinceEpoch(int(stat.st_mtime))
 
 
 @dataclass
@@ -205,6 +240,7 @@ class Cyberpunk2077Game(BasicGame):
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-Cyberpunk-2077"
     )
+    GameMaxListedSaves = 0
 
     # CET and RED4ext, relative to Cyberpunk2077.exe
     _forced_libraries = ["version.dll", "winmm.dll"]
@@ -351,12 +387,15 @@ class Cyberpunk2077Game(BasicGame):
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
         return [
-            CyberpunkSaveGame(path.parent)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
+            CyberpunkSaveGame(path.parent, stat)
+            for path, stat in self.limit_saves(
+                iter_saves(folder.absolutePath(), f"*.{ext}", min_depth=1, max_depth=1)
+            )
         ]
 
     def settings(self) -> list[mobase.PluginSetting]:
         return [
+            *super().settings(),
             mobase.PluginSetting(
                 "skipStartScreen",
                 (
@@ -1,5 +1,6 @@
 import mobase
 
+from ..basic_features import cached_check
 from ..basic_game import BasicGame
 
 
@@ -24,6 +25,7 @@ class DaggerfallUnityModDataChecker(mobase.ModDataChecker):
             "aa",
         ]
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -1,10 +1,13 @@
 import json
 from pathlib import Path
+from typing import Any
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
 
-from ..basic_game import BasicGame, BasicGameSaveGame
+from ..basic_features import cached_check, cached_save_metadata
+from ..basic_features.basic_save_game_info import LazyBasicGameSaveGame
+from ..basic_game import BasicGame
 from ..steam_utils import find_steam_path
 
 
@@ -47,6 +50,7 @@ class DarkestDungeonModDataChecker(mobase.ModDataChecker):
             "video",
         ]
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -58,15 +62,18 @@ class DarkestDungeonModDataChecker(mobase.ModDataChecker):
         return mobase.ModDataChecker.INVALID
 
 
-class DarkestDungeonSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        dataPath = filepath.joinpath("persist.game.json")
-        self.name: str = ""
-        if self.isBinary(dataPath):
-            self.loadBinarySaveFile(dataPath)
+class DarkestDungeonSaveGame(LazyBasicGameSaveGame):
+    def parse(self) -> dict[str, Any]:
+        return self.readSaveMetadata(self._filepath.joinpath("persist.game.json"))
+
+    @staticmethod
+    @cached_save_metadata("darkestdungeon")
+    def readSaveMetadata(dataPath: Path) -> dict[str, Any]:
+        if DarkestDungeonSaveGame.isBinary(dataPath):
+            name = DarkestDungeonSaveGame.loadBinarySaveFile(dataPath)
         else:
-            self.loadJSONSaveFile(dataPath)
+            name = DarkestDungeonSaveGame.loadJSONSaveFile(dataPath)
+        return {"name": name}
 
     @staticmethod
     def isBinary(dataPath: Path) -> bool:
@@ -75,13 +82,15 @@ class DarkestDungeonSaveGame(BasicGameSaveGame):
             # magic number in binary save files
             return magic == b"\x01\xb1\x00\x00"
 
-    def loadJSONSaveFile(self, dataPath: Path):
+    @staticmethod
+    def loadJSONSaveFile(dataPath: Path) -> str:
         text = dataPath.read_text()
         content = json.loads(text)
         data = content["data"]
-        self.name = str(data["estatename"])
+        return str(data["estatename"])
 
-    def loadBinarySaveFile(self, dataPath: Path):
+    @staticmethod
+    def loadBinarySaveFile(dataPath: Path) -> str:
         # see https://github.com/robojumper/DarkestDungeonSaveEditor
         with dataPath.open(mode="rb") as fp:
             # read Header
@@ -146,8 +155,12 @@ class DarkestDungeonSaveGame(BasicGameSaveGame):
                 valueLength = int.from_bytes(fp.read(4), "little")
                 valueBytes = fp.read(valueLength - 1)
                 value = bytes.decode(valueBytes, "utf-8")
-                self.name = value
-                break
+                return value
+        return ""
+
+    @property
+    def name(self) -> str:
+        return self.metadata.get("name", "")
 
     def getName(self) -> str:
         if self.name == "":
@@ -166,6 +179,7 @@ class DarkestDungeonGame(BasicGame):
     GameNexusId = 804
     GameSteamId = 262060
     GameGogId = 1719198803
+    GameSaveParseWorkers = 0
     GameBinary = "_windowsnosteam//darkest.exe"
     GameDataPath = ""
     GameSupportURL = (
@@ -233,4 +247,4 @@ class DarkestDungeonGame(BasicGame):
                 continue
             profiles.append(path)
 
-        return [DarkestDungeonSaveGame(path) for path in profiles]
+        return self.parse_saves([DarkestDungeonSaveGame(path) for path in profiles])
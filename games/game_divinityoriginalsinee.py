@@ -5,7 +5,7 @@ from pathlib import Path
 
 import mobase
 
-from ..basic_features import BasicGameSaveGameInfo
+from ..basic_features import BasicGameSaveGameInfo, cached_check
 from ..basic_game import BasicGame
 
 
@@ -13,6 +13,7 @@ class DivinityOriginalSinEnhancedEditionModDataChecker(mobase.ModDataChecker):
     def __init__(self):
         super().__init__()
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -1,6 +1,7 @@
 import mobase
 from PyQt6.QtCore import QFileInfo
 
+from ..basic_features import FixPlan, cached_check
 from ..basic_game import BasicGame
 
 
@@ -23,6 +24,7 @@ class DungeonSiegeIIModDataChecker(mobase.ModDataChecker):
 
         return ress, maps
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -40,15 +42,12 @@ class DungeonSiegeIIModDataChecker(mobase.ModDataChecker):
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
         ress, maps = self.get_resources_and_maps(filetree)
 
-        if ress:
-            rfolder = filetree.addDirectory("Resources")
-            for r in ress:
-                rfolder.insert(r, mobase.IFileTree.REPLACE)
-        if maps:
-            rfolder = filetree.addDirectory("Maps")
-            for r in maps:
-                rfolder.insert(r, mobase.IFileTree.REPLACE)
-        return filetree
+        plan = FixPlan(mobase.IFileTree.REPLACE)
+        for r in ress:
+            plan.move(r, "Resources/")
+        for r in maps:
+            plan.move(r, "Maps/")
+        return plan.apply(filetree)
 
 
 class DungeonSiegeIIGame(BasicGame):
@@ -4,6 +4,7 @@ from pathlib import Path
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo
 
+from ..basic_features import cached_check
 from ..basic_game import BasicGame
 
 
@@ -11,6 +12,7 @@ class GTA3DefinitiveEditionModDataChecker(mobase.ModDataChecker):
     def __init__(self):
         super().__init__()
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
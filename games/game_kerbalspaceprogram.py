@@ -3,7 +3,7 @@ from pathlib import Path
 import mobase
 from PyQt6.QtCore import QDir
 
-from ..basic_features import BasicGameSaveGameInfo
+from ..basic_features import BasicGameSaveGameInfo, scan_saves
 from ..basic_features.basic_save_game_info import BasicGameSaveGame
 from ..basic_game import BasicGame
 
@@ -55,6 +55,8 @@ class KerbalSpaceProgramGame(BasicGame):
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
         return [
-            KerbalSpaceProgramSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*/*.{ext}")
+            KerbalSpaceProgramSaveGame(path, stat)
+            for path, stat in scan_saves(
+                folder.absolutePath(), f"*.{ext}", min_depth=1, max_depth=1
+            )
         ]
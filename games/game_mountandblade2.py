@@ -1,6 +1,7 @@
 import mobase
 from PyQt6.QtCore import QFileInfo
 
+from ..basic_features import cached_check
 from ..basic_game import BasicGame
 
 
@@ -16,6 +17,7 @@ class MountAndBladeIIModDataChecker(mobase.ModDataChecker):
     def __init__(self):
         super().__init__()
 
+    @cached_check(depth=2)
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
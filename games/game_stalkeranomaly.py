@@ -1,13 +1,21 @@
 from enum import IntEnum
 from pathlib import Path
+from typing import Any
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo, Qt
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from ..basic_features import (
+    FixPlan,
+    ModTreeSummary,
+    cached_check,
+    cached_save_metadata,
+    scan_saves,
+)
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
 )
 from ..basic_game import BasicGame
 from .stalkeranomaly import XRSave
@@ -39,6 +47,7 @@ class StalkerAnomalyModDataChecker(mobase.ModDataChecker):
 
         return lost_db
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -51,13 +60,10 @@ class StalkerAnomalyModDataChecker(mobase.ModDataChecker):
         return mobase.ModDataChecker.INVALID
 
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
-        lost_db = self.findLostData(filetree)
-        if lost_db:
-            rfolder = filetree.addDirectory("db").addDirectory("mods")
-            for r in lost_db:
-                rfolder.insert(r, mobase.IFileTree.REPLACE)
-
-        return filetree
+        plan = FixPlan(mobase.IFileTree.REPLACE)
+        for r in self.findLostData(filetree):
+            plan.move(r, "db/mods/")
+        return plan.apply(filetree)
 
 
 class Content(IntEnum):
@@ -71,8 +77,6 @@ class Content(IntEnum):
 
 
 class StalkerAnomalyModDataContent(mobase.ModDataContent):
-    content: list[int] = []
-
     def getAllContents(self) -> list[mobase.ModDataContent.Content]:
         return [
             mobase.ModDataContent.Content(
@@ -96,54 +100,69 @@ class StalkerAnomalyModDataContent(mobase.ModDataContent):
             ),
         ]
 
-    def walkContent(
-        self, path: str, entry: mobase.FileTreeEntry
-    ) -> mobase.IFileTree.WalkReturn:
-        name = entry.name().lower()
-        if entry.isFile():
-            ext = entry.suffix().lower()
-            if ext in ["dds", "thm"]:
-                self.content.append(Content.TEXTURE)
-                if path.startswith("gamedata/textures/ui"):
-                    self.content.append(Content.INTERFACE)
-            elif ext in ["omf", "ogf"]:
-                self.content.append(Content.MESH)
-            elif ext in ["script"]:
-                self.content.append(Content.SCRIPT)
-                if "_mcm" in name:
-                    self.content.append(Content.MCM)
-            elif ext in ["ogg"]:
-                self.content.append(Content.SOUND)
-            elif ext in ["ltx", "xml"]:
-                self.content.append(Content.CONFIG)
-                if path.startswith("gamedata/configs/ui"):
-                    self.content.append(Content.INTERFACE)
-
-        return mobase.IFileTree.WalkReturn.CONTINUE
-
     def getContentsFor(self, filetree: mobase.IFileTree) -> list[int]:
-        self.content = []
-        filetree.walk(self.walkContent, "/")
-        return self.content
-
-
-class StalkerAnomalySaveGame(BasicGameSaveGame):
+        summary = ModTreeSummary.of(filetree)
+        content: list[int] = []
+        if summary.count("dds") or summary.count("thm"):
+            content.append(Content.TEXTURE)
+        if summary.count("omf") or summary.count("ogf"):
+            content.append(Content.MESH)
+        if summary.count("script"):
+            content.append(Content.SCRIPT)
+        if summary.count("ogg"):
+            content.append(Content.SOUND)
+        if summary.count("ltx") or summary.count("xml"):
+            content.append(Content.CONFIG)
+        if any(
+            summary.count(extension, prefix)
+            for extension, prefix in (
+                ("dds", "gamedata/textures/ui"),
+                ("thm", "gamedata/textures/ui"),
+                ("ltx", "gamedata/configs/ui"),
+                ("xml", "gamedata/configs/ui"),
+            )
+        ):
+            content.append(Content.INTERFACE)
+        if any("_mcm" in name and name.endswith(".script") for name in summary.names):
+            content.append(Content.MCM)
+        return content
+
+
+@cached_save_metadata("stalkeranomaly")
+def read_xr_save_metadata(filepath: Path) -> dict[str, Any]:
+    xr_save = XRSave(filepath)
+    player = getattr(xr_save, "player", None)
+    return {
+        "save_fmt": xr_save.save_fmt,
+        "time_fmt": xr_save.time_fmt,
+        "player": {
+            "name": player.character_name_str,
+            "faction": xr_save.getFaction(),
+            "health": player.health,
+            "money": player.money,
+            "rank": player.rank,
+            "rank_name": xr_save.getRank(),
+            "reputation": player.reputation,
+            "reputation_name": xr_save.getReputation(),
+        }
+        if player
+        else None,
+    }
+
+
+class StalkerAnomalySaveGame(LazyBasicGameSaveGame):
     _filepath: Path
 
-    xr_save: XRSave
-
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self._filepath = filepath
-        self.xr_save = XRSave(self._filepath)
+    def parse(self) -> dict[str, Any]:
+        return read_xr_save_metadata(self._filepath)
 
     def getName(self) -> str:
-        xr_save = self.xr_save
-        player = xr_save.player
+        metadata = self.metadata
+        player = metadata.get("player")
         if player:
-            name = player.character_name_str
-            time = xr_save.time_fmt
-            return f"{name}, {xr_save.save_fmt} [{time}]"
+            name = player["name"]
+            time = metadata["time_fmt"]
+            return f"{name}, {metadata['save_fmt']} [{time}]"
         return ""
 
     def allFiles(self) -> list[str]:
@@ -192,17 +211,17 @@ class StalkerAnomalySaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         self.resize(240, 32)
         if not isinstance(save, StalkerAnomalySaveGame):
             return
-        xr_save = save.xr_save
-        player = xr_save.player
+        metadata = save.metadata
+        player = metadata.get("player")
         if player:
-            self._labelSave.setText(f"Save: {xr_save.save_fmt}")
-            self._labelName.setText(f"Name: {player.character_name_str}")
-            self._labelFaction.setText(f"Faction: {xr_save.getFaction()}")
-            self._labelHealth.setText(f"Health: {player.health:.2f}%")
-            self._labelMoney.setText(f"Money: {player.money} RU")
-            self._labelRank.setText(f"Rank: {xr_save.getRank()} ({player.rank})")
+            self._labelSave.setText(f"Save: {metadata['save_fmt']}")
+            self._labelName.setText(f"Name: {player['name']}")
+            self._labelFaction.setText(f"Faction: {player['faction']}")
+            self._labelHealth.setText(f"Health: {player['health']:.2f}%")
+            self._labelMoney.setText(f"Money: {player['money']} RU")
+            self._labelRank.setText(f"Rank: {player['rank_name']} ({player['rank']})")
             self._labelRep.setText(
-                f"Reputation: {xr_save.getReputation()} ({player.reputation})"
+                f"Reputation: {player['reputation_name']} ({player['reputation']})"
             )
 
 
@@ -231,6 +250,7 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
 
     GameSaveExtension = "scop"
     GameSavesDirectory = "%GAME_DOCUMENTS%/savedgames"
+    GameSaveParseWorkers = 0
 
     def __init__(self):
         BasicGame.__init__(self)
@@ -277,10 +297,12 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
         ext = self._mappings.savegameExtension.get()
-        return [
-            StalkerAnomalySaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        return self.parse_saves(
+            [
+                StalkerAnomalySaveGame(path, stat)
+                for path, stat in scan_saves(folder.absolutePath(), f"*.{ext}")
+            ]
+        )
 
     def mappings(self) -> list[mobase.Mapping]:
         appdata = self.gameDirectory().filePath("appdata")
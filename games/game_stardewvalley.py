@@ -1,6 +1,7 @@
 import mobase
 from PyQt6.QtCore import QFileInfo
 
+from ..basic_features import cached_check
 from ..basic_game import BasicGame
 
 
@@ -8,6 +9,7 @@ class StardewValleyModDataChecker(mobase.ModDataChecker):
     def __init__(self):
         super().__init__()
 
+    @cached_check(depth=2)
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
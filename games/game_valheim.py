@@ -11,7 +11,12 @@ from typing import Any, Optional, TextIO
 import mobase
 from PyQt6.QtCore import QDir
 
-from ..basic_features import BasicLocalSavegames, BasicModDataChecker, GlobPatterns
+from ..basic_features import (
+    BasicLocalSavegames,
+    BasicModDataChecker,
+    GlobPatterns,
+    iter_saves,
+)
 from ..basic_features.basic_save_game_info import BasicGameSaveGame
 from ..basic_game import BasicGame
 
@@ -286,6 +291,65 @@ class ValheimWorldSaveGame(ValheimSaveGame):
         return files
 
 
+class ValheimModDataChecker(BasicModDataChecker):
+    def __init__(self):
+        super().__init__(
+            GlobPatterns(
+                unfold=[
+                    "BepInExPack_Valheim",
+                ],
+                valid=[
+                    "meta.ini",  # Included in installed mod folder.
+                    "BepInEx",
+                    "doorstop_libs",
+                    "unstripped_corlib",
+                    "doorstop_config.ini",
+                    "start_game_bepinex.sh",
+                    "start_server_bepinex.sh",
+                    "winhttp.dll",
+                    "changelog.txt",
+                    #
+                    "InSlimVML",
+                    "valheim_Data",
+                    "inslimvml.ini",
+                    #
+                    "unstripped_managed",
+                    #
+                    "AdvancedBuilder",
+                ],
+                delete=[
+                    "*.txt",
+                    "*.md",
+                    "README",
+                    "icon.png",
+                    "license",
+                    "manifest.json",
+                    "*.dll.mdb",
+                    "*.pdb",
+                ],
+                move={
+                    "*_VML.dll": "InSlimVML/Mods/",
+                    #
+                    "plugins": "BepInEx/",
+                    "Jotunn": "BepInEx/plugins/",
+                    "*.dll": "BepInEx/plugins/",
+                    "*.xml": "BepInEx/plugins/",
+                    "Translations": "BepInEx/plugins/",
+                    "config": "BepInEx/",
+                    "*.cfg": "BepInEx/config/",
+                    #
+                    "CustomTextures": "BepInEx/plugins/",
+                    "*.png": "BepInEx/plugins/CustomTextures/",
+                    #
+                    "Builds": "AdvancedBuilder/",
+                    "*.vbuild": "AdvancedBuilder/Builds/",
+                    #
+                    "*.assets": "valheim_Data/",
+                },
+            )
+        )
+
+
 class ValheimGame(BasicGame):
     Name = "Valheim Support Plugin"
     Author = "Zash"
@@ -301,68 +365,13 @@ class ValheimGame(BasicGame):
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Valheim"
     )
+    GameMaxListedSaves = 0
 
     _forced_libraries = ["winhttp.dll"]
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        self._register_feature(
-            BasicModDataChecker(
-                GlobPatterns(
-                    unfold=[
-                        "BepInExPack_Valheim",
-                    ],
-                    valid=[
-                        "meta.ini",  # Included in installed mod folder.
-                        "BepInEx",
-                        "doorstop_libs",
-                        "unstripped_corlib",
-                        "doorstop_config.ini",
-                        "start_game_bepinex.sh",
-                        "start_server_bepinex.sh",
-                        "winhttp.dll",
-                        "changelog.txt",
-                        #
-                        "InSlimVML",
-                        "valheim_Data",
-                        "inslimvml.ini",
-                        #
-                        "unstripped_managed",
-                        #
-                        "AdvancedBuilder",
-                    ],
-                    delete=[
-                        "*.txt",
-                        "*.md",
-                        "README",
-                        "icon.png",
-                        "license",
-                        "manifest.json",
-                        "*.dll.mdb",
-                        "*.pdb",
-                    ],
-                    move={
-                        "*_VML.dll": "InSlimVML/Mods/",
-                        #
-                        "plugins": "BepInEx/",
-                        "Jotunn": "BepInEx/plugins/",
-                        "*.dll": "BepInEx/plugins/",
-                        "*.xml": "BepInEx/plugins/",
-                        "Translations": "BepInEx/plugins/",
-                        "config": "BepInEx/",
-                        "*.cfg": "BepInEx/config/",
-                        #
-                        "CustomTextures": "BepInEx/plugins/",
-                        "*.png": "BepInEx/plugins/CustomTextures/",
-                        #
-                        "Builds": "AdvancedBuilder/",
-                        "*.vbuild": "AdvancedBuilder/Builds/",
-                        #
-                        "*.assets": "valheim_Data/",
-                    },
-                )
-            )
-        )
+        self._register_feature(ValheimModDataChecker())
         self._register_feature(BasicLocalSavegames(self.savesDirectory()))
         self._overwrite_sync = OverwriteSync(organizer=self._organizer, game=self)
         self._register_event_handler()
@@ -375,10 +384,22 @@ class ValheimGame(BasicGame):
         ]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        save_games = super().listSaves(folder)
         path = Path(folder.absolutePath())
-        save_games.extend(ValheimSaveGame(f) for f in path.glob("characters/*.fch"))
-        save_games.extend(ValheimWorldSaveGame(f) for f in path.glob("worlds/*.fwl"))
+        ext = self._mappings.savegameExtension.get()
+        save_games: list[mobase.ISaveGame] = []
+        for f, stat in self.limit_saves(
+            itertools.chain(
+                iter_saves(path, f"*.{ext}", max_depth=None, dirs=True),
+                iter_saves(path.joinpath("characters"), "*.fch"),
+                iter_saves(path.joinpath("worlds"), "*.fwl"),
+            )
+        ):
+            if f.parent == path / "characters" and f.suffix.lower() == ".fch":
+                save_games.append(ValheimSaveGame(f, stat))
+            elif f.parent == path / "worlds" and f.suffix.lower() == ".fwl":
+                save_games.append(ValheimWorldSaveGame(f, stat))
+            else:
+                save_games.append(BasicGameSaveGame(f, stat))
         return save_games
 
     def settings(self) -> list[mobase.PluginSetting]:
@@ -4,7 +4,7 @@ from typing import List
 import mobase
 from PyQt6.QtCore import QDir
 
-from ..basic_features import BasicLocalSavegames
+from ..basic_features import BasicLocalSavegames, cached_check
 from ..basic_game import BasicGame, BasicGameSaveGame
 
 
@@ -28,6 +28,7 @@ class VampireModDataChecker(mobase.ModDataChecker):
             "vdata",
         ]
 
+    @cached_check()
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -1,17 +1,21 @@
 from pathlib import Path
-from typing import BinaryIO, List
+from typing import Any, BinaryIO, List
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo
 
-from ..basic_game import BasicGame, BasicGameSaveGame
+from ..basic_features import cached_save_metadata, scan_saves
+from ..basic_features.basic_save_game_info import LazyBasicGameSaveGame
+from ..basic_game import BasicGame
 
 
-class Witcher1SaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self.areaName: str = ""
-        self.parseSaveFile(filepath)
+class Witcher1SaveGame(LazyBasicGameSaveGame):
+    def parse(self) -> dict[str, Any]:
+        return self.readSaveMetadata(self._filepath)
+
+    @property
+    def areaName(self) -> str:
+        return self.metadata.get("areaName", "")
 
     @staticmethod
     def readInt(fp: BinaryIO, length: int = 4) -> int:
@@ -23,14 +27,16 @@ class Witcher1SaveGame(BasicGameSaveGame):
         res = b.decode("utf-16")
         return res.rstrip("\0")
 
-    def parseSaveFile(self, filepath: Path):
+    @staticmethod
+    @cached_save_metadata("witcher1")
+    def readSaveMetadata(filepath: Path) -> dict[str, Any]:
         # https://github.com/xoreos/xoreos/blob/82bd991052732ab1f8f75f512b3dfabfcc92ae8f/src/aurora/thewitchersavefile.cpp#L60
         with filepath.open(mode="rb") as fp:
             magic = fp.read(4)
             if magic != b"RGMH":
                 raise ValueError("Invalid TheWitcherSave file!")
 
-            version = self.readInt(fp)
+            version = Witcher1SaveGame.readInt(fp)
             if version != 1:
                 raise ValueError("Invalid TheWitcherSave file!")
 
@@ -40,20 +46,20 @@ class Witcher1SaveGame(BasicGameSaveGame):
             fp.seek(8, 1)
             fp.seek(4 * 4, 1)
 
-            lightningStorm = self.readFixedString(fp, 2048)
+            lightningStorm = Witcher1SaveGame.readFixedString(fp, 2048)
             if lightningStorm != "Lightning Storm":
                 raise ValueError('Missing "Lightning Storm"')
 
-            areaName1 = self.readFixedString(fp, 2048)
-            areaName2 = self.readFixedString(fp, 2048)
+            areaName1 = Witcher1SaveGame.readFixedString(fp, 2048)
+            areaName2 = Witcher1SaveGame.readFixedString(fp, 2048)
 
             if areaName1 != areaName2:
                 raise ValueError("Invalid Area Name!")
 
-            self.areaName = areaName1
+            return {"areaName": areaName1}
 
     def getName(self) -> str:
-        return self.areaName
+        return self.areaName or super().getName()
 
 
 class Witcher1Game(BasicGame):
@@ -72,6 +78,7 @@ class Witcher1Game(BasicGame):
     GameSaveExtension = "TheWitcherSave"
     GameDocumentsDirectory = "%DOCUMENTS%/The Witcher"
     GameSavesDirectory = "%GAME_DOCUMENTS%/saves"
+    GameSaveParseWorkers = 0
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-The-Witcher"
@@ -86,7 +93,9 @@ class Witcher1Game(BasicGame):
         return [mobase.ExecutableInfo("The Witcher", path)]
 
     def listSaves(self, folder: QDir) -> List[mobase.ISaveGame]:
-        return [
-            Witcher1SaveGame(path)
-            for path in Path(folder.absolutePath()).glob("*.TheWitcherSave")
-        ]
+        return self.parse_saves(
+            [
+                Witcher1SaveGame(path, stat)
+                for path, stat in scan_saves(folder.absolutePath(), "*.TheWitcherSave")
+            ]
+        )
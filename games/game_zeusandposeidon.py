@@ -2,6 +2,7 @@ from typing import List, Optional
 
 import mobase
 
+from ..basic_features import cached_check
 from ..basic_game import BasicGame
 
 
@@ -9,6 +10,7 @@ class ZeusAndPoseidonModDataChecker(mobase.ModDataChecker):
     def __init__(self):
         super().__init__()
 
+    @cached_check(depth=2)
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
@@ -2,15 +2,181 @@
 
 # Heavily influenced by https://github.com/erri120/GameFinder
 
+from __future__ import annotations
+
 import os
 import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Collection, Iterator, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib import parse
 
 import psutil
 
+if TYPE_CHECKING:
+    from .file_cache import FileCacheSection
+
+
+# Time (in seconds) given to Origin and the game to launch:
+_LAUNCH_TIMEOUT = 300.0
+
+# Time (in seconds) to wait for the game to come back after its processes exited,
+# before killing Origin:
+_EXIT_GRACE_PERIOD = 5.0
+
+# Bounds of the interval (in seconds) between two scans of the process table while
+# looking for the game processes:
+_MIN_SCAN_INTERVAL = 1.0
+_MAX_SCAN_INTERVAL = 10.0
+
+# Maximum time (in seconds) the watcher thread waits before checking for new or
+# cancelled watches:
+_MAX_WAIT = 1.0
+
+
+def _kill_origin() -> None:
+    for proc in psutil.process_iter(attrs=["name"]):
+        if (proc.info["name"] or "").lower() == "origin.exe":
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+
+
+def _find_processes(executables: Collection[str]) -> list[psutil.Process]:
+    return [
+        proc
+        for proc in psutil.process_iter(attrs=["name"])
+        if (proc.info["name"] or "").lower() in executables
+    ]
+
+
+class _OriginWatch:
+    """Watch of the processes of a game, see `_OriginWatcherService`."""
+
+    def __init__(self, executables: Collection[str]):
+        now = time.monotonic()
+        self.executables = executables
+        self.active = True
+
+        # Processes of the game, resolved by scanning the process table:
+        self.processes: list[psutil.Process] = []
+
+        # Origin is killed if no process of the game is found before this deadline:
+        self.deadline = now + _LAUNCH_TIMEOUT
+
+        # Next scan of the process table, and interval to the following one:
+        self.next_scan = now
+        self.scan_interval = _MIN_SCAN_INTERVAL
+
+
+class _OriginWatcherService:
+    """
+    Single thread watching the games launched through Origin, for all the plugins.
+
+    The processes of a game are found by scanning the process table (with an
+    increasing interval) until they show up, and the thread then simply waits for
+    these processes to exit. Once they have exited, Origin is killed if the game
+    does not come back within a grace period.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._watches: list[_OriginWatch] = []
+        self._thread: threading.Thread | None = None
+
+    def watch(self, executables: Collection[str]) -> _OriginWatch:
+        """
+        Start watching the given game executables.
+
+        Args:
+            executables: Lower-case names of the game executables.
+
+        Returns:
+            The new watch, to give to `cancel()`.
+        """
+        watch = _OriginWatch(executables)
+        with self._lock:
+            self._watches.append(watch)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="basic_games_origin_watcher", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+        return watch
+
+    def cancel(self, watch: _OriginWatch) -> None:
+        """
+        Stop a watch, without killing Origin.
+
+        Args:
+            watch: The watch to stop.
+        """
+        self._remove(watch)
+        self._wakeup.set()
+
+    def _remove(self, watch: _OriginWatch) -> None:
+        with self._lock:
+            watch.active = False
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                watches = list(self._watches)
+                if not watches:
+                    self._thread = None
+                    return
+
+            now = time.monotonic()
+            timeout = _MAX_WAIT
+            processes: list[psutil.Process] = []
+            for watch in watches:
+                if not watch.processes and now >= watch.next_scan:
+                    watch.processes = _find_processes(watch.executables)
+                    if watch.processes:
+                        watch.scan_interval = _MIN_SCAN_INTERVAL
+                    else:
+                        watch.next_scan = now + watch.scan_interval
+                        watch.scan_interval = min(
+                            watch.scan_interval * 2, _MAX_SCAN_INTERVAL
+                        )
+
+                if watch.processes:
+                    processes.extend(watch.processes)
+                elif now >= watch.deadline:
+                    if watch.active:
+                        _kill_origin()
+                    self._remove(watch)
+                else:
+                    timeout = min(timeout, watch.next_scan - now, watch.deadline - now)
+
+            if not processes:
+                self._wakeup.wait(max(timeout, 0.0))
+                self._wakeup.clear()
+                continue
+
+            gone, _ = psutil.wait_procs(processes, timeout=max(timeout, 0.0))
+            if not gone:
+                continue
+
+            now = time.monotonic()
+            for watch in watches:
+                if not watch.processes:
+                    continue
+                watch.processes = [proc for proc in watch.processes if proc not in gone]
+                if not watch.processes:
+                    # the game may be restarting, e.g., a launcher starting the game:
+                    watch.deadline = now + _EXIT_GRACE_PERIOD
+                    watch.next_scan = now + _MIN_SCAN_INTERVAL
+
+
+_service = _OriginWatcherService()
+
 
 class OriginWatcher:
     """
@@ -18,54 +184,116 @@ class OriginWatcher:
     order to hook and unhook Origin to get around the Origin DRM. Support
     for launching Origin is not included as it's intended for the game's
     DRM to launch Origin as needed.
+
+    The games are watched by a single thread shared by all the watchers.
     """
 
     def __init__(self, executables: Sequence[str] = []):
         self.executables = list(map(lambda s: s.lower(), executables))
+        self._watch: _OriginWatch | None = None
 
     def spawn_origin_watcher(self) -> bool:
         self.kill_origin()
-        self.worker_alive = True
-        self.worker = threading.Thread(target=self._workerFunc)
-        self.worker.start()
+        self.stop_origin_watcher()
+        self._watch = _service.watch(frozenset(self.executables))
         return True
 
     def stop_origin_watcher(self) -> None:
-        self.worker_alive = False
-        self.worker.join(10.0)
+        if self._watch is not None:
+            _service.cancel(self._watch)
+            self._watch = None
 
     def kill_origin(self) -> None:
         """
         Kills the Origin application
         """
-        for proc in psutil.process_iter():
-            if proc.name().lower() == "origin.exe":
-                proc.kill()
+        _kill_origin()
+
+
+# Depth of the folders containing the manifests, below LocalContent:
+MANIFEST_MAX_DEPTH = 2
+
+
+def _query_values(query: str, name: str) -> list[str]:
+    """
+    Extract the (decoded, non-empty) values of a parameter from a query string,
+    as `urllib.parse.parse_qs` would.
+    """
+    values: list[str] = []
+    prefix = name + "="
+    start = query.find(prefix)
+    while start != -1:
+        if start == 0 or query[start - 1] == "&":
+            end = query.find("&", start)
+            if end == -1:
+                end = len(query)
+            value = query[start + len(prefix) : end]
+            if value:
+                values.append(parse.unquote_plus(value))
+            start = query.find(prefix, end)
+        else:
+            start = query.find(prefix, start + len(prefix))
+    return values
+
+
+def read_manifest(manifest: Path | str) -> list[list[str]]:
+    """
+    Read the game IDs and install location from an Origin manifest.
 
-    def _workerFunc(self) -> None:
-        gameAliveCount = 300  # Large number to allow Origin and the game to launch
-        while self.worker_alive:
-            gameAlive = False
-            # See if the game is still alive
-            for proc in psutil.process_iter():
-                if proc.name().lower() in self.executables:
-                    gameAlive = True
-                    break
-            if gameAlive:
-                # Game is alive, sleep and keep monitoring at faster pace
-                gameAliveCount = 5
-            else:
-                gameAliveCount -= 1
-                if gameAliveCount <= 0:
-                    self.kill_origin()
-                    self.worker_alive = False
-            time.sleep(1)
-
-
-def find_games() -> dict[str, Path]:
+    Returns:
+        A list of `[id, install_path]` pairs, empty if the manifest does not
+        contain any ID or install path.
+    """
+    # Read the file and look for &id= and &dipinstallpath= in the query:
+    with open(manifest, "r") as f:
+        content = f.read()
+    query = content.partition("?")[2].partition("#")[0]
+
+    ids = _query_values(query, "id")
+    if not ids:
+        # If id is not present, we have no clue what to do.
+        return []
+    paths = _query_values(query, "dipinstallpath")
+    if not paths:
+        # We could query the Origin server for the install location but... no?
+        return []
+
+    return [[id_, path_] for id_ in ids for path_ in paths]
+
+
+def find_manifests(folder: str, max_depth: int = MANIFEST_MAX_DEPTH) -> Iterator[str]:
+    """
+    Find the Origin manifests in the given folder, skipping '@steam' manifests.
+
+    Args:
+        folder: Folder to look into, typically the Origin LocalContent folder.
+        max_depth: Maximum depth of the folders to look into, below the given one.
+
+    Returns:
+        An iterator over the path to the manifests.
+    """
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name.endswith(".mfst"):
+                    if "@steam" not in name and entry.is_file():
+                        yield entry.path
+                elif max_depth > 0 and entry.is_dir():
+                    yield from find_manifests(entry.path, max_depth - 1)
+    except OSError:
+        return
+
+
+def find_games(cache: FileCacheSection | None = None) -> dict[str, Path]:
     """
     Find the list of Origin games installed.
 
+    Args:
+        cache: Cache for the Origin manifests. Only manifests that changed since
+            they were cached are parsed. The cache is committed once all manifests
+            have been read.
+
     Returns:
         A mapping from Origin manifest IDs to install locations for available
         Origin games.
@@ -73,27 +301,18 @@ def find_games() -> dict[str, Path]:
     games: dict[str, Path] = {}
 
     program_data_path = os.path.expandvars("%PROGRAMDATA%")
-    local_content_path = Path(program_data_path).joinpath("Origin", "LocalContent")
-    for manifest in local_content_path.glob("**/*.mfst"):
-        # Skip any manifest file with '@steam'
-        if "@steam" in manifest.name.lower():
-            continue
-
-        # Read the file and look for &id= and &dipinstallpath=
-        with open(manifest, "r") as f:
-            manifest_query = f.read()
-        url = parse.urlparse(manifest_query)
-        query = parse.parse_qs(url.query)
-        if "id" not in query:
-            # If id is not present, we have no clue what to do.
-            continue
-        if "dipinstallpath" not in query:
-            # We could query the Origin server for the install location but... no?
-            continue
-
-        for id_ in query["id"]:
-            for path_ in query["dipinstallpath"]:
-                games[id_] = Path(path_)
+    local_content_path = os.path.join(program_data_path, "Origin", "LocalContent")
+    for manifest in find_manifests(local_content_path):
+        if cache is None:
+            entries = read_manifest(manifest)
+        else:
+            entries = cache.lookup(Path(manifest), read_manifest)
+
+        for id_, path_ in entries:
+            games[id_] = Path(path_)
+
+    if cache is not None:
+        cache.commit()
 
     return games
 
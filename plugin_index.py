@@ -0,0 +1,255 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+import ast
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .file_cache import FileCacheSection
+
+# Version of the index entries, bump when the analysis below changes:
+INDEX_VERSION = 3
+
+# Class attributes read by BasicGame to implement the plugin metadata:
+GAME_ATTRIBUTES = frozenset(
+    {
+        "Name",
+        "Author",
+        "Version",
+        "Description",
+        "GameName",
+        "GameShortName",
+        "GameNexusName",
+        "GameValidShortNames",
+        "GameNexusId",
+        "GameBinary",
+        "GameLauncher",
+        "GameDataPath",
+        "GameDocumentsDirectory",
+        "GameIniFiles",
+        "GameSavesDirectory",
+        "GameSaveExtension",
+        "GameSteamId",
+        "GameGogId",
+        "GameOriginManifestIds",
+        "GameOriginWatcherExecutables",
+        "GameEpicId",
+        "GameEaDesktopId",
+        "GameSupportURL",
+    }
+)
+
+# Other class attributes read by BasicGame, a plugin overriding one of these with a
+# value that cannot be indexed has to be imported eagerly:
+BASIC_GAME_CONSTANTS = frozenset({"GameSaveParseWorkers", "GameMaxListedSaves"})
+
+# Methods answered by a lazy plugin without importing its module, a plugin
+# overriding one of these has to be imported eagerly:
+METADATA_METHODS = frozenset(
+    {
+        "__init__",
+        "_register_feature",
+        "_store_mapping",
+        "store_ids",
+        "is_steam",
+        "is_gog",
+        "is_origin",
+        "is_epic",
+        "is_eadesktop",
+        "name",
+        "author",
+        "description",
+        "version",
+        "isActive",
+        "detectGame",
+        "gameName",
+        "gameShortName",
+        "validShortNames",
+        "gameNexusName",
+        "nexusModOrganizerID",
+        "nexusGameID",
+        "steamAPPId",
+        "gogAPPId",
+        "epicAPPId",
+        "eaDesktopContentId",
+        "binaryName",
+        "isInstalled",
+        "gameDirectory",
+        "setGamePath",
+    }
+)
+
+
+class _NotIndexable(Exception):
+    pass
+
+
+def _literal(node: ast.expr) -> Any:
+    # only JSON values are kept, so that entries can be cached:
+    try:
+        value = ast.literal_eval(node)
+    except ValueError as e:
+        raise _NotIndexable() from e
+
+    if isinstance(value, tuple):
+        value = list(value)  # type: ignore
+    if isinstance(value, list):
+        items: list[Any] = value  # type: ignore
+        if all(isinstance(x, (str, int)) for x in items):
+            return items
+    elif isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+
+    raise _NotIndexable()
+
+
+def _is_basic_game(node: ast.expr) -> bool:
+    return isinstance(node, ast.Name) and node.id == "BasicGame"
+
+
+def _read_class(node: ast.ClassDef) -> dict[str, Any]:
+    if node.decorator_list or node.keywords or len(node.bases) != 1:
+        raise _NotIndexable()
+
+    attributes: dict[str, Any] = {}
+    methods: list[str] = []
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef):
+            if item.decorator_list or item.name in METADATA_METHODS:
+                raise _NotIndexable()
+
+            # the plugin object registered in MO2 is the proxy, not the plugin:
+            for child in ast.walk(item):
+                if isinstance(child, ast.Compare) and any(
+                    isinstance(op, (ast.Is, ast.IsNot)) for op in child.ops
+                ):
+                    raise _NotIndexable()
+
+            methods.append(item.name)
+        elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+            targets = item.targets if isinstance(item, ast.Assign) else [item.target]
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    raise _NotIndexable()
+
+                # every literal is copied to the proxy, other values are only
+                # available to the methods of the plugin:
+                required = (
+                    target.id in GAME_ATTRIBUTES
+                    or target.id in BASIC_GAME_CONSTANTS
+                    or target.id == "_fromName"
+                )
+                if item.value is None:
+                    if required:
+                        raise _NotIndexable()
+                    continue
+                try:
+                    attributes[target.id] = _literal(item.value)
+                except _NotIndexable:
+                    if required:
+                        raise
+        elif isinstance(item, (ast.Expr, ast.Pass)):
+            pass
+        else:
+            raise _NotIndexable()
+
+    return {"class": node.name, "attributes": attributes, "methods": methods}
+
+
+def read_module_index(path: Path) -> list[dict[str, Any]] | None:
+    """
+    Statically extract the game plugins of a module from its source.
+
+    Args:
+        path: Path to the module.
+
+    Returns:
+        An entry for each game plugin (a direct subclass of `BasicGame`) of the module,
+        with the name of the class, its class attributes with literal values
+        (`GameName`, `GameSteamId`, `GameSaveParseWorkers`, ...) and the methods it
+        defines, or None if the module cannot be indexed and has to be imported to
+        find its plugins.
+    """
+    try:
+        with open(path, "rb") as fp:
+            module = ast.parse(fp.read(), str(path))
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"Unable to index {path}: {e}", file=sys.stderr)
+        return None
+
+    entries: list[dict[str, Any]] = []
+    game_classes: set[str] = set()
+    try:
+        for node in module.body:
+            # plugins imported from other game modules:
+            if isinstance(node, ast.ImportFrom) and node.level == 1:
+                if node.module is None or node.module.startswith("game_"):
+                    raise _NotIndexable()
+
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            for base in node.bases:
+                if (
+                    isinstance(base, ast.Attribute)
+                    and not (
+                        isinstance(base.value, ast.Name) and base.value.id == "mobase"
+                    )
+                ) or (isinstance(base, ast.Name) and base.id in game_classes):
+                    raise _NotIndexable()
+
+            if any(_is_basic_game(base) for base in node.bases):
+                game_classes.add(node.name)
+                entries.append(_read_class(node))
+    except _NotIndexable:
+        return None
+
+    return entries
+
+
+def build_index(
+    folder: Path, cache: FileCacheSection | None = None
+) -> dict[str, list[dict[str, Any]] | None]:
+    """
+    Index the game plugins of the `game_*.py` modules in the given folder.
+
+    Args:
+        folder: Folder containing the game modules.
+        cache: Cache for the module indexes. Only modules that changed since they
+            were cached are parsed. The cache is committed once all modules have been
+            indexed.
+
+    Returns:
+        A mapping from module file name to the entries of this module (see
+        `read_module_index`).
+    """
+    index: dict[str, list[dict[str, Any]] | None] = {}
+    for path in sorted(folder.glob("game_*.py")):
+        if cache is None:
+            index[path.name] = read_module_index(path)
+        else:
+            index[path.name] = cache.lookup(path, read_module_index)
+
+    if cache is not None:
+        cache.commit()
+
+    return index
+
+
+if __name__ == "__main__":
+    index = build_index(Path(__file__).parent.joinpath("games"))
+    for module, entries in index.items():
+        if entries is None:
+            print(f"{module}: imported eagerly")
+        else:
+            print(
+                "{}: {}".format(
+                    module,
+                    ", ".join(
+                        "{} ({} methods)".format(entry["class"], len(entry["methods"]))
+                        for entry in entries
+                    ),
+                )
+            )
@@ -1,12 +1,19 @@
 # Code greatly inspired by https://github.com/LostDragonist/steam-library-setup-tool
 
+from __future__ import annotations
+
+import re
 import sys
 import winreg
+from collections.abc import Collection
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, NotRequired, TextIO, TypedDict, cast
 
 import vdf  # pyright: ignore[reportMissingTypeStubs]
 
+if TYPE_CHECKING:
+    from .file_cache import FileCacheSection
+
 
 class SteamGame:
     def __init__(self, appid: str, installdir: str):
@@ -31,6 +38,7 @@ class _AppManifest(TypedDict):
 
 class _LibraryFolder(TypedDict):
     path: str
+    apps: NotRequired[dict[str, str]]
 
 
 class _LibraryFolders(TypedDict, total=False):
@@ -38,40 +46,148 @@ class _LibraryFolders(TypedDict, total=False):
     LibraryFolders: dict[str, str]
 
 
+# "key" "value" and "key" lines from VDF files:
+_VDF_KEY_VALUE = re.compile(r'"((?:[^"\\]|\\.)*)"\s+"((?:[^"\\]|\\.)*)"')
+_VDF_KEY = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def read_app_state(fp: TextIO) -> _AppState | None:
+    """
+    Read the application ID and installation folder from an application manifest,
+    without parsing the whole file.
+
+    Only the top-level scalar values of the `AppState` block are considered, and
+    reading stops as soon as both values are found. This only handles the common
+    layout of manifests written by Steam.
+
+    Args:
+        fp: Application manifest (`appmanifest_*.acf`) opened in text mode.
+
+    Returns:
+        The application state with only the `appid` and `installdir` keys, or None
+        if the manifest does not have the expected layout, in which case it should
+        be parsed with `vdf.load` instead.
+    """
+    app_state: dict[str, str] = {}
+    header = False
+    opened = False
+    depth = 0
+
+    for line in fp:
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+
+        if not opened:
+            if not header and line == '"AppState"':
+                header = True
+            elif header and line == "{":
+                opened = True
+                depth = 1
+            else:
+                return None
+            continue
+
+        if line == "{":
+            depth += 1
+        elif line == "}":
+            depth -= 1
+            if depth == 0:
+                return None
+        elif depth == 1:
+            if match := _VDF_KEY_VALUE.fullmatch(line):
+                key, value = match.groups()
+                if key in ("appid", "installdir"):
+                    if "\\" in value:
+                        # escape sequences are left to vdf
+                        return None
+                    app_state[key] = value
+                    if len(app_state) == 2:
+                        return cast(_AppState, app_state)
+            elif not _VDF_KEY.fullmatch(line):
+                return None
+        elif not (_VDF_KEY_VALUE.fullmatch(line) or _VDF_KEY.fullmatch(line)):
+            return None
+
+    return None
+
+
+def _read_app_manifest(filepath: Path) -> list[str] | None:
+    """
+    Read the application ID and installation folder from an application manifest.
+
+    Args:
+        filepath: Path to the `appmanifest_*.acf` file.
+
+    Returns:
+        A `[appid, installdir]` list, or None if the manifest could not be read.
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as fp:
+            app_state = read_app_state(fp)
+            if app_state is None:
+                fp.seek(0)
+                info = cast(
+                    _AppManifest,
+                    vdf.load(fp),  # pyright: ignore[reportUnknownMemberType]
+                )
+                app_state = info["AppState"]
+    except KeyError:
+        print(
+            f'Unable to read application state from "{filepath}"',
+            file=sys.stderr,
+        )
+        return None
+    except Exception as e:
+        print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
+        return None
+
+    try:
+        return [app_state["appid"], app_state["installdir"]]
+    except KeyError:
+        print(
+            f"Unable to read application ID or installation folder "
+            f'from "{filepath}"',
+            file=sys.stderr,
+        )
+        return None
+
+
 class LibraryFolder:
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        cache: FileCacheSection | None = None,
+        app_ids: Collection[str] | None = None,
+    ):
+        """
+        Args:
+            path: Path to the library.
+            cache: Cache for the application manifests, if any.
+            app_ids: If not None, only read the manifests of these applications
+                instead of all the manifests in the library.
+        """
         self.path = path
 
+        steamapps_path = path.joinpath("steamapps")
+        if app_ids is None:
+            manifests = steamapps_path.glob("appmanifest_*.acf")
+        else:
+            manifests = (
+                manifest
+                for app_id in app_ids
+                if (manifest := steamapps_path / f"appmanifest_{app_id}.acf").is_file()
+            )
+
         self.games: list[SteamGame] = []
-        for filepath in path.joinpath("steamapps").glob("appmanifest_*.acf"):
-            try:
-                with open(filepath, "r", encoding="utf-8") as fp:
-                    info = cast(
-                        _AppManifest,
-                        vdf.load(fp),  # pyright: ignore[reportUnknownMemberType]
-                    )
-                    app_state = info["AppState"]
-            except KeyError:
-                print(
-                    f'Unable to read application state from "{filepath}"',
-                    file=sys.stderr,
-                )
-                continue
-            except Exception as e:
-                print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
-                continue
-
-            try:
-                app_id = app_state["appid"]
-                install_dir = app_state["installdir"]
-                self.games.append(SteamGame(app_id, install_dir))
-            except KeyError:
-                print(
-                    f"Unable to read application ID or installation folder "
-                    f'from "{filepath}"',
-                    file=sys.stderr,
-                )
-                continue
+        for filepath in manifests:
+            if cache is None:
+                app = _read_app_manifest(filepath)
+            else:
+                app = cache.lookup(filepath, _read_app_manifest)
+
+            if app is not None:
+                self.games.append(SteamGame(*app))
 
     def __repr__(self):
         return str(self)
@@ -80,13 +196,21 @@ class LibraryFolder:
         return "LibraryFolder at {}: {}".format(self.path, self.games)
 
 
-def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
+def parse_library_info(
+    library_vdf_path: Path,
+    cache: FileCacheSection | None = None,
+    app_ids: Collection[str] | None = None,
+) -> list[LibraryFolder]:
     """
     Read library folders from the main library file.
 
     Args:
         library_vdf_path: The main library file (from the Steam installation
             folder).
+        cache: Cache for the application manifests, if any.
+        app_ids: If not None, only look for these applications. When the library
+            file lists the applications of each library (new format), only the
+            manifests of the listed applications are read.
 
     Returns:
         A list of LibraryFolder, for each library found.
@@ -120,13 +244,18 @@ def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
         except ValueError:
             continue
 
+        library_app_ids = app_ids
         if isinstance(value, str):
             path = value
         else:
             path = value["path"]
+            if app_ids is not None and "apps" in value:
+                library_app_ids = [
+                    app_id for app_id in app_ids if app_id in value["apps"]
+                ]
 
         try:
-            library_folders.append(LibraryFolder(Path(path)))
+            library_folders.append(LibraryFolder(Path(path), cache, library_app_ids))
         except Exception as e:
             print(
                 'Failed to read steam library from "{}", {}'.format(path, repr(e)),
@@ -151,10 +280,20 @@ def find_steam_path() -> Path | None:
         return None
 
 
-def find_games() -> dict[str, Path]:
+def find_games(
+    cache: FileCacheSection | None = None, app_ids: Collection[str] | None = None
+) -> dict[str, Path]:
     """
     Find the list of Steam games installed.
 
+    Args:
+        cache: Cache for the application manifests. Only manifests that changed
+            since they were cached are parsed. The cache is committed once all
+            libraries have been read.
+        app_ids: If not None, only look for these applications, reading only
+            their manifests (instead of the manifests of every installed
+            application).
+
     Returns:
         A mapping from Steam game ID to install locations for available
         Steam games.
@@ -166,8 +305,8 @@ def find_games() -> dict[str, Path]:
     library_vdf_path = steam_path.joinpath("steamapps", "libraryfolders.vdf")
 
     try:
-        library_folders = parse_library_info(library_vdf_path)
-        library_folders.append(LibraryFolder(steam_path))
+        library_folders = parse_library_info(library_vdf_path, cache, app_ids)
+        library_folders.append(LibraryFolder(steam_path, cache, app_ids))
     except FileNotFoundError:
         return {}
 
@@ -178,6 +317,9 @@ def find_games() -> dict[str, Path]:
                 "steamapps", "common", game.installdir
             )
 
+    if cache is not None:
+        cache.commit()
+
     return games
 
 
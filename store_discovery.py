@@ -0,0 +1,207 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+
+# Default time (in seconds) given to the store scanners, from the start of the
+# discovery, before giving up on them:
+DEFAULT_TIMEOUT = 30.0
+
+
+def normalize_path(path: Path | str) -> str:
+    """
+    Normalize a path for comparison: the path is made absolute, symbolic links are
+    resolved and the case is folded.
+
+    Args:
+        path: Path to normalize.
+
+    Returns:
+        The normalized path, as a string.
+    """
+    return os.path.normcase(os.path.realpath(path)).casefold()
+
+
+class StoreDiscovery:
+    """
+    Run the launcher scanners (Steam, GOG, Origin, ...) concurrently in the
+    background.
+
+    Each scanner is submitted to a thread pool when the discovery is created, and
+    its result can then be retrieved with `games()`, which only waits for the
+    requested store.
+
+    All the scanners share a single deadline, from the creation of the discovery, so
+    a scanner that hangs delays the callers once at most: after the deadline, the
+    result of a scanner is only returned if it has finished.
+    """
+
+    _futures: dict[str, Future[dict[str, Path]]]
+
+    # Time (in seconds) spent by each scanner that has finished:
+    _timings: dict[str, float]
+
+    # Reverse indexes, from normalized install location to IDs, built on demand:
+    _path_indexes: dict[str, dict[str, list[str]]]
+
+    def __init__(
+        self,
+        finders: Mapping[str, Callable[[], dict[str, Path]]],
+        timeout: float | None = DEFAULT_TIMEOUT,
+        on_done: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            finders: Mapping from store name to the function scanning this store,
+                e.g., `{"steam": steam_utils.find_games}`.
+            timeout: Time given to the scanners, in seconds from now, or None to
+                wait for them indefinitely.
+            on_done: Called (from a background thread) once all the scanners have
+                finished, even after the deadline.
+        """
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._timed_out: set[str] = set()
+        self._on_done = on_done
+        self._running = len(finders)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(finders), 1), thread_name_prefix="basic_games"
+        )
+        self._timings = {}
+        self._path_indexes = {}
+        self._lock = threading.Lock()
+        self._futures = {
+            store: self._executor.submit(self._run, store, finder)
+            for store, finder in finders.items()
+        }
+        self._executor.shutdown(wait=False)
+
+    def _run(
+        self, store: str, finder: Callable[[], dict[str, Path]]
+    ) -> dict[str, Path]:
+        start = time.perf_counter()
+        try:
+            return finder()
+        finally:
+            self._timings[store] = time.perf_counter() - start
+            with self._lock:
+                self._running -= 1
+                done = self._running == 0
+            if done and self._on_done is not None:
+                try:
+                    self._on_done()
+                except Exception as e:
+                    print(f"Failed to complete games discovery: {e}", file=sys.stderr)
+
+    def timings(self) -> dict[str, float]:
+        """
+        Returns:
+            The time (in seconds) spent by each scanner that has finished.
+        """
+        return dict(self._timings)
+
+    def stores(self) -> list[str]:
+        """
+        Returns:
+            The name of the stores handled by this discovery.
+        """
+        return list(self._futures)
+
+    def done(self, store: str) -> bool:
+        """
+        Check if the scanner for the given store has finished.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            True if the scanner is done (or if the store is unknown), False otherwise.
+        """
+        future = self._futures.get(store)
+        return future is None or future.done()
+
+    def future(self, store: str) -> Future[dict[str, Path]] | None:
+        """
+        Args:
+            store: Name of the store.
+
+        Returns:
+            The future holding the result of the scanner for the given store, or None
+            if the store is unknown.
+        """
+        return self._futures.get(store)
+
+    def games(self, store: str) -> dict[str, Path]:
+        """
+        Retrieve the games found for the given store, waiting for the scanner (until
+        the deadline of the discovery) if needed.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            A mapping from game ID to install location for the given store. The
+            mapping is empty if the store is unknown, if the scanner failed or if it
+            did not finish in time.
+        """
+        future = self._futures.get(store)
+        if future is None:
+            return {}
+
+        timeout = None
+        if self._deadline is not None:
+            timeout = max(self._deadline - time.monotonic(), 0.0)
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                first = store not in self._timed_out
+                self._timed_out.add(store)
+            if first:
+                print(
+                    f"Timeout while waiting for {store} games discovery.",
+                    file=sys.stderr,
+                )
+        except Exception as e:
+            print(f"Failed to discover {store} games: {e}", file=sys.stderr)
+
+        return {}
+
+    def path_index(self, store: str) -> dict[str, list[str]]:
+        """
+        Retrieve the reverse index of the games found for the given store, waiting
+        for the scanner (until the deadline of the discovery) if needed.
+
+        The index is built once, when the scanner result is first requested.
+
+        Args:
+            store: Name of the store.
+
+        Returns:
+            A mapping from normalized install location (see `normalize_path`) to the
+            IDs of the games installed there, in discovery order.
+        """
+        with self._lock:
+            if store in self._path_indexes:
+                return self._path_indexes[store]
+
+        future = self._futures.get(store)
+        games = self.games(store)
+
+        index: dict[str, list[str]] = {}
+        for game_id, path in games.items():
+            index.setdefault(normalize_path(path), []).append(game_id)
+
+        # do not keep the index of a scanner that is not done (timeout), so that it
+        # is built again with the actual result later on
+        if future is None or future.done():
+            with self._lock:
+                index = self._path_indexes.setdefault(store, index)
+
+        return index